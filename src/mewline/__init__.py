@@ -0,0 +1,10 @@
+import sys
+
+# Profiling has to start before anything else is imported to time the imports
+for _i, _arg in enumerate(sys.argv):
+    if _arg.startswith("--profile-startup"):
+        from mewline.utils.startup_profiler import profiler
+
+        _mode = _arg.partition("=")[2] or (sys.argv[_i + 1 : _i + 2] or [""])[0]
+        profiler.enable(cprofile=_mode == "cprofile")
+        break
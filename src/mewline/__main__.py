@@ -16,15 +16,18 @@ from mewline.config import load_config
 from mewline.utils.capture_output import start_output_capture
 from mewline.utils.glib_debug import enable_all_glib_debug
 from mewline.utils.setup_loguru import setup_loguru
+from mewline.utils.startup_profiler import profiler
 from mewline.utils.temporary_fixes import *  # noqa: F403
+from mewline.utils.theming import CssBuilder
 from mewline.utils.theming import copy_theme
 from mewline.utils.theming import process_and_apply_css
 from mewline.utils.window_manager import WindowManagerContext
 from mewline.utils.window_manager import create_monitor_manager
 from mewline.utils.window_manager import detect_window_manager
-from mewline.widgets import StatusBar
+from mewline.utils.window_rules import reload_window_rules
 from mewline.widgets.dynamic_island import DynamicIsland
 from mewline.widgets.osd import OSDContainer
+from mewline.widgets.outputs import OutputsManager
 from mewline.widgets.screen_corners import ScreenCorners
 
 ##==> Настраиваем loguru
@@ -165,7 +168,8 @@ def main(debug_mode=False):
 
     ##===> Detect and set window manager context
     ##############################
-    wm = detect_window_manager()
+    with profiler.span("detect_window_manager"):
+        wm = detect_window_manager()
     WindowManagerContext.set_wm(wm)
     logger.info(f"Window manager detected and context set to: {wm.value}")
 
@@ -175,39 +179,24 @@ def main(debug_mode=False):
     osd_widget = None
 
     if cfg.options.screen_corners:
-        widgets.append(ScreenCorners())
+        with profiler.span("ScreenCorners"):
+            widgets.append(ScreenCorners())
 
     if cfg.options.osd_enabled:
-        osd_widget = OSDContainer()
+        with profiler.span("OSDContainer"):
+            osd_widget = OSDContainer()
         widgets.append(osd_widget.window)
 
-    ##=> Multi-monitor: create one StatusBar + one DynamicIsland per output
+    ##=> Multi-monitor: one StatusBar + one DynamicIsland per output.
+    # The manager keeps its (monitor_id -> DynamicIsland) map in sync with
+    # monitor hot-plug, so the dispatcher below always routes open/close
+    # actions to the island that lives on the cursor's monitor.
     ###########################################################################
     monitors = create_monitor_manager()
-    monitor_ids = monitors.get_configured_gdk_monitor_ids(cfg)
-
-    if not monitor_ids:
-        # Fallback: let the compositor/WM decide (show on all outputs)
-        logger.warning(
-            "[monitors] Could not resolve any monitor IDs - "
-            "falling back to monitor=None (compositor/WM default)."
-        )
-        monitor_ids = [None]
-
-    logger.info(f"[monitors] mode={cfg.monitors.mode!r}  ids={monitor_ids}")
-
-    ##=> Build (monitor_id -> DynamicIsland) map so the dispatcher can route
-    # open/close actions to the island that lives on the cursor's monitor.
-    ##########################################################################
-    islands: dict[int | None, DynamicIsland] = {}
-    for mid in monitor_ids:
-        bar = StatusBar(monitor=mid)
-        if osd_widget:
-            bar.set_osd_widget(osd_widget)
-        island = DynamicIsland(monitor=mid)
-        widgets.append(bar)
-        widgets.append(island.window)
-        islands[mid] = island
+    with profiler.span("outputs"):
+        outputs = OutputsManager(monitors, osd_widget=osd_widget)
+    islands = outputs.islands
+    widgets.extend(outputs.windows)
 
     ##==>
     # Register application-level DI actions ONCE as a cursor-aware
@@ -227,7 +216,9 @@ def main(debug_mode=False):
         lambda: _get_active_island().close()
     )
 
-    app = Application(cnst.APPLICATION_NAME, *widgets)
+    with profiler.span("Application"):
+        app = Application(cnst.APPLICATION_NAME, *widgets)
+    outputs.attach(app)
 
     setproctitle.setproctitle(cnst.APPLICATION_NAME)
     cnst.APP_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
@@ -244,11 +235,14 @@ def main(debug_mode=False):
         return path
 
     theme_source_path = _get_theme_source_path(cfg.theme.name)
-    copy_theme(path=theme_source_path)
+    with profiler.span("copy_theme"):
+        copy_theme(path=theme_source_path)
 
-    # Recompile and apply CSS whenever style files change
+    # Recompile and apply CSS whenever style files change. Bursts of file
+    # events are debounced into one background sass run.
+    css_builder = CssBuilder(app)
     main_css_file = monitor_file(str(cnst.STYLES_FOLDER))
-    main_css_file.connect("changed", lambda *_: process_and_apply_css(app))
+    main_css_file.connect("changed", css_builder.queue_rebuild)
 
     # Monitor the active theme source file for direct edits
     theme_file_monitor = None
@@ -261,7 +255,7 @@ def main(debug_mode=False):
 
         def _on_theme_source_changed(*_):
             copy_theme(path=path)
-            process_and_apply_css(app)
+            css_builder.queue_rebuild()
 
         theme_file_monitor.connect("changed", _on_theme_source_changed)
 
@@ -279,19 +273,25 @@ def main(debug_mode=False):
         except Exception:
             return
 
+        reload_window_rules(
+            new_cfg.modules.dynamic_island.compact.window_titles.title_map
+        )
+
         if new_theme != current_theme:
             current_theme = new_theme
             new_path = _get_theme_source_path(new_theme)
             copy_theme(path=new_path)
             _start_theme_monitor(new_path)
-            # CSS will be recompiled by the styles monitor above
+            # Only the theme colours change; the compiled CSS is reused
 
     config_file.connect("changed", _on_config_changed)
 
-    process_and_apply_css(app)
+    with profiler.span("process_and_apply_css"):
+        process_and_apply_css(app)
 
     ##==> Run the application
     ##############################
+    profiler.finish_when_idle()
     app.run()
 
 
@@ -314,6 +314,15 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable detailed debugging for GTK and memory issues",
     )
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="spans",
+        choices=["spans", "cprofile"],
+        help="Time startup phases and imports up to the first idle frame, "
+        "print a summary and write a Chrome trace to the cache directory "
+        "('cprofile' also collects cProfile data)",
+    )
 
     args = parser.parse_args()
 
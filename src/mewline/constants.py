@@ -28,6 +28,8 @@ MAIN_STYLE = STYLES_FOLDER / "main.scss"
 THEME_STYLE = STYLES_FOLDER / "theme.scss"
 DEFAULT_THEME_STYLE = STYLES_FOLDER / "default_theme.scss"
 COMPILED_STYLE = DIST_FOLDER / "main.css"
+# SHA-256 of the SCSS sources COMPILED_STYLE was built from
+COMPILED_STYLE_HASH = DIST_FOLDER / "main.css.sha256"
 
 ##==> Settings of other modules
 ##############################################################
@@ -44,6 +46,8 @@ CLIPBOARD_THUMBS_DIR = APP_CACHE_DIRECTORY / "clipboard_thumbs"
 
 ICONS_CACHE_FILE = APP_CACHE_DIRECTORY / "icons.json"
 
+BRIGHTNESS_CACHE_FILE = APP_CACHE_DIRECTORY / "brightness.json"
+
 HYPRLAND_CONFIG_FOLDER = XDG_CONFIG_HOME / "hypr"
 HYPRLAND_CONFIG_FILE = HYPRLAND_CONFIG_FOLDER / "hyprland.conf"
 
@@ -84,6 +88,7 @@ DEFAULT_CONFIG = {
         "screen_corners": True,
         "intercept_notifications": True,
         "osd_enabled": True,
+        "brightness_target": "all",
     },
     "monitors": {
         "mode": "all",
@@ -1,13 +1,17 @@
 from mewline.custom_fabric.bspwm.service import Bspwm
+from mewline.custom_fabric.bspwm.service import get_bspwm_connection
+from mewline.custom_fabric.bspwm.state import BspwmState
+from mewline.custom_fabric.bspwm.state import get_bspwm_state
 from mewline.custom_fabric.bspwm.widgets import BspwmActiveWindow
 from mewline.custom_fabric.bspwm.widgets import BspwmLanguage
 from mewline.custom_fabric.bspwm.widgets import BspwmWorkspaces
-from mewline.custom_fabric.bspwm.widgets import get_bspwm_connection
 
 __all__ = [
     "Bspwm",
     "BspwmActiveWindow",
     "BspwmLanguage",
+    "BspwmState",
     "BspwmWorkspaces",
     "get_bspwm_connection",
+    "get_bspwm_state",
 ]
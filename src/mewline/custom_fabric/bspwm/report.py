@@ -0,0 +1,136 @@
+"""Parser for ``bspc subscribe report`` lines.
+
+A report describes every monitor and desktop in a single line, e.g.
+``WMDP-1:oI:OII:fIII:LT:TT:G:mHDMI-1:Fweb:LM:TF:G``. Parsing produces
+immutable named tuples, so consecutive reports can be compared cheaply and
+only the desktops that actually changed are handed to consumers.
+"""
+
+from typing import NamedTuple
+
+# Desktop item prefix -> (focused, occupied, urgent)
+_DESKTOP_FLAGS = {
+    "O": (True, True, False),
+    "o": (False, True, False),
+    "F": (True, False, False),
+    "f": (False, False, False),
+    "U": (True, True, True),
+    "u": (False, True, True),
+}
+_LAYOUTS = {"T": "tiled", "M": "monocle"}
+
+
+class DesktopReport(NamedTuple):
+    """State of a desktop as reported by bspwm."""
+
+    name: str
+    monitor: str
+    focused: bool
+    occupied: bool
+    urgent: bool
+    monitor_focused: bool
+
+
+class MonitorReport(NamedTuple):
+    """State of a monitor as reported by bspwm."""
+
+    name: str
+    focused: bool
+    desktops: tuple[DesktopReport, ...]
+    layout: str
+    """Layout of the focused desktop: ``tiled`` or ``monocle``."""
+    state: str
+    """State of the focused node (``T``, ``P``, ``F``, ``=``, ``@``)."""
+    flags: str
+    """Flags of the focused node (``S``, ``P``, ``L``, ``M``)."""
+
+
+class ReportDiff(NamedTuple):
+    """Difference between two consecutive reports."""
+
+    changed: tuple[DesktopReport, ...]
+    """Desktops that were added or whose state changed."""
+    removed: tuple[DesktopReport, ...]
+    """Desktops that disappeared."""
+
+
+def _build_monitor(
+    name: str, focused: bool, desktops: list, layout: str, state: str, flags: str
+) -> MonitorReport:
+    return MonitorReport(
+        name,
+        focused,
+        tuple(
+            DesktopReport(desktop_name, name, *desktop_flags, focused)
+            for desktop_name, desktop_flags in desktops
+        ),
+        layout,
+        state,
+        flags,
+    )
+
+
+def parse_report(raw_data: str) -> tuple[MonitorReport, ...]:
+    """Parse a report line into monitor records.
+
+    :param raw_data: A report line, starting with ``W``.
+    :type raw_data: str
+    :return: The monitors in report order; empty for a malformed line.
+    :rtype: tuple[MonitorReport, ...]
+    """
+    if not raw_data.startswith("W"):
+        return ()
+
+    monitors = []
+    name = None
+    focused = False
+    desktops: list = []
+    layout = state = flags = ""
+
+    for item in raw_data[1:].split(":"):
+        if not item:
+            continue
+        prefix = item[0]
+
+        if desktop_flags := _DESKTOP_FLAGS.get(prefix):
+            if name is not None:
+                desktops.append((item[1:], desktop_flags))
+        elif prefix == "M" or prefix == "m":
+            if name is not None:
+                monitors.append(
+                    _build_monitor(name, focused, desktops, layout, state, flags)
+                )
+            name = item[1:]
+            focused = prefix == "M"
+            desktops = []
+            layout = state = flags = ""
+        elif prefix == "L":
+            layout = _LAYOUTS.get(item[1:], item[1:])
+        elif prefix == "T":
+            state = item[1:]
+        elif prefix == "G":
+            flags = item[1:]
+
+    if name is not None:
+        monitors.append(_build_monitor(name, focused, desktops, layout, state, flags))
+    return tuple(monitors)
+
+
+def diff_reports(
+    previous: tuple[MonitorReport, ...], current: tuple[MonitorReport, ...]
+) -> ReportDiff:
+    """Return the desktops that changed between two parsed reports.
+
+    Desktops are identified by their monitor and name.
+    """
+    old = {
+        (desktop.monitor, desktop.name): desktop
+        for monitor in previous
+        for desktop in monitor.desktops
+    }
+    changed = []
+    for monitor in current:
+        for desktop in monitor.desktops:
+            if old.pop((desktop.monitor, desktop.name), None) != desktop:
+                changed.append(desktop)
+    return ReportDiff(tuple(changed), tuple(old.values()))
@@ -1,4 +1,6 @@
 import json
+import os
+import socket
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -11,6 +13,10 @@ from fabric.utils.helpers import idle_add
 from gi.repository import GLib
 from loguru import logger
 
+from mewline.custom_fabric.bspwm.report import MonitorReport
+from mewline.custom_fabric.bspwm.report import diff_reports
+from mewline.custom_fabric.bspwm.report import parse_report
+
 
 class BspwmError(Exception):
     """Base exception for Bspwm errors."""
@@ -56,6 +62,101 @@ class BspwmEventType(Enum):
     POINTER_ACTION = "pointer_action"
 
 
+# Node flags are reported through ``node_flag``; each of them is additionally
+# fanned out under its own event type (e.g. ``node_urgent``).
+NODE_FLAG_EVENTS = {
+    "hidden": BspwmEventType.NODE_HIDDEN,
+    "sticky": BspwmEventType.NODE_STICKY,
+    "private": BspwmEventType.NODE_PRIVATE,
+    "locked": BspwmEventType.NODE_LOCKED,
+    "marked": BspwmEventType.NODE_MARKED,
+    "urgent": BspwmEventType.NODE_URGENT,
+}
+
+# Positional arguments of every non-report event, as documented in bspc(1).
+# The last field absorbs any remaining tokens (e.g. ``node_presel``'s
+# ``dir west``).
+EVENT_FIELDS: dict[BspwmEventType, tuple[str, ...]] = {
+    BspwmEventType.MONITOR_ADD: ("monitor_id", "monitor_name", "geometry"),
+    BspwmEventType.MONITOR_RENAME: ("monitor_id", "old_name", "new_name"),
+    BspwmEventType.MONITOR_REMOVE: ("monitor_id",),
+    BspwmEventType.MONITOR_SWAP: ("src_monitor_id", "dst_monitor_id"),
+    BspwmEventType.MONITOR_FOCUS: ("monitor_id",),
+    BspwmEventType.MONITOR_GEOMETRY: ("monitor_id", "geometry"),
+    BspwmEventType.DESKTOP_ADD: ("monitor_id", "desktop_id", "desktop_name"),
+    BspwmEventType.DESKTOP_RENAME: (
+        "monitor_id",
+        "desktop_id",
+        "old_name",
+        "new_name",
+    ),
+    BspwmEventType.DESKTOP_REMOVE: ("monitor_id", "desktop_id"),
+    BspwmEventType.DESKTOP_SWAP: (
+        "src_monitor_id",
+        "src_desktop_id",
+        "dst_monitor_id",
+        "dst_desktop_id",
+    ),
+    BspwmEventType.DESKTOP_TRANSFER: (
+        "src_monitor_id",
+        "src_desktop_id",
+        "dst_monitor_id",
+    ),
+    BspwmEventType.DESKTOP_FOCUS: ("monitor_id", "desktop_id"),
+    BspwmEventType.DESKTOP_ACTIVATE: ("monitor_id", "desktop_id"),
+    BspwmEventType.DESKTOP_LAYOUT: ("monitor_id", "desktop_id", "layout"),
+    BspwmEventType.NODE_ADD: ("monitor_id", "desktop_id", "ip_id", "node_id"),
+    BspwmEventType.NODE_REMOVE: ("monitor_id", "desktop_id", "node_id"),
+    BspwmEventType.NODE_SWAP: (
+        "src_monitor_id",
+        "src_desktop_id",
+        "src_node_id",
+        "dst_monitor_id",
+        "dst_desktop_id",
+        "dst_node_id",
+    ),
+    BspwmEventType.NODE_TRANSFER: (
+        "src_monitor_id",
+        "src_desktop_id",
+        "src_node_id",
+        "dst_monitor_id",
+        "dst_desktop_id",
+        "dst_node_id",
+    ),
+    BspwmEventType.NODE_FOCUS: ("monitor_id", "desktop_id", "node_id"),
+    BspwmEventType.NODE_ACTIVATE: ("monitor_id", "desktop_id", "node_id"),
+    BspwmEventType.NODE_PRESEL: ("monitor_id", "desktop_id", "node_id", "presel"),
+    BspwmEventType.NODE_STACK: ("node_id", "relation", "other_node_id"),
+    BspwmEventType.NODE_GEOMETRY: (
+        "monitor_id",
+        "desktop_id",
+        "node_id",
+        "geometry",
+    ),
+    BspwmEventType.NODE_STATE: (
+        "monitor_id",
+        "desktop_id",
+        "node_id",
+        "state",
+        "value",
+    ),
+    BspwmEventType.NODE_FLAG: ("monitor_id", "desktop_id", "node_id", "flag", "value"),
+    BspwmEventType.NODE_LAYER: ("monitor_id", "desktop_id", "node_id", "layer"),
+    BspwmEventType.POINTER_ACTION: (
+        "monitor_id",
+        "desktop_id",
+        "node_id",
+        "action",
+        "phase",
+    ),
+}
+for _flag_event in NODE_FLAG_EVENTS.values():
+    EVENT_FIELDS[_flag_event] = ("monitor_id", "desktop_id", "node_id", "value")
+
+_EVENT_TYPES = {event_type.value: event_type for event_type in BspwmEventType}
+_SWITCH_VALUES = {"on": True, "off": False}
+
+
 @dataclass(frozen=True)
 class BspwmEvent:
     """Represents a bspwm event."""
@@ -66,6 +167,63 @@ class BspwmEvent:
     """The parsed data from the event."""
     raw_data: str
     """The raw event data."""
+    type: BspwmEventType = BspwmEventType.REPORT
+    """The typed kind of the event."""
+
+
+def parse_event(raw_data: str) -> list[BspwmEvent]:
+    """Parse a non-report line from ``bspc subscribe`` into typed events.
+
+    ``node_flag`` lines produce two events: the generic one and the flag
+    specific one (e.g. ``node_urgent``), so consumers can subscribe to
+    exactly what they need.
+
+    :param raw_data: A single event line, e.g. ``node_focus 0x1 0x2 0x3``.
+    :type raw_data: str
+    :return: The parsed events, empty if the line is not a known event.
+    :rtype: list[BspwmEvent]
+    """
+    name, *args = raw_data.split(" ")
+    event_type = _EVENT_TYPES.get(name)
+    if event_type is None or event_type is BspwmEventType.REPORT:
+        return []
+
+    fields = EVENT_FIELDS[event_type]
+    if len(args) > len(fields):
+        args = [*args[: len(fields) - 1], " ".join(args[len(fields) - 1 :])]
+
+    data: dict = dict(zip(fields, args, strict=False))
+    if "value" in data:
+        data["value"] = _SWITCH_VALUES.get(data["value"], data["value"])
+
+    events = [BspwmEvent(name=name, data=data, raw_data=raw_data, type=event_type)]
+    if event_type is BspwmEventType.NODE_FLAG:
+        flag_type = NODE_FLAG_EVENTS.get(data.get("flag", ""))
+        if flag_type is not None:
+            flag_data = {k: v for k, v in data.items() if k != "flag"}
+            events.append(
+                BspwmEvent(
+                    name=flag_type.value,
+                    data=flag_data,
+                    raw_data=raw_data,
+                    type=flag_type,
+                )
+            )
+    return events
+
+
+def get_socket_path() -> str:
+    """Return the path of the bspwm control socket.
+
+    Mirrors bspwm's own resolution: ``$BSPWM_SOCKET`` if set, otherwise
+    ``/tmp/bspwm<host>_<display>_<screen>-socket`` derived from ``$DISPLAY``.
+    """
+    if path := os.environ.get("BSPWM_SOCKET"):
+        return path
+
+    host, _, rest = os.environ.get("DISPLAY", "").rpartition(":")
+    display, _, screen = rest.partition(".")
+    return f"/tmp/bspwm{host}_{display or 0}_{screen or 0}-socket"  # noqa: S108
 
 
 @dataclass(frozen=True)
@@ -83,7 +241,10 @@ class BspwmReply:
 class Bspwm(Service):
     """A service for interacting with bspwm window manager.
 
-    This service provides command execution and event monitoring.
+    This service provides command execution and event monitoring. A single
+    subscription to every bspwm event is shared by all consumers; each event
+    is emitted as a detailed signal named after its type (``event::report``,
+    ``event::node_focus``, ``event::desktop_focus``, ...).
     """
 
     @Property(bool, "readable", "is-ready", default_value=False)
@@ -98,6 +259,7 @@ class Bspwm(Service):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._ready = False
+        self._last_report: tuple[MonitorReport, ...] = ()
 
         # Check if bspwm is running
         if not self.is_bspwm_running():
@@ -196,21 +358,18 @@ class Bspwm(Service):
         This runs in a separate thread.
         """  # noqa: D205
         try:
-            process = subprocess.Popen(
-                ["bspc", "subscribe", "report"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
+            lines = self._subscribe_socket()
+        except OSError as e:
+            logger.warning(
+                f"[BspwmService] Socket subscription failed ({e}), "
+                "falling back to bspc subscribe"
             )
+            lines = self._subscribe_process()
 
+        try:
             logger.info("[BspwmService] Event listener started")
 
-            while True:
-                line = process.stdout.readline()
-                if not line:
-                    break
-
+            for line in lines:
                 line = line.strip()
                 if line:
                     idle_add(self.handle_raw_event, line)
@@ -220,121 +379,90 @@ class Bspwm(Service):
 
         return False
 
+    @staticmethod
+    def _subscribe_socket():
+        """Subscribe to all events directly over the bspwm socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(get_socket_path())
+            # bspc sends every argument terminated by a NUL byte
+            sock.sendall(b"subscribe\0all\0")
+        except OSError:
+            sock.close()
+            raise
+        return sock.makefile("r", encoding="utf-8", errors="replace")
+
+    @staticmethod
+    def _subscribe_process():
+        """Subscribe to all events through a ``bspc subscribe`` process."""
+        process = subprocess.Popen(
+            ["bspc", "subscribe", "all"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        return process.stdout
+
     def handle_raw_event(self, raw_data: str):
         """Parse and emit bspwm events.
 
         :param raw_data: Raw event string from bspc subscribe.
         :type raw_data: str
         """
+        if not raw_data.startswith("W"):
+            try:
+                for event in parse_event(raw_data):
+                    self.emit(f"event::{event.name}", event)
+            except Exception as e:
+                logger.error(
+                    f"[BspwmService] Error parsing event: {e}, raw: {raw_data}"
+                )
+            return
+
+        self.handle_report(raw_data)
+
+    def handle_report(self, raw_data: str):
+        """Parse and emit a bspwm report event.
+
+        The event is only emitted when the report differs from the previous
+        one; its data holds the parsed ``monitors`` plus the ``changed`` and
+        ``removed`` desktops (see :func:`diff_reports`).
+
+        :param raw_data: Raw report string, starting with ``W``.
+        :type raw_data: str
+        """
         try:
-            # Parse the report format
-            # Example: WMHDMI-0:o1:O2:o3:f4:F5:LT:TT:G
-            parts = raw_data.split(":")
-            if not parts or len(parts) < 2:
+            monitors = parse_report(raw_data)
+            if not monitors or monitors == self._last_report:
                 return
 
-            # Create event data dictionary
-            event_data = {
-                "raw": raw_data,
-                "parts": parts,
-            }
-
-            # Parse monitors and desktops
-            monitors = []
-            current_monitor = None
-
-            i = 0
-            while i < len(parts):
-                part = parts[i]
-
-                if not part:
-                    i += 1
-                    continue
-
-                # First part should be "WM" + monitor name
-                if i == 0 and part.startswith("WM"):
-                    # Extract monitor name from "WMHDMI-0" or "WmHDMI-0"
-                    monitor_focused = part[
-                        1
-                    ].isupper()  # Second char: M=focused, m=unfocused
-                    monitor_name = part[2:]  # Everything after "WM"/"Wm"
-
-                    current_monitor = {
-                        "name": monitor_name,
-                        "focused": monitor_focused,
-                        "desktops": [],
-                    }
-                    i += 1
-                    continue
-
-                # Check for new monitor (format: "M" or "m" followed by name)
-                if (
-                    part[0] in ["M", "m"]
-                    and len(part) > 1
-                    and part[1:].replace("-", "").replace("_", "").isalnum()
-                ):
-                    # This is a new monitor
-                    if current_monitor:
-                        monitors.append(current_monitor)
-
-                    monitor_focused = part[0] == "M"
-                    monitor_name = part[1:]
-
-                    current_monitor = {
-                        "name": monitor_name,
-                        "focused": monitor_focused,
-                        "desktops": [],
-                    }
-                    i += 1
-                    continue
-
-                # Desktop item
-                if part[0] in ["O", "o", "F", "f", "U", "u"] and current_monitor:
-                    prefix = part[0]
-                    desktop_name = part[1:] if len(part) > 1 else ""
-
-                    # Uppercase = focused, lowercase = unfocused
-                    is_focused = prefix.isupper()
-                    is_occupied = prefix in ["O", "o", "U", "u"]
-                    is_urgent = prefix in ["U", "u"]
-
-                    current_monitor["desktops"].append(
-                        {
-                            "name": desktop_name,
-                            "focused": is_focused,
-                            "occupied": is_occupied,
-                            "urgent": is_urgent,
-                            "monitor_focused": current_monitor["focused"],
-                        }
-                    )
-                    i += 1
-                    continue
+            diff = diff_reports(self._last_report, monitors)
+            self._last_report = monitors
 
-                # Layout indicator (LT = tiled, LM = monocle)
-                if part[0] == "L" and current_monitor:
-                    layout = part[1:] if len(part) > 1 else ""
-                    layout_map = {"T": "tiled", "M": "monocle"}
-                    current_monitor["layout"] = layout_map.get(layout, layout)
-                    i += 1
-                    continue
-
-                # Other flags (T, G) - ignore for now
-                i += 1
-
-            # Add last monitor
-            if current_monitor:
-                monitors.append(current_monitor)
-
-            event_data["monitors"] = monitors
-
-            # Emit report event
             event = BspwmEvent(
                 name="report",
-                data=event_data,
+                data={
+                    "monitors": monitors,
+                    "changed": diff.changed,
+                    "removed": diff.removed,
+                },
                 raw_data=raw_data,
+                type=BspwmEventType.REPORT,
             )
 
             self.emit("event::report", event)
 
         except Exception as e:
             logger.error(f"[BspwmService] Error parsing event: {e}, raw: {raw_data}")
+
+
+connection: Bspwm | None = None
+
+
+def get_bspwm_connection() -> Bspwm:
+    """Get or create a global Bspwm connection."""
+    global connection
+    if not connection:
+        connection = Bspwm()
+    return connection
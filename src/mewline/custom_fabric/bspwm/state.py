@@ -0,0 +1,310 @@
+"""Incremental model of the bspwm monitor/desktop/node state.
+
+The store is seeded once from ``wm --dump-state`` and afterwards kept in sync
+by applying the typed events of the shared :class:`Bspwm` subscription, so
+reading desktop occupancy, focus or urgency never spawns a process.
+"""
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from fabric.core.service import Service
+from fabric.core.service import Signal
+from loguru import logger
+
+from mewline.custom_fabric.bspwm.service import Bspwm
+from mewline.custom_fabric.bspwm.service import BspwmEvent
+from mewline.custom_fabric.bspwm.service import BspwmEventType
+from mewline.custom_fabric.bspwm.service import get_bspwm_connection
+
+
+def _to_id(value: str | int) -> int:
+    """Convert an id from an event (``0x00200002``) or the JSON state to int."""
+    return value if isinstance(value, int) else int(value, 16)
+
+
+@dataclass
+class BspwmDesktop:
+    """State of a single bspwm desktop."""
+
+    id: int
+    name: str
+    monitor_id: int
+    nodes: set[int] = field(default_factory=set)
+    """Ids of the leaf nodes (windows and receptacles) on the desktop."""
+    urgent_nodes: set[int] = field(default_factory=set)
+    """Ids of the nodes having the urgent flag set."""
+
+    @property
+    def occupied(self) -> bool:
+        return bool(self.nodes)
+
+    @property
+    def urgent(self) -> bool:
+        return bool(self.urgent_nodes)
+
+
+@dataclass
+class BspwmMonitor:
+    """State of a single bspwm monitor."""
+
+    id: int
+    name: str
+    desktop_ids: list[int] = field(default_factory=list)
+    focused_desktop_id: int | None = None
+
+
+class BspwmState(Service):
+    """Event-driven store of the bspwm desktops.
+
+    Emits ``changed`` whenever an applied event altered the model.
+    """
+
+    @Signal
+    def changed(self) -> None: ...
+
+    def __init__(self, connection: Bspwm, **kwargs):
+        super().__init__(**kwargs)
+        self.connection = connection
+        self.monitors: dict[int, BspwmMonitor] = {}
+        self.desktops: dict[int, BspwmDesktop] = {}
+        self.focused_monitor_id: int | None = None
+
+        self._handlers = {
+            BspwmEventType.NODE_ADD: self._on_node_add,
+            BspwmEventType.NODE_REMOVE: self._on_node_remove,
+            BspwmEventType.NODE_TRANSFER: self._on_node_transfer,
+            BspwmEventType.NODE_SWAP: self._on_node_swap,
+            BspwmEventType.NODE_URGENT: self._on_node_urgent,
+            BspwmEventType.DESKTOP_FOCUS: self._on_desktop_focus,
+            BspwmEventType.DESKTOP_ADD: self._on_desktop_add,
+            BspwmEventType.DESKTOP_REMOVE: self._on_desktop_remove,
+            BspwmEventType.DESKTOP_RENAME: self._on_desktop_rename,
+            BspwmEventType.DESKTOP_TRANSFER: self._on_desktop_transfer,
+            BspwmEventType.DESKTOP_SWAP: self._on_desktop_swap,
+            BspwmEventType.MONITOR_FOCUS: self._on_monitor_focus,
+            BspwmEventType.MONITOR_ADD: self._on_monitor_topology,
+            BspwmEventType.MONITOR_REMOVE: self._on_monitor_topology,
+            BspwmEventType.MONITOR_RENAME: self._on_monitor_topology,
+            BspwmEventType.MONITOR_SWAP: self._on_monitor_topology,
+        }
+
+        self.resync()
+        for event_type in self._handlers:
+            self.connection.connect(f"event::{event_type.value}", self._on_event)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def iter_desktops(self):
+        """Yield desktops in monitor order, then in their order on the monitor."""
+        for monitor in self.monitors.values():
+            for desktop_id in monitor.desktop_ids:
+                if desktop := self.desktops.get(desktop_id):
+                    yield desktop
+
+    @property
+    def focused_desktop(self) -> BspwmDesktop | None:
+        """The desktop that is focused on the focused monitor."""
+        monitor = self.monitors.get(self.focused_monitor_id)
+        if monitor is None or monitor.focused_desktop_id is None:
+            return None
+        return self.desktops.get(monitor.focused_desktop_id)
+
+    def is_active(self, desktop: BspwmDesktop) -> bool:
+        """Whether *desktop* is the one shown on its monitor."""
+        monitor = self.monitors.get(desktop.monitor_id)
+        return monitor is not None and monitor.focused_desktop_id == desktop.id
+
+    # ------------------------------------------------------------------
+    # Seeding
+    # ------------------------------------------------------------------
+
+    def resync(self):
+        """Reload the whole model from ``wm --dump-state``."""
+        state = self.connection.get_state()
+        if not state:
+            logger.error("[BspwmState] Failed to get state")
+            return
+
+        self.monitors.clear()
+        self.desktops.clear()
+        self.focused_monitor_id = state.get("focusedMonitorId")
+
+        for monitor in state.get("monitors", []):
+            mon = BspwmMonitor(
+                id=monitor["id"],
+                name=monitor.get("name", ""),
+                focused_desktop_id=monitor.get("focusedDesktopId"),
+            )
+            self.monitors[mon.id] = mon
+
+            for desktop in monitor.get("desktops", []):
+                desk = BspwmDesktop(
+                    id=desktop["id"], name=desktop.get("name", ""), monitor_id=mon.id
+                )
+                self._collect_leaves(desktop.get("root"), desk)
+                self.desktops[desk.id] = desk
+                mon.desktop_ids.append(desk.id)
+
+        self.emit("changed")
+
+    @staticmethod
+    def _collect_leaves(node: dict | None, desktop: BspwmDesktop):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            first, second = node.get("firstChild"), node.get("secondChild")
+            if first is None and second is None:
+                desktop.nodes.add(node["id"])
+                if (node.get("client") or {}).get("urgent"):
+                    desktop.urgent_nodes.add(node["id"])
+                continue
+            stack.append(first)
+            stack.append(second)
+
+    # ------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------
+
+    def _on_event(self, _, event: BspwmEvent):
+        handler = self._handlers.get(event.type)
+        if handler is None:
+            return
+        try:
+            if handler(event.data) is not False:
+                self.emit("changed")
+        except (KeyError, ValueError) as e:
+            logger.warning(f"[BspwmState] Could not apply {event.raw_data!r}: {e}")
+            self.resync()
+
+    def _move_node(self, node_id: int, src_id: int, dst_id: int) -> bool:
+        src, dst = self.desktops[src_id], self.desktops[dst_id]
+        if node_id not in src.nodes:
+            # An internal node carrying a whole subtree: we do not track the
+            # tree shape, so reload instead of guessing which leaves moved.
+            self.resync()
+            return False
+        src.nodes.discard(node_id)
+        dst.nodes.add(node_id)
+        if node_id in src.urgent_nodes:
+            src.urgent_nodes.discard(node_id)
+            dst.urgent_nodes.add(node_id)
+        return True
+
+    def _on_node_add(self, data: dict):
+        self.desktops[_to_id(data["desktop_id"])].nodes.add(_to_id(data["node_id"]))
+
+    def _on_node_remove(self, data: dict):
+        desktop = self.desktops[_to_id(data["desktop_id"])]
+        node_id = _to_id(data["node_id"])
+        if node_id not in desktop.nodes:
+            self.resync()
+            return False
+        desktop.nodes.discard(node_id)
+        desktop.urgent_nodes.discard(node_id)
+
+    def _on_node_transfer(self, data: dict):
+        return self._move_node(
+            _to_id(data["src_node_id"]),
+            _to_id(data["src_desktop_id"]),
+            _to_id(data["dst_desktop_id"]),
+        )
+
+    def _on_node_swap(self, data: dict):
+        src_desktop_id = _to_id(data["src_desktop_id"])
+        dst_desktop_id = _to_id(data["dst_desktop_id"])
+        if src_desktop_id == dst_desktop_id:
+            return False
+        return self._move_node(
+            _to_id(data["src_node_id"]), src_desktop_id, dst_desktop_id
+        ) and self._move_node(
+            _to_id(data["dst_node_id"]), dst_desktop_id, src_desktop_id
+        )
+
+    def _on_node_urgent(self, data: dict):
+        desktop = self.desktops[_to_id(data["desktop_id"])]
+        if data["value"] is True:
+            desktop.urgent_nodes.add(_to_id(data["node_id"]))
+        else:
+            desktop.urgent_nodes.discard(_to_id(data["node_id"]))
+
+    def _on_desktop_focus(self, data: dict):
+        monitor_id = _to_id(data["monitor_id"])
+        self.monitors[monitor_id].focused_desktop_id = _to_id(data["desktop_id"])
+        self.focused_monitor_id = monitor_id
+
+    def _on_desktop_add(self, data: dict):
+        monitor = self.monitors[_to_id(data["monitor_id"])]
+        desktop_id = _to_id(data["desktop_id"])
+        if desktop_id in self.desktops:
+            return False
+        self.desktops[desktop_id] = BspwmDesktop(
+            id=desktop_id, name=data["desktop_name"], monitor_id=monitor.id
+        )
+        monitor.desktop_ids.append(desktop_id)
+
+    def _on_desktop_remove(self, data: dict):
+        monitor = self.monitors[_to_id(data["monitor_id"])]
+        desktop_id = _to_id(data["desktop_id"])
+        if self.desktops.pop(desktop_id, None) is None:
+            return False
+        monitor.desktop_ids.remove(desktop_id)
+        if monitor.focused_desktop_id == desktop_id:
+            monitor.focused_desktop_id = None
+
+    def _on_desktop_rename(self, data: dict):
+        self.desktops[_to_id(data["desktop_id"])].name = data["new_name"]
+
+    def _on_desktop_transfer(self, data: dict):
+        src = self.monitors[_to_id(data["src_monitor_id"])]
+        dst = self.monitors[_to_id(data["dst_monitor_id"])]
+        desktop_id = _to_id(data["src_desktop_id"])
+        src.desktop_ids.remove(desktop_id)
+        dst.desktop_ids.append(desktop_id)
+        self.desktops[desktop_id].monitor_id = dst.id
+        if src.focused_desktop_id == desktop_id:
+            src.focused_desktop_id = None
+
+    def _on_desktop_swap(self, data: dict):
+        src = self.monitors[_to_id(data["src_monitor_id"])]
+        dst = self.monitors[_to_id(data["dst_monitor_id"])]
+        src_id = _to_id(data["src_desktop_id"])
+        dst_id = _to_id(data["dst_desktop_id"])
+
+        src_index, dst_index = (
+            src.desktop_ids.index(src_id),
+            dst.desktop_ids.index(dst_id),
+        )
+        src.desktop_ids[src_index], dst.desktop_ids[dst_index] = dst_id, src_id
+        self.desktops[src_id].monitor_id = dst.id
+        self.desktops[dst_id].monitor_id = src.id
+
+        # Across monitors each desktop takes over the other's focus slot
+        if src is not dst:
+            if src.focused_desktop_id == src_id:
+                src.focused_desktop_id = dst_id
+            if dst.focused_desktop_id == dst_id:
+                dst.focused_desktop_id = src_id
+
+    def _on_monitor_focus(self, data: dict):
+        self.focused_monitor_id = _to_id(data["monitor_id"])
+
+    def _on_monitor_topology(self, data: dict):
+        # Monitor hot-plug is rare, a full reload keeps the model simple.
+        self.resync()
+        return False
+
+
+state: BspwmState | None = None
+
+
+def get_bspwm_state() -> BspwmState:
+    """Get or create the global bspwm state store."""
+    global state
+    if not state:
+        state = BspwmState(get_bspwm_connection())
+    return state
@@ -1,4 +1,3 @@
-import subprocess
 from collections.abc import Callable
 from collections.abc import Iterable
 
@@ -8,21 +7,13 @@ from fabric.core.widgets import WorkspaceButton
 from fabric.core.widgets import Workspaces
 from fabric.utils.helpers import FormattedString
 from fabric.utils.helpers import truncate
-from gi.repository import GLib
 from loguru import logger
 
-from mewline.custom_fabric.bspwm.service import Bspwm
 from mewline.custom_fabric.bspwm.service import BspwmEvent
-
-connection: Bspwm | None = None
-
-
-def get_bspwm_connection() -> Bspwm:
-    """Get or create a global Bspwm connection."""
-    global connection
-    if not connection:
-        connection = Bspwm()
-    return connection
+from mewline.custom_fabric.bspwm.service import get_bspwm_connection
+from mewline.custom_fabric.bspwm.x11 import get_active_window_watcher
+from mewline.custom_fabric.bspwm.x11 import get_keyboard_layout_watcher
+from mewline.utils.signal_handlers import SignalHandlers
 
 
 class BspwmWorkspaces(Workspaces):
@@ -42,14 +33,17 @@ class BspwmWorkspaces(Workspaces):
     ):
         super().__init__(buttons, buttons_factory, invert_scroll, **kwargs)
         self.connection = get_bspwm_connection()
+        self._handlers = SignalHandlers(self)
 
         # Subscribe to bspwm events
-        self.connection.connect("event::report", self.on_report_event)
+        self._handlers.connect(
+            self.connection, "event::report", self.on_report_event
+        )
 
         if self.connection.ready:
             self.on_ready()
         else:
-            self.connection.connect("notify::ready", self.on_ready)
+            self._handlers.connect(self.connection, "notify::ready", self.on_ready)
 
         self.connect("scroll-event", self.do_handle_scroll)
 
@@ -91,44 +85,51 @@ class BspwmWorkspaces(Workspaces):
     def on_report_event(self, _, event: BspwmEvent):
         """Handle bspwm report events."""
         try:
-            monitors = event.data.get("monitors", [])
-
-            # Track which workspaces exist and their states
-            active_workspaces = set()
-
-            for monitor in monitors:
-                for desktop in monitor["desktops"]:
-                    desktop_name = desktop["name"]
-
-                    # Try to parse as int
-                    try:
-                        ws_id = int(desktop_name)
-                    except ValueError:
-                        ws_id = hash(desktop_name) % 1000
+            # Only desktops that changed since the previous report
+            for desktop in event.data.get("changed", ()):
+                # Try to parse as int
+                try:
+                    ws_id = int(desktop.name)
+                except ValueError:
+                    ws_id = hash(desktop.name) % 1000
 
-                    active_workspaces.add(ws_id)
+                # Create workspace if it doesn't exist
+                if ws_id not in self._buttons:
+                    self.workspace_created(ws_id)
 
-                    # Create workspace if it doesn't exist
-                    if ws_id not in self._buttons:
-                        self.workspace_created(ws_id)
+                # Update workspace state
+                btn = self._buttons.get(ws_id)
+                if not btn:
+                    continue
 
-                    # Update workspace state
-                    btn = self._buttons.get(ws_id)
-                    if not btn:
-                        continue
+                # Update occupied state
+                btn.empty = not desktop.occupied
 
-                    # Update occupied state
-                    btn.empty = not desktop["occupied"]
+                # Update urgent state
+                if desktop.urgent:
+                    self.urgent(ws_id)
+                else:
+                    btn.urgent = False
 
-                    # Update urgent state
-                    if desktop["urgent"]:
-                        self.urgent(ws_id)
-                    else:
-                        btn.urgent = False
+                # Update focused state
+                if desktop.focused and desktop.monitor_focused:
+                    self.workspace_activated(ws_id)
 
-                    # Update focused state
-                    if desktop["focused"] and desktop["monitor_focused"]:
-                        self.workspace_activated(ws_id)
+            # Desktops are diffed per monitor, so a removed name may still
+            # exist elsewhere (e.g. the desktop was moved to another monitor)
+            remaining = {
+                desktop.name
+                for monitor in event.data.get("monitors", ())
+                for desktop in monitor.desktops
+            }
+            for desktop in event.data.get("removed", ()):
+                if desktop.name in remaining:
+                    continue
+                try:
+                    ws_id = int(desktop.name)
+                except ValueError:
+                    ws_id = hash(desktop.name) % 1000
+                self.workspace_destroyed(ws_id)
 
         except Exception as e:
             logger.error(f"[BspwmWorkspaces] Error handling report event: {e}")
@@ -149,7 +150,8 @@ class BspwmWorkspaces(Workspaces):
 class BspwmActiveWindow(ActiveWindow):
     """A widget that displays the title of the active window in bspwm.
 
-    The widget automatically updates when window focus changes.
+    The widget automatically updates when window focus or the title of the
+    focused window changes, driven by X11 property events.
     """
 
     def __init__(
@@ -161,163 +163,48 @@ class BspwmActiveWindow(ActiveWindow):
         **kwargs,
     ):
         super().__init__(formatter, **kwargs)
-        self.connection = get_bspwm_connection()
-
-        # Subscribe to events
-        self.connection.connect("event::report", self.on_report_event)
-
-        if self.connection.ready:
-            self.on_ready()
-        else:
-            self.connection.connect("notify::ready", self.on_ready)
-
-        # Poll for title changes since bspwm doesn't emit title change events
-        GLib.timeout_add(500, self.poll_active_window)
+        self.watcher = get_active_window_watcher()
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self.watcher, "changed", self.update_active_window)
 
-    def on_ready(self, *args):
-        """Initialize active window when connection is ready."""
         self.update_active_window()
         logger.info("[BspwmActiveWindow] Initialized")
 
-    def on_report_event(self, _, event: BspwmEvent):
-        """Handle report events (focus changes)."""
-        # Update on any report event as focus might have changed
-        GLib.idle_add(self.update_active_window)
-
-    def poll_active_window(self) -> bool:
-        """Periodically check active window title."""
-        self.update_active_window()
-        return True  # Continue polling
-
-    def update_active_window(self):
+    def update_active_window(self, *args):
         """Update the active window title."""
-        try:
-            # Get focused node ID
-            reply = self.connection.send_command("query -N -n focused", silent=True)
-            if not reply.is_ok or not reply.output:
-                self.window_activated("", "Desktop")
-                return
-
-            node_id = reply.output.strip()
-
-            # Get window class
-            class_reply = self.connection.send_command(
-                f"query -T -n {node_id} | head -1"
-            )
-            win_class = class_reply.output.strip() if class_reply.is_ok else "unknown"
-
-            # Get window title using xtitle or xdotool
-            title_result = subprocess.run(  # noqa: S602
-                f"xtitle {node_id}",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=1,
-            )
-
-            if title_result.returncode == 0 and title_result.stdout:
-                win_title = title_result.stdout.strip()
-            else:
-                # Fallback to xdotool
-                title_result = subprocess.run(  # noqa: S602
-                    f"xdotool getwindowname {node_id}",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=1,
-                )
-                win_title = (
-                    title_result.stdout.strip()
-                    if title_result.returncode == 0
-                    else win_class
-                )
-
-            self.window_activated(win_class, win_title)
-
-        except subprocess.TimeoutExpired:
-            logger.warning("[BspwmActiveWindow] Timeout getting window title")
-        except Exception as e:
-            logger.debug(f"[BspwmActiveWindow] Error updating window: {e}")
+        if not self.watcher.window_id:
             self.window_activated("", "Desktop")
+            return
+
+        win_class = self.watcher.wm_class or self.watcher.instance
+        self.window_activated(win_class, self.watcher.title or win_class)
 
 
 class BspwmLanguage(Language):
     """A widget that displays the current keyboard layout.
 
-    Note: This widget requires setxkbmap or xkb-switch to be installed.
-    It polls the keyboard layout periodically since bspwm doesn't provide
-    layout change events directly.
+    Layout switches are delivered by XKB state events on the X server, and
+    the group names are read once from ``_XKB_RULES_NAMES``.
     """
 
     def __init__(
         self,
         keyboard: str = ".*",
         formatter: FormattedString = FormattedString("{language}"),  # noqa: B008
-        poll_interval: int = 1000,
         **kwargs,
     ):
         super().__init__(keyboard, formatter, **kwargs)
-        self.connection = get_bspwm_connection()
-        self.poll_interval = poll_interval
+        self.watcher = get_keyboard_layout_watcher()
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self.watcher, "changed", self.update_keyboard_layout)
 
-        if self.connection.ready:
-            self.on_ready()
-        else:
-            self.connection.connect("notify::ready", self.on_ready)
-
-        # Start polling for layout changes
-        GLib.timeout_add(self.poll_interval, self.poll_keyboard_layout)
-
-    def on_ready(self, *args):
-        """Initialize language widget when connection is ready."""
         self.update_keyboard_layout()
         logger.info("[BspwmLanguage] Initialized")
 
-    def poll_keyboard_layout(self) -> bool:
-        """Periodically check keyboard layout."""
-        self.update_keyboard_layout()
-        return True  # Continue polling
-
-    def update_keyboard_layout(self):
+    def update_keyboard_layout(self, *args):
         """Update the current keyboard layout."""
-        try:
-            # Try xkb-switch first (more reliable)
-            result = subprocess.run(
-                ["xkb-switch", "-p"],
-                capture_output=True,
-                text=True,
-                timeout=1,
-            )
-
-            if result.returncode == 0 and result.stdout:
-                layout = result.stdout.strip()
-                self.layout_changed(layout, "keyboard")
-                return
-
-            # Fallback to setxkbmap
-            result = subprocess.run(
-                ["setxkbmap", "-query"],
-                capture_output=True,
-                text=True,
-                timeout=1,
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.split("\n"):
-                    if line.startswith("layout:"):
-                        layout = line.split(":", 1)[1].strip()
-                        self.layout_changed(layout, "keyboard")
-                        return
-
-        except FileNotFoundError:
-            logger.warning(
-                "[BspwmLanguage] xkb-switch or setxkbmap not found. "
-                "Please install one of them."
-            )
-        except subprocess.TimeoutExpired:
-            logger.warning("[BspwmLanguage] Timeout getting keyboard layout")
-        except Exception as e:
-            logger.debug(f"[BspwmLanguage] Error getting layout: {e}")
+        if layout := self.watcher.layout:
+            self.layout_changed(layout, "keyboard")
 
 
 __all__ = [
@@ -0,0 +1,346 @@
+"""X11 event watchers used by the bspwm widgets.
+
+Each watcher keeps its own Xlib connection whose socket is polled by the
+GLib main loop, so updates arrive as X events without polling or spawning
+helper processes.
+"""
+
+from fabric.core.service import Service
+from fabric.core.service import Signal
+from gi.repository import GLib
+from loguru import logger
+from Xlib import X
+from Xlib.display import Display
+from Xlib.error import XError
+from Xlib.protocol import rq
+
+##==> Minimal XKB protocol (python-xlib ships no XKEYBOARD extension module)
+##############################################################################
+XKB_USE_CORE_KBD = 0x100
+XKB_STATE_NOTIFY = 2
+XKB_STATE_NOTIFY_MASK = 1 << XKB_STATE_NOTIFY
+XKB_GROUP_STATE_MASK = 1 << 4
+
+
+class _XkbUseExtension(rq.ReplyRequest):
+    _request = rq.Struct(
+        rq.Card8("opcode"),
+        rq.Opcode(0),
+        rq.RequestLength(),
+        rq.Card16("wanted_major"),
+        rq.Card16("wanted_minor"),
+    )
+    _reply = rq.Struct(
+        rq.ReplyCode(),
+        rq.Bool("supported"),
+        rq.Card16("sequence_number"),
+        rq.ReplyLength(),
+        rq.Card16("server_major"),
+        rq.Card16("server_minor"),
+        rq.Pad(20),
+    )
+
+
+class _XkbSelectEvents(rq.Request):
+    # Only the StateNotify details are present since affect_which selects
+    # nothing else.
+    _request = rq.Struct(
+        rq.Card8("opcode"),
+        rq.Opcode(1),
+        rq.RequestLength(),
+        rq.Card16("device_spec"),
+        rq.Card16("affect_which"),
+        rq.Card16("clear"),
+        rq.Card16("select_all"),
+        rq.Card16("affect_map"),
+        rq.Card16("map"),
+        rq.Card16("affect_state"),
+        rq.Card16("state_details"),
+    )
+
+
+class _XkbGetState(rq.ReplyRequest):
+    _request = rq.Struct(
+        rq.Card8("opcode"),
+        rq.Opcode(4),
+        rq.RequestLength(),
+        rq.Card16("device_spec"),
+        rq.Pad(2),
+    )
+    _reply = rq.Struct(
+        rq.ReplyCode(),
+        rq.Card8("device_id"),
+        rq.Card16("sequence_number"),
+        rq.ReplyLength(),
+        rq.Card8("mods"),
+        rq.Card8("base_mods"),
+        rq.Card8("latched_mods"),
+        rq.Card8("locked_mods"),
+        rq.Card8("group"),
+        rq.Card8("locked_group"),
+        rq.Int16("base_group"),
+        rq.Int16("latched_group"),
+        rq.Pad(14),
+    )
+
+
+class _XkbStateNotify(rq.Event):
+    _code = None
+    _fields = rq.Struct(
+        rq.Card8("type"),
+        rq.Card8("xkb_type"),
+        rq.Card16("sequence_number"),
+        rq.Card32("time"),
+        rq.Card8("device_id"),
+        rq.Card8("mods"),
+        rq.Card8("base_mods"),
+        rq.Card8("latched_mods"),
+        rq.Card8("locked_mods"),
+        rq.Card8("group"),
+        rq.Int16("base_group"),
+        rq.Int16("latched_group"),
+        rq.Card8("locked_group"),
+        rq.Pad(5),
+        rq.Card16("ptr_btn_state"),
+        rq.Card16("changed"),
+        rq.Pad(4),
+    )
+
+
+class _XWatcher(Service):
+    """Base for services reacting to events of a dedicated X connection."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._display = Display()
+        self._root = self._display.screen().root
+
+    def _start_watching(self):
+        self._display.flush()
+        GLib.io_add_watch(
+            self._display.fileno(),
+            GLib.PRIORITY_DEFAULT,
+            GLib.IO_IN,
+            self._on_x_events,
+        )
+
+    def _on_x_events(self, *_) -> bool:
+        try:
+            while self._display.pending_events():
+                self._handle_event(self._display.next_event())
+            self._display.flush()
+        except Exception as e:
+            logger.error(f"[{type(self).__name__}] Error handling X events: {e}")
+        return True
+
+    def _handle_event(self, event): ...
+
+
+class ActiveWindowWatcher(_XWatcher):
+    """Tracks the title and class of the EWMH active window.
+
+    Listens for ``_NET_ACTIVE_WINDOW`` changes on the root window and for
+    ``_NET_WM_NAME``/``WM_NAME``/``WM_CLASS`` changes on the active window.
+    Emits ``changed`` whenever one of the exposed attributes changes.
+    """
+
+    @Signal
+    def changed(self) -> None: ...
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.window_id = 0
+        self.title = ""
+        self.instance = ""
+        self.wm_class = ""
+
+        self._window = None
+        self._net_active_window = self._display.intern_atom("_NET_ACTIVE_WINDOW")
+        self._net_wm_name = self._display.intern_atom("_NET_WM_NAME")
+        self._utf8_string = self._display.intern_atom("UTF8_STRING")
+        self._watched_atoms = {
+            self._net_wm_name,
+            self._display.intern_atom("WM_NAME"),
+            self._display.intern_atom("WM_CLASS"),
+        }
+
+        self._root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._update_active_window()
+        self._start_watching()
+
+    def _handle_event(self, event):
+        if event.type != X.PropertyNotify:
+            return
+
+        if event.window.id == self._root.id:
+            if event.atom == self._net_active_window:
+                self._update_active_window()
+        elif event.window.id == self.window_id and event.atom in self._watched_atoms:
+            self._update_window_properties()
+
+    def _update_active_window(self):
+        try:
+            prop = self._root.get_full_property(
+                self._net_active_window, X.AnyPropertyType
+            )
+            window_id = int(prop.value[0]) if prop and len(prop.value) else 0
+        except XError:
+            window_id = 0
+
+        if window_id == self.window_id:
+            return
+
+        if self._window is not None:
+            self._window.change_attributes(
+                event_mask=X.NoEventMask, onerror=lambda *_: None
+            )
+
+        self.window_id = window_id
+        self._window = None
+        if window_id:
+            self._window = self._display.create_resource_object("window", window_id)
+            self._window.change_attributes(
+                event_mask=X.PropertyChangeMask, onerror=lambda *_: None
+            )
+        self._update_window_properties(force=True)
+
+    def _update_window_properties(self, force: bool = False):
+        title, instance, wm_class = "", "", ""
+        if self._window is not None:
+            try:
+                title = self._read_title(self._window)
+                instance, wm_class = self._window.get_wm_class() or ("", "")
+            except XError:
+                # The window vanished; _NET_ACTIVE_WINDOW will follow shortly
+                pass
+
+        values = (title, instance or "", wm_class or "")
+        if not force and values == (self.title, self.instance, self.wm_class):
+            return
+        self.title, self.instance, self.wm_class = values
+        self.emit("changed")
+
+    def _read_title(self, window) -> str:
+        prop = window.get_full_property(self._net_wm_name, self._utf8_string)
+        value = prop.value if prop else None
+        if not value:
+            value = window.get_wm_name() or ""
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", "replace")
+        return value
+
+
+class KeyboardLayoutWatcher(_XWatcher):
+    """Tracks the active XKB group (keyboard layout) of the core keyboard.
+
+    Group switches arrive as ``XkbStateNotify`` events; group names are
+    resolved once from the root ``_XKB_RULES_NAMES`` property and refreshed
+    only when that property changes (e.g. after ``setxkbmap``). Emits
+    ``changed`` when the active layout changes.
+    """
+
+    @Signal
+    def changed(self) -> None: ...
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.group = 0
+        self.layouts: list[str] = []
+        self._rules_names = self._display.intern_atom("_XKB_RULES_NAMES")
+
+        extension = self._display.query_extension("XKEYBOARD")
+        if extension is None:
+            raise RuntimeError("XKEYBOARD extension is not available")
+        self._xkb_event = extension.first_event
+        opcode = extension.major_opcode
+
+        reply = _XkbUseExtension(
+            display=self._display.display,
+            opcode=opcode,
+            wanted_major=1,
+            wanted_minor=0,
+        )
+        if not reply.supported:
+            raise RuntimeError("XKEYBOARD 1.0 is not supported by the server")
+
+        self._display.extension_add_subevent(
+            self._xkb_event, XKB_STATE_NOTIFY, _XkbStateNotify
+        )
+        _XkbSelectEvents(
+            display=self._display.display,
+            opcode=opcode,
+            device_spec=XKB_USE_CORE_KBD,
+            affect_which=XKB_STATE_NOTIFY_MASK,
+            clear=0,
+            select_all=0,
+            affect_map=0,
+            map=0,
+            affect_state=XKB_GROUP_STATE_MASK,
+            state_details=XKB_GROUP_STATE_MASK,
+        )
+        self.group = _XkbGetState(
+            display=self._display.display,
+            opcode=opcode,
+            device_spec=XKB_USE_CORE_KBD,
+        ).group
+
+        self._root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._load_layouts()
+        self._start_watching()
+
+    @property
+    def layout(self) -> str:
+        """Name of the active layout, e.g. ``us`` or ``ru(phonetic)``."""
+        if 0 <= self.group < len(self.layouts):
+            return self.layouts[self.group]
+        return ""
+
+    def _load_layouts(self):
+        prop = self._root.get_full_property(self._rules_names, X.AnyPropertyType)
+        value = prop.value if prop else b""
+        if isinstance(value, str):
+            value = value.encode()
+
+        # rules, model, layout, variant, options
+        fields = [f.decode("utf-8", "replace") for f in value.split(b"\0")]
+        fields += [""] * (5 - len(fields))
+        variants = fields[3].split(",")
+        self.layouts = []
+        for i, layout in enumerate(fields[2].split(",")):
+            variant = variants[i] if i < len(variants) else ""
+            self.layouts.append(f"{layout}({variant})" if variant else layout)
+
+    def _handle_event(self, event):
+        if event.type == self._xkb_event:
+            if event.xkb_type == XKB_STATE_NOTIFY and event.group != self.group:
+                self.group = event.group
+                self.emit("changed")
+        elif (
+            event.type == X.PropertyNotify
+            and event.window.id == self._root.id
+            and event.atom == self._rules_names
+        ):
+            previous = self.layout
+            self._load_layouts()
+            if self.layout != previous:
+                self.emit("changed")
+
+
+active_window_watcher: ActiveWindowWatcher | None = None
+keyboard_layout_watcher: KeyboardLayoutWatcher | None = None
+
+
+def get_active_window_watcher() -> ActiveWindowWatcher:
+    """Get or create the global active window watcher."""
+    global active_window_watcher
+    if not active_window_watcher:
+        active_window_watcher = ActiveWindowWatcher()
+    return active_window_watcher
+
+
+def get_keyboard_layout_watcher() -> KeyboardLayoutWatcher:
+    """Get or create the global keyboard layout watcher."""
+    global keyboard_layout_watcher
+    if not keyboard_layout_watcher:
+        keyboard_layout_watcher = KeyboardLayoutWatcher()
+    return keyboard_layout_watcher
@@ -1,24 +1,132 @@
-from fabric.audio import Audio
-from fabric.bluetooth import BluetoothClient
-
-from mewline.services.audio_visualizer import AudioVisualizerService
-from mewline.services.battery import BatteryService
-from mewline.services.brightness import BrightnessService
-from mewline.services.cache_notification import NotificationCacheService
-from mewline.services.notifications import MyNotifications
-from mewline.services.privacy import PrivacyService
-
-audio_service = Audio()
-audio_visualizer_service = AudioVisualizerService(bar_count=6, fps=30)
-
-notification_service = MyNotifications()
-cache_notification_service = NotificationCacheService()
-brightness_service = BrightnessService()
-battery_service = BatteryService()
-privacy_service = PrivacyService()
-
-bluetooth_client = BluetoothClient()
-# to run notify closures thus display the status
-# without having to wait until an actual change
-bluetooth_client.notify("scanning")
-bluetooth_client.notify("enabled")
+"""Shared services, created lazily on first use.
+
+Several services do slow work when they are created (D-Bus round-trips,
+reading caches, spawning helper processes), so nothing is instantiated on
+import. Widgets fetch them with :func:`get_service` when they are built,
+and services nobody asks for are never started.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from mewline.utils.startup_profiler import profiler
+
+
+def _create_audio():
+    from fabric.audio import Audio
+
+    return Audio()
+
+
+def _create_audio_visualizer():
+    from mewline.services.audio_visualizer import AudioVisualizerService
+
+    return AudioVisualizerService(bar_count=6, fps=30)
+
+
+def _create_notifications():
+    from mewline.services.notifications import MyNotifications
+
+    return MyNotifications()
+
+
+def _create_cache_notification():
+    from mewline.services.cache_notification import NotificationCacheService
+
+    return NotificationCacheService()
+
+
+def _create_brightness():
+    from mewline.services.brightness import BrightnessService
+
+    return BrightnessService()
+
+
+def _create_battery():
+    from mewline.services.battery import BatteryService
+
+    return BatteryService()
+
+
+def _create_privacy():
+    from mewline.services.privacy import PrivacyService
+
+    return PrivacyService()
+
+
+def _create_mpris():
+    from mewline.services.mpris import MprisPlayerManager
+
+    return MprisPlayerManager()
+
+
+def _create_bluetooth():
+    from fabric.bluetooth import BluetoothClient
+
+    client = BluetoothClient()
+    # to run notify closures thus display the status
+    # without having to wait until an actual change
+    client.notify("scanning")
+    client.notify("enabled")
+    return client
+
+
+SERVICE_FACTORIES: dict[str, Callable[[], Any]] = {
+    "audio": _create_audio,
+    "audio_visualizer": _create_audio_visualizer,
+    "notifications": _create_notifications,
+    "cache_notification": _create_cache_notification,
+    "brightness": _create_brightness,
+    "battery": _create_battery,
+    "privacy": _create_privacy,
+    "bluetooth": _create_bluetooth,
+    "mpris": _create_mpris,
+}
+
+# Names of the former module-level instances, kept for compatibility
+_LEGACY_NAMES = {
+    "audio_service": "audio",
+    "audio_visualizer_service": "audio_visualizer",
+    "notification_service": "notifications",
+    "cache_notification_service": "cache_notification",
+    "brightness_service": "brightness",
+    "battery_service": "battery",
+    "privacy_service": "privacy",
+    "bluetooth_client": "bluetooth",
+}
+
+_services: dict[str, Any] = {}
+
+
+def get_service(name: str) -> Any:
+    """Get a shared service, creating it on first use.
+
+    Args:
+        name: Key of the service in `SERVICE_FACTORIES`, e.g. ``"brightness"``.
+
+    Returns:
+        The service instance, shared by every caller.
+    """
+    service = _services.get(name)
+    if service is None:
+        try:
+            factory = SERVICE_FACTORIES[name]
+        except KeyError:
+            raise KeyError(f"Unknown service {name!r}") from None
+        logger.debug(f"[Services] Starting {name} service")
+        with profiler.span(f"service {name}"):
+            service = _services[name] = factory()
+    return service
+
+
+def is_service_started(name: str) -> bool:
+    """Whether the service *name* has already been created."""
+    return name in _services
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LEGACY_NAMES:
+        return get_service(_LEGACY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
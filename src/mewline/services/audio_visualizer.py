@@ -1,81 +1,427 @@
 """Service that provides audio level data for the waveform visualizer.
 
-Emits waveform bar levels at ~30 FPS. Uses mock/simulated data when playing;
-optionally scales by system volume if pulsectl is available.
+Feeds waveform bar levels to the attached visualizer widgets at ~30 FPS.
+When NumPy and ``parec`` (PulseAudio or pipewire-pulse) are available, the
+levels are the spectrum of what the default sink is playing; otherwise
+simulated levels are used. Levels are scaled by the speaker volume reported
+by the shared ``Audio`` service.
+
+Updates are driven by the GDK frame clock of a mapped visualizer and stop
+completely while no visualizer is mapped (hidden island, hidden music view,
+monitor off) or while the captured audio is silent.
 """
 
 import math
 import random
+import subprocess
+import threading
+import time
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
+from gi.repository import Gdk
 from gi.repository import GLib
+from loguru import logger
+
+from mewline.services import get_service
+from mewline.utils.deadline_timer import DeadlineTimer
+from mewline.utils.misc import executable_exists
+from mewline.utils.signal_handlers import SignalHandlers
+
+if TYPE_CHECKING:
+    from mewline.widgets.audio_visualizer import AudioVisualizerWidget
 
 try:
-    import pulsectl
+    import numpy as np
 except ImportError:
-    pulsectl = None
+    np = None
 
-import contextlib
+CAPTURE_RATE = 44100
+# Samples read per block (~23 ms), the FFT runs over the last FFT_SIZE ones
+CAPTURE_BLOCK = 1024
+FFT_SIZE = 2048
+MIN_FREQ = 50.0
+MAX_FREQ = 12000.0
+# Band power at or below this level (dBFS) is drawn as an empty bar
+FLOOR_DB = -70.0
+# Fraction of the distance to the new level covered per block
+ATTACK = 0.6
+DECAY = 0.15
+# Audio counts as silent once every band stayed below this level for
+# SILENCE_BLOCKS consecutive blocks (~0.5 s)
+SILENCE_LEVEL = 0.02
+SILENCE_BLOCKS = 20
+FRAME_SLACK_US = 4000
+# A capture that ends is restarted after this delay, giving up after
+# CAPTURE_RESTARTS consecutive streams that lasted less than CAPTURE_STABLE_S
+CAPTURE_RESTART_DELAY_MS = 2000
+CAPTURE_RESTARTS = 3
+CAPTURE_STABLE_S = 10.0
 
-from loguru import logger
 
+def band_edges(bar_count: int) -> "np.ndarray":
+    """FFT bin indices bounding *bar_count* log-spaced frequency bands.
 
-class AudioVisualizerService:
-    """Emits waveform level data for visualization.
+    Returns ``bar_count + 1`` increasing indices into the spectrum of an
+    `FFT_SIZE` block sampled at `CAPTURE_RATE`; band ``i`` covers the bins
+    ``edges[i]`` up to (excluding) ``edges[i + 1]``.
+    """
+    freqs = np.fft.rfftfreq(FFT_SIZE, 1 / CAPTURE_RATE)
+    edges = np.searchsorted(freqs, np.geomspace(MIN_FREQ, MAX_FREQ, bar_count + 1))
+    # Every band needs at least one FFT bin
+    for i in range(1, len(edges)):
+        edges[i] = max(edges[i], edges[i - 1] + 1)
+    return edges
+
+
+def band_levels(
+    samples: "np.ndarray", window: "np.ndarray", edges: "np.ndarray"
+) -> "np.ndarray":
+    """Map a block of samples to per-band levels between 0.0 and 1.0.
 
-    When started, runs a timer that pushes lists of float levels (0.0–1.0)
-    for each bar. Uses smoothed mock data; can optionally scale by PulseAudio
-    volume if pulsectl is available.
+    The windowed block is transformed with an FFT, the power of the bins of
+    every band (see `band_edges`) is averaged and converted to dBFS, and
+    `FLOOR_DB`..0 dBFS is mapped linearly onto 0.0..1.0.
+
+    Args:
+        samples: `FFT_SIZE` samples scaled to -1.0..1.0.
+        window: Window function of the same length.
+        edges: Band edges returned by `band_edges`.
+    """
+    # Scale so that a full-scale sine reads as 0 dBFS
+    norm = window.sum() / 2
+    spectrum = np.abs(np.fft.rfft(samples * window)) / norm
+    power = spectrum[: edges[-1]] ** 2
+    bands = np.add.reduceat(power, edges[:-1]) / np.diff(edges)
+    db = 10.0 * np.log10(bands + 1e-12)
+    return np.clip((db - FLOOR_DB) / -FLOOR_DB, 0.0, 1.0)
+
+
+class SpectrumCapture:
+    """Captures the default sink monitor and turns it into bar levels.
+
+    A worker thread reads blocks of mono samples from ``parec``, runs a
+    windowed FFT, sums the power into log-spaced bands and smooths them
+    (fast attack, slow decay), all as NumPy array operations. The newest
+    result is published by replacing the immutable `levels` tuple, so the
+    GTK thread reads it without locking.
+
+    Silence is detected in the worker as well; *on_silence_changed* is
+    called on the main loop with the new state whenever it flips. If
+    ``parec`` exits on its own (e.g. the sound server restarted), the
+    capture is reset on the main loop and *on_ended* is called with the
+    number of seconds the stream ran.
+
+    Args:
+        bar_count: Number of frequency bands.
+        on_silence_changed: Called with ``True`` when the audio goes silent
+            and with ``False`` when it resumes.
+        on_ended: Called when the stream ends without `stop` being called.
     """
 
     def __init__(
         self,
-        bar_count: int = 6,
-        fps: int = 50,
-        on_levels: Callable[[list[float]], None] | None = None
+        bar_count: int,
+        on_silence_changed: Callable[[bool], None] | None = None,
+        on_ended: Callable[[float], None] | None = None,
     ):
+        self.bar_count = bar_count
+        self.levels: tuple[float, ...] = (0.0,) * bar_count
+        self.silent = False
+        self._on_silence_changed = on_silence_changed
+        self._on_ended = on_ended
+        self._process: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+
+        self._window = np.hanning(FFT_SIZE).astype(np.float32)
+        self._edges = band_edges(bar_count)
+
+    @staticmethod
+    def is_supported() -> bool:
+        return np is not None and executable_exists("parec")
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None
+
+    def start(self):
+        if self._process is not None:
+            return
+        try:
+            self._process = subprocess.Popen(
+                [
+                    "parec",
+                    "--device=@DEFAULT_MONITOR@",
+                    "--format=s16le",
+                    f"--rate={CAPTURE_RATE}",
+                    "--channels=1",
+                    "--latency-msec=20",
+                    "--client-name=mewline-visualizer",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"[AudioVisualizer] Failed to start capture: {e}")
+            return
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._process,),
+            daemon=True,
+            name="visualizer-capture",
+        )
+        self._thread.start()
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.terminate()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        process.wait()
+        self._reset()
+
+    def _reset(self):
+        self.levels = (0.0,) * self.bar_count
+        self.silent = False
+
+    def _on_stream_ended(self, process: subprocess.Popen) -> bool:
+        # stop() or a restart may have replaced the process in the meantime
+        if process is not self._process:
+            return False
+        self._process = None
+        self._thread = None
+        process.wait()
+        self._reset()
+        runtime = time.monotonic() - self._started_at
+        logger.warning(
+            f"[AudioVisualizer] Capture stream ended after {runtime:.1f}s "
+            f"(exit code {process.returncode})"
+        )
+        if self._on_ended is not None:
+            self._on_ended(runtime)
+        return False
+
+    def _run(self, process: subprocess.Popen):
+        samples = np.zeros(FFT_SIZE, dtype=np.float32)
+        smoothed = np.zeros(self.bar_count, dtype=np.float32)
+        block_bytes = CAPTURE_BLOCK * 2
+        quiet_blocks = 0
+
+        while process is self._process:
+            data = process.stdout.read(block_bytes)
+            if len(data) < block_bytes:
+                break
+
+            samples[:-CAPTURE_BLOCK] = samples[CAPTURE_BLOCK:]
+            samples[-CAPTURE_BLOCK:] = np.frombuffer(data, dtype="<i2") / 32768.0
+
+            target = band_levels(samples, self._window, self._edges)
+            smoothed += (target - smoothed) * np.where(target > smoothed, ATTACK, DECAY)
+            self.levels = tuple(smoothed.tolist())
+
+            quiet_blocks = quiet_blocks + 1 if smoothed.max() < SILENCE_LEVEL else 0
+            silent = quiet_blocks >= SILENCE_BLOCKS
+            if silent != self.silent:
+                self.silent = silent
+                if self._on_silence_changed is not None:
+                    GLib.idle_add(self._on_silence_changed, silent)
+
+        if process is self._process:
+            process.stdout.close()
+            GLib.idle_add(self._on_stream_ended, process)
+
+
+class AudioVisualizerService:
+    """Emits waveform level data for visualization.
+
+    Visualizer widgets are registered with `attach`. While at least one of
+    them is mapped, a tick callback on its frame clock pushes lists of float
+    levels (0.0–1.0) to every mapped visualizer, at most *fps* times per
+    second. Levels come from a `SpectrumCapture` of the default sink if
+    possible and from smoothed mock data otherwise. The capture runs only
+    while a visualizer is mapped, and ticking pauses while it reports
+    silence.
+    """
+
+    def __init__(self, bar_count: int = 6, fps: int = 50):
         self._bar_count = bar_count
-        self._interval_ms = max(16, int(1000 / fps))
+        self._interval_us = 1_000_000 // fps
         self._time = 0.0
         self._levels: list[float] = [0.0] * bar_count
         self._targets: list[float] = [0.0] * bar_count
         self._velocities: list[float] = [0.0] * bar_count
-        self._source_id: int | None = None
-        self._callbacks: list[Callable[[list[float]], None]] = []
-        if on_levels is not None:
-            self._callbacks.append(on_levels)
-        self._pulse = None
-        if pulsectl is not None:
-            try:
-                self._pulse = pulsectl.Pulse("billpanel-visualizer")
-            except Exception as e:
-                logger.debug(f"[AudioVisualizer] Pulse connection failed: {e}")
+
+        self._widgets: dict[AudioVisualizerWidget, list[int]] = {}
+        self._mapped: list[AudioVisualizerWidget] = []
+        self._clock_widget: AudioVisualizerWidget | None = None
+        self._tick_id = 0
+        self._last_frame_us = 0
+        self._capture_failures = 0
+        self._capture_restart = DeadlineTimer(
+            CAPTURE_RESTART_DELAY_MS, self._restart_capture
+        )
+
+        self._capture: SpectrumCapture | None = None
+        if SpectrumCapture.is_supported():
+            self._capture = SpectrumCapture(
+                bar_count, self._on_silence_changed, self._on_capture_ended
+            )
+        else:
+            logger.debug(
+                "[AudioVisualizer] NumPy or parec unavailable, using simulated levels"
+            )
+
+        self._volume_scale = 1.0
+        self._speaker_handlers = SignalHandlers()
+        self._audio = get_service("audio")
+        self._audio.connect("notify::speaker", self._bind_speaker)
+        self._bind_speaker()
 
     @property
     def bar_count(self) -> int:
         return self._bar_count
 
-    def _get_volume_scale(self) -> float:
-        """Return 0.0–1.0 scale from default sink volume if Pulse is available."""
-        if self._pulse is None:
-            return 1.0
-        try:
-            for sink in self._pulse.sink_list():
-                vol = getattr(sink, "volume", None)
-                if vol is None:
-                    continue
-                values = getattr(vol, "values", None) or getattr(vol, "value_list", None)
-                if values:
-                    total = sum(values) / len(values)
-                    return min(1.0, total / 65536.0)
-            return 1.0
-        except Exception:
-            return 1.0
-
-    def _tick(self) -> bool:
+    @property
+    def ticking(self) -> bool:
+        """Whether level updates are currently being produced."""
+        return bool(self._tick_id)
+
+    # ------------------------------------------------------------------
+    # Widgets
+    # ------------------------------------------------------------------
+
+    def attach(self, widget: "AudioVisualizerWidget") -> None:
+        """Feed *widget* with levels whenever it is mapped."""
+        if widget in self._widgets:
+            return
+        self._widgets[widget] = [
+            widget.connect("map", self._on_widget_mapped),
+            widget.connect("unmap", self._on_widget_unmapped),
+            widget.connect("destroy", self.detach),
+        ]
+        if widget.get_mapped():
+            self._on_widget_mapped(widget)
+
+    def detach(self, widget: "AudioVisualizerWidget") -> None:
+        """Stop feeding *widget*."""
+        handler_ids = self._widgets.pop(widget, None)
+        if handler_ids is None:
+            return
+        for handler_id in handler_ids:
+            widget.disconnect(handler_id)
+        self._on_widget_unmapped(widget)
+
+    def _on_widget_mapped(self, widget: "AudioVisualizerWidget"):
+        if widget not in self._mapped:
+            self._mapped.append(widget)
+        if self._capture is not None:
+            self._capture.start()
+        self._update_ticking()
+
+    def _on_widget_unmapped(self, widget: "AudioVisualizerWidget"):
+        if widget in self._mapped:
+            self._mapped.remove(widget)
+        if widget is self._clock_widget:
+            # Its frame clock stops with it, tick on another visualizer
+            self._stop_ticking()
+        if not self._mapped:
+            self.stop()
+        else:
+            self._update_ticking()
+
+    # ------------------------------------------------------------------
+    # Ticking
+    # ------------------------------------------------------------------
+
+    def _update_ticking(self):
+        silent = self._capture is not None and self._capture.silent
+        if not self._mapped or silent:
+            self._stop_ticking()
+        elif not self._tick_id:
+            self._clock_widget = self._mapped[0]
+            self._tick_id = self._clock_widget.add_tick_callback(self._on_frame)
+
+    def _stop_ticking(self):
+        if self._tick_id:
+            self._clock_widget.remove_tick_callback(self._tick_id)
+        self._tick_id = 0
+        self._clock_widget = None
+
+    def _on_silence_changed(self, silent: bool) -> bool:
+        if silent:
+            # Let the bars settle at zero before pausing
+            self.emit_levels([0.0] * self._bar_count)
+        self._update_ticking()
+        return False
+
+    def _on_capture_ended(self, runtime: float):
+        if runtime >= CAPTURE_STABLE_S:
+            self._capture_failures = 0
+        self._capture_failures += 1
+        if self._capture_failures > CAPTURE_RESTARTS:
+            logger.warning(
+                "[AudioVisualizer] Capture keeps failing, using simulated levels"
+            )
+            self._capture = None
+        elif self._mapped:
+            self._capture_restart.arm()
+        # Resume ticking if the stream ended while silent
+        self._update_ticking()
+
+    def _restart_capture(self):
+        if self._capture is not None and self._mapped:
+            self._capture.start()
+
+    def _on_frame(self, _widget, frame_clock: Gdk.FrameClock) -> bool:
+        now = frame_clock.get_frame_time()
+        # Allow some jitter so 30 FPS on a 60 Hz clock is every other frame
+        if now - self._last_frame_us < self._interval_us - FRAME_SLACK_US:
+            return GLib.SOURCE_CONTINUE
+        self._last_frame_us = now
+
+        if self._capture is not None and self._capture.running:
+            scale = self._volume_scale
+            self.emit_levels([level * scale for level in self._capture.levels])
+        else:
+            self._tick_simulated()
+        return GLib.SOURCE_CONTINUE
+
+    # ------------------------------------------------------------------
+    # Levels
+    # ------------------------------------------------------------------
+
+    def _bind_speaker(self, *_):
+        # Drop the handlers on the previous (or same) speaker stream
+        self._speaker_handlers.disconnect_all()
+        speaker = self._audio.speaker
+        if speaker is not None:
+            self._speaker_handlers.connect(
+                speaker, "notify::volume", self._update_volume_scale
+            )
+            self._speaker_handlers.connect(
+                speaker, "notify::muted", self._update_volume_scale
+            )
+        self._update_volume_scale()
+
+    def _update_volume_scale(self, *_):
+        """Cache the 0.0–1.0 volume scale of the default speaker."""
+        speaker = self._audio.speaker
+        if speaker is None:
+            self._volume_scale = 1.0
+        elif speaker.muted:
+            self._volume_scale = 0.0
+        else:
+            self._volume_scale = min(1.0, speaker.volume / 100.0)
+
+    def _tick_simulated(self):
         """Advance waveform with bouncy spring-like animation."""
-        self._time += self._interval_ms / 1000.0
-        scale = self._get_volume_scale()
+        self._time += self._interval_us / 1_000_000
+        scale = self._volume_scale
 
         stiffness = 0.35
         damping = 0.55
@@ -96,54 +442,27 @@ class AudioVisualizerService:
             self._levels[i] = max(0.0, min(1.0, self._levels[i]))
 
         self.emit_levels(self._levels)
-        return True
-
-    def set_callback(self, callback: Callable[[list[float]], None] | None) -> None:
-        """Add or remove callback invoked with list of bar levels (0.0–1.0).
-
-        Each frame the callback is called with the current bar levels.
-        """
-        if callback is None:
-            return
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
-
-    def remove_callback(self, callback: Callable[[list[float]], None] | None) -> None:
-        """Remove a previously registered callback."""
-        if callback is not None and callback in self._callbacks:
-            self._callbacks.remove(callback)
 
     def emit_levels(self, levels: list[float]) -> None:
-        """Notify all registered callbacks with current levels."""
-        for callback in self._callbacks:
+        """Pass the current levels to every mapped visualizer."""
+        for widget in self._mapped:
             try:
-                callback(levels)
+                widget.set_levels(levels)
             except Exception as e:
-                logger.debug(f"[AudioVisualizer] Callback error: {e}")
-
-    def start(self) -> None:
-        """Start emitting level updates."""
-        if self._source_id is not None:
-            return
-        self._source_id = GLib.timeout_add(
-            self._interval_ms,
-            self._tick,
-            priority=GLib.PRIORITY_DEFAULT,
-        )
+                logger.debug(f"[AudioVisualizer] Visualizer update error: {e}")
 
     def stop(self) -> None:
-        """Stop emitting level updates."""
-        if self._source_id is not None:
-            GLib.source_remove(self._source_id)
-            self._source_id = None
+        """Stop the updates and the audio capture."""
+        self._stop_ticking()
+        self._capture_restart.cancel()
+        if self._capture is not None:
+            self._capture.stop()
         self._levels = [0.0] * self._bar_count
         self._targets = [0.0] * self._bar_count
         self._velocities = [0.0] * self._bar_count
 
     def close(self) -> None:
-        """Release Pulse connection if any."""
+        """Detach every visualizer and stop the audio capture."""
+        for widget in list(self._widgets):
+            self.detach(widget)
         self.stop()
-        if self._pulse is not None:
-            with contextlib.suppress(Exception):
-                self._pulse.close()
-            self._pulse = None
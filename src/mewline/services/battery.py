@@ -1,7 +1,6 @@
+from typing import Any
 from typing import Literal
 
-import dbus
-from dbus.mainloop.glib import DBusGMainLoop
 from fabric import Service
 from fabric import Signal
 from gi.repository import Gio
@@ -11,14 +10,37 @@ from loguru import logger
 from mewline import constants as cnst
 from mewline.shared.dbus_helper import GioDBusHelper
 
+BatteryProperty = Literal[
+    "Percentage",
+    "Temperature",
+    "TimeToEmpty",
+    "TimeToFull",
+    "IconName",
+    "State",
+    "Capacity",
+    "IsPresent",
+]
+
 
 class BatteryService(Service):
-    """Service to interact with the PowerProfiles service."""
+    """Cached model of the UPower display device.
+
+    All properties are loaded with a single ``GetAll`` when the proxy is
+    created, and the payload of every ``PropertiesChanged`` signal is applied
+    to the local copy, so reading a property never talks to D-Bus.
+    ``property-changed`` is emitted for each property whose value changed,
+    followed by one ``changed`` per update. The proxy is created
+    asynchronously; ``changed`` is also emitted once it has loaded.
+    """
 
     @Signal
     def changed(self) -> None:
         """Signal emitted when battery changes."""
 
+    @Signal
+    def property_changed(self, name: str) -> None:
+        """Signal emitted with the name of each battery property that changed."""
+
     instance = None
 
     @staticmethod
@@ -38,43 +60,41 @@ class BatteryService(Service):
 
         self.bus_name = "org.freedesktop.UPower"
         self.object_path = "/org/freedesktop/UPower/devices/DisplayDevice"
+        self.interface_name = "org.freedesktop.UPower.Device"
+        self.properties: dict[str, Any] = {}
 
-        # Set up the dbus main loop
-        DBusGMainLoop(set_as_default=True)
-
-        self.bus = dbus.SystemBus()
-
-        self.power_profiles_obj = self.bus.get_object(self.bus_name, self.object_path)
-
-        self.iface = dbus.Interface(
-            self.power_profiles_obj, "org.freedesktop.DBus.Properties"
+        # The proxy fetches every property with one GetAll call
+        self.dbus_helper = GioDBusHelper(
+            bus_type=Gio.BusType.SYSTEM,
+            bus_name=self.bus_name,
+            object_path=self.object_path,
+            interface_name=self.interface_name,
+            on_ready=self._on_proxy_ready,
         )
 
-        # Connect the 'g-properties-changed' signal to the handler
-        self.iface.connect_to_signal("PropertiesChanged", self.handle_property_change)
+    def _on_proxy_ready(self, helper: GioDBusHelper):
+        proxy = helper.proxy
+        for name in proxy.get_cached_property_names() or []:
+            self.properties[name] = proxy.get_cached_property(name).unpack()
 
-    def get_property(
-        self,
-        property: Literal[
-            "Percentage",
-            "Temperature",
-            "TimeToEmpty",
-            "TimeToFull",
-            "IconName",
-            "State",
-            "Capacity",
-            "IsPresent",
-        ],
-    ):
-        try:
-            return self.iface.Get("org.freedesktop.UPower.Device", property)
+        proxy.connect("g-properties-changed", self.handle_property_change)
+        self.emit("changed")
 
-        except dbus.DBusException as e:
-            logger.error(f"[Battery] Error retrieving info: {e}")
+    def get_property(self, property: BatteryProperty):
+        """Return the cached value of a UPower device property."""
+        return self.properties.get(property)
 
-    # Function to handle properties change signals
-    def handle_property_change(self, *_):
-        self.emit("changed")
+    def handle_property_change(self, _proxy, changed, _invalidated):
+        """Apply the changed properties carried by the signal."""
+        updated = False
+        for name, value in changed.unpack().items():
+            if self.properties.get(name) == value:
+                continue
+            self.properties[name] = value
+            updated = True
+            self.emit("property-changed", name)
+        if updated:
+            self.emit("changed")
 
 
 class PowerProfiles(Service):
@@ -120,9 +140,6 @@ class PowerProfiles(Service):
             interface_name=self.interface_name,
         )
 
-        self.bus = self.dbus_helper.bus
-        self.proxy = self.dbus_helper.proxy
-
         # Listen for PropertiesChanged signals
         self.dbus_helper.listen_signal(
             sender=self.bus_name,
@@ -134,26 +151,31 @@ class PowerProfiles(Service):
 
     def get_current_profile(self):
         try:
-            value = self.proxy.get_cached_property("ActiveProfile")
+            proxy = self.dbus_helper.proxy
+            value = proxy.get_cached_property("ActiveProfile") if proxy else None
             return value.unpack().strip() if value else "balanced"
         except Exception as e:
             logger.error(f"[PowerProfile] Error retrieving current power profile: {e}")
             return "balanced"
 
     def set_power_profile(self, profile: str):
-        try:
-            self.dbus_helper.set_property(
-                self.bus_name,
-                self.object_path,
-                self.interface_name,
-                "ActiveProfile",
-                GLib.Variant("s", profile),
-            )
-            logger.info(f"[PowerProfile] Power profile set to {profile}")
-        except Exception as e:
-            logger.error(
-                f"[PowerProfile] Could not change power level to {profile}: {e}"
-            )
+        def on_set(_result, error):
+            if error is None:
+                logger.info(f"[PowerProfile] Power profile set to {profile}")
+            else:
+                logger.error(
+                    f"[PowerProfile] Could not change power level to {profile}: "
+                    f"{error.message}"
+                )
+
+        self.dbus_helper.set_property(
+            self.bus_name,
+            self.object_path,
+            self.interface_name,
+            "ActiveProfile",
+            GLib.Variant("s", profile),
+            callback=on_set,
+        )
 
     def handle_property_change(self, *_args):
         """Callback for property change signals.
@@ -1,6 +1,10 @@
+import json
 import os
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from fabric.core.service import Property
@@ -8,10 +12,36 @@ from fabric.core.service import Service
 from fabric.core.service import Signal
 from fabric.utils import exec_shell_command_async
 from fabric.utils import monitor_file
+from gi.repository import Gdk
+from gi.repository import Gio
 from gi.repository import GLib
 from loguru import logger
 
+from mewline import constants as cnst
+from mewline.config import cfg
+from mewline.shared.dbus_helper import get_bus
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.misc import executable_exists
+from mewline.utils.window_manager import create_monitor_manager
+
+# DDC displays are driven on a virtual 0..DDC_SCALE scale and every display
+# is mapped to its own maximum, so monitors with different ranges stay in sync
+DDC_SCALE = 100
+# Delay before re-probing DDC/CI after a monitor hot-plug
+DDC_REDETECT_DELAY_MS = 2000
+# Failed writes are retried this many times unless a newer value is queued
+DDC_WRITE_RETRIES = 1
+# The displays picked by begin_interaction() stay the target until the
+# brightness has not been touched for this long
+TARGET_HOLD_MS = 2000
+
+LOGIND_BUS_NAME = "org.freedesktop.login1"
+# logind resolves "auto" to the session of the calling process
+LOGIND_SESSION_PATH = "/org/freedesktop/login1/session/auto"
+LOGIND_SESSION_INTERFACE = "org.freedesktop.login1.Session"
+
+_DDC_BUS_RE = re.compile(r"/dev/i2c-(\d+)")
+_DDC_CONNECTOR_RE = re.compile(r"DRM[ _]connector:\s*(?:card\d+-)?(\S+)")
 
 
 def get_device(path: Path):
@@ -23,36 +53,260 @@ def get_device(path: Path):
     return ""
 
 
+@dataclass
+class DdcDisplay:
+    """A monitor that accepts DDC/CI brightness commands."""
+
+    bus: str
+    # DRM connector name (e.g. "DP-1"), which is also the Hyprland and
+    # GDK plug name of the monitor; empty if ddcutil does not report it
+    name: str
+    current: int
+    max: int
+
+    def to_scale(self) -> int:
+        return round(self.current * DDC_SCALE / self.max) if self.max > 0 else 0
+
+    def from_scale(self, value: int) -> int:
+        return round(value * self.max / DDC_SCALE)
+
+
+class DdcWriteQueue:
+    """Latest-value-wins queue of DDC/CI brightness writes.
+
+    A ``setvcp`` takes 100 ms or more and the I2C bus serves one request at
+    a time, so at most one write per bus is in flight. Values submitted
+    meanwhile replace each other and only the newest one is written once
+    the bus is free, which guarantees the last requested value is applied
+    last. Counters of submitted, written, coalesced and failed writes are
+    available in `stats`.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, int] = {}
+        self._pending: dict[str, int] = {}
+        self._retries: dict[str, int] = {}
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
+
+    def submit(self, bus: str, value: int):
+        """Write *value* to the display on *bus* as soon as the bus is free."""
+        self.submitted += 1
+        if bus not in self._in_flight:
+            self._start(bus, value)
+            return
+        if bus in self._pending:
+            self.coalesced += 1
+        self._pending[bus] = value
+
+    def _start(self, bus: str, value: int):
+        try:
+            process = Gio.Subprocess.new(
+                ["ddcutil", "-b", bus, "setvcp", "10", str(value)],
+                Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE,
+            )
+        except GLib.Error as e:
+            self.failed += 1
+            logger.error(f"Error setting ddcutil brightness: {e.message}")
+            return
+        self._in_flight[bus] = value
+        process.wait_check_async(None, self._on_written, bus)
+
+    def _on_written(self, process: Gio.Subprocess, result, bus: str):
+        value = self._in_flight.pop(bus)
+        try:
+            process.wait_check_finish(result)
+            self.written += 1
+            self._retries.pop(bus, None)
+        except GLib.Error as e:
+            self.failed += 1
+            logger.warning(
+                f"ddcutil failed to set brightness {value} on i2c-{bus}: {e.message}"
+            )
+            retries = self._retries.pop(bus, 0)
+            if bus not in self._pending and retries < DDC_WRITE_RETRIES:
+                self._retries[bus] = retries + 1
+                self._pending[bus] = value
+
+        pending = self._pending.pop(bus, None)
+        if pending is None:
+            logger.debug(f"[DdcWriteQueue] i2c-{bus} idle, {self.stats}")
+        elif pending == value and bus not in self._retries:
+            # Already applied by the write that just finished
+            self.coalesced += 1
+        else:
+            self._start(bus, pending)
+
+
+def _frame_interval_ms() -> int:
+    """Frame time of the fastest connected monitor, 60 Hz if unknown."""
+    refresh_mhz = 0
+    display = Gdk.Display.get_default()
+    if display is not None:
+        for i in range(display.get_n_monitors()):
+            refresh_mhz = max(refresh_mhz, display.get_monitor(i).get_refresh_rate())
+    return max(1, round(1_000_000 / (refresh_mhz or 60_000)))
+
+
+class LogindBacklight:
+    """Writes a sysfs backlight through logind instead of spawning processes.
+
+    ``org.freedesktop.login1.Session.SetBrightness`` lets the owner of the
+    active session change the backlight without root and without forking
+    `brightnessctl`. At most one call is in flight and writes are limited to
+    one per frame of the fastest monitor; values arriving in between replace
+    each other, so the last one is always applied. If logind refuses the
+    call (e.g. no session or an old systemd), `brightnessctl` is used instead.
+
+    Args:
+        device: Name of the device in /sys/class/backlight.
+    """
+
+    def __init__(self, device: str):
+        self.device = device
+        self._interval_ms = _frame_interval_ms()
+        self._has_brightnessctl = executable_exists("brightnessctl")
+        self._pending: int | None = None
+        self._in_flight = False
+        self._throttle_id = 0
+        self._bus: Gio.DBusConnection | None = None
+        self._use_logind = True
+        get_bus(Gio.BusType.SYSTEM, self._on_bus)
+
+    def _on_bus(self, bus: Gio.DBusConnection | None):
+        self._bus = bus
+        if bus is None:
+            self._use_logind = False
+        self._flush()
+
+    def set(self, value: int):
+        """Set the raw backlight level, coalescing bursts of changes."""
+        self._pending = value
+        self._flush()
+
+    def _flush(self):
+        if self._pending is None or self._in_flight or self._throttle_id:
+            return
+        value, self._pending = self._pending, None
+        self._throttle_id = GLib.timeout_add(self._interval_ms, self._on_throttled)
+        self._write(value)
+
+    def _on_throttled(self) -> bool:
+        self._throttle_id = 0
+        self._flush()
+        return False
+
+    def _write(self, value: int):
+        if not self._use_logind:
+            self._write_brightnessctl(value)
+            return
+        if self._bus is None:
+            # Still connecting to the system bus
+            self._pending = value
+            return
+        self._in_flight = True
+        self._bus.call(
+            LOGIND_BUS_NAME,
+            LOGIND_SESSION_PATH,
+            LOGIND_SESSION_INTERFACE,
+            "SetBrightness",
+            GLib.Variant("(ssu)", ("backlight", self.device, value)),
+            None,
+            Gio.DBusCallFlags.NONE,
+            1000,
+            None,
+            self._on_written,
+            value,
+        )
+
+    def _on_written(self, bus: Gio.DBusConnection, result, value: int):
+        self._in_flight = False
+        try:
+            bus.call_finish(result)
+        except GLib.Error as e:
+            logger.warning(
+                f"[LogindBacklight] SetBrightness failed ({e.message}), "
+                "falling back to brightnessctl"
+            )
+            self._use_logind = False
+            self._write_brightnessctl(value)
+        self._flush()
+
+    def _write_brightnessctl(self, value: int):
+        if not self._has_brightnessctl:
+            logger.error("Command brightnessctl not found")
+            return
+        try:
+            exec_shell_command_async(
+                f"brightnessctl --device '{self.device}' set {value}"
+            )
+        except GLib.Error as e:
+            logger.error(f"Error setting screen brightness: {e.message}")
+
+
 class BrightnessService(Service):
     """Service to manage screen brightness levels.
 
     Supports two backends:
-    - brightnessctl — for laptops / internal screens (backlight devices in
-      /sys/class/backlight). Changes are detected via a file monitor so the
-      UI stays in sync automatically.
+    - backlight — for laptops / internal screens (devices in
+      /sys/class/backlight), written through logind by `LogindBacklight`
+      with brightnessctl as fallback. Changes are detected via a file
+      monitor so the UI stays in sync automatically.
     - ddcutil — for external / desktop monitors that speak DDC/CI over I2C.
-      The first detected I2C bus is used. The brightness value (VCP 0x10) is
-      cached locally so reads are instant; writes are sent asynchronously so
-      the UI never freezes while waiting for the (slow) monitor response.
+      Every DDC/CI-capable display is used and mapped to its monitor name.
+      The brightness value (VCP 0x10) of each display is cached locally so
+      reads are instant; writes to the displays are sent asynchronously and
+      in parallel so the UI never freezes while waiting for the (slow)
+      monitor responses, and bursts of writes (slider drags, scrolling) are
+      coalesced per display by a `DdcWriteQueue`. Depending on
+      `options.brightness_target` changes apply to all displays or only to
+      the one under the pointer.
+
+    Probing DDC/CI takes seconds, so it runs in a background thread and
+    `available` is notified once a backend is usable. The detected displays
+    and levels are persisted in the cache directory: on the next start they
+    are used right away while the probe revalidates them in the background.
+    The probe is repeated when monitors are plugged or unplugged.
     """
 
     # ------------------------------------------------------------------
     # DDC helpers
     # ------------------------------------------------------------------
 
-    def _ddc_detect_bus(self) -> str:
-        """Return the first I2C bus number (e.g. '6') found by ddcutil, or ''."""
+    def _ddc_detect_displays(self) -> list[tuple[str, str]]:
+        """Return ``(bus, connector)`` for every display found by ddcutil."""
         try:
             out = subprocess.check_output(
                 ["ddcutil", "detect", "--brief"],
                 text=True,
                 stderr=subprocess.DEVNULL,
-                timeout=3,
+                timeout=5,
             )
         except Exception:
-            return ""
-        m = re.search(r"/dev/i2c-(\d+)", out)
-        return m.group(1) if m else ""
+            return []
+
+        displays = []
+        # Blocks start with "Display N"; "Invalid display" blocks are skipped
+        for block in re.split(r"\n(?=\S)", out):
+            if not block.startswith("Display"):
+                continue
+            bus = _DDC_BUS_RE.search(block)
+            if not bus:
+                continue
+            connector = _DDC_CONNECTOR_RE.search(block)
+            displays.append((bus.group(1), connector.group(1) if connector else ""))
+        return displays
 
     def _ddc_get_brightness(self, bus: str) -> tuple[int, int]:
         """Return (current, max) brightness from `ddcutil -b BUS getvcp 10 --brief`.
@@ -81,9 +335,15 @@ class BrightnessService(Service):
         super().__init__(**kwargs)
 
         self.is_ddc: bool = False
-        self.ddc_bus: str = ""
-        self._ddc_cached_brightness: int = 0
+        self.ddc_displays: dict[str, DdcDisplay] = {}
+        self._ddc_writes: int = 0
+        self.ddc_write_queue = DdcWriteQueue()
+        self._ddc_detecting = False
+        self._ddc_redetect_id = 0
+        self._targets: list[DdcDisplay] | None = None
+        self._targets_expiry = DeadlineTimer(TARGET_HOLD_MS, self._drop_targets)
         self.max_brightness_level: int = -1
+        self._available = False
 
         self.base_blacklight_path = Path("/sys/class/backlight")
         self.screen_device = get_device(self.base_blacklight_path)
@@ -96,6 +356,7 @@ class BrightnessService(Service):
             self.max_brightness_level = self.do_read_max_brightness(
                 self.screen_backlight_path
             )
+            self.backlight = LogindBacklight(self.screen_device)
 
             self.screen_monitor = monitor_file(
                 str(self.screen_backlight_path / "brightness")
@@ -108,37 +369,209 @@ class BrightnessService(Service):
                 ),
             )
 
+            self._available = True
             logger.info(
                 f"Brightness service initialised for backlight device: {self.screen_device}"
             )
             return
 
-        # --- Path 2: external monitor via DDC/CI (desktop) -----------
-        if executable_exists("ddcutil"):
-            bus = self._ddc_detect_bus()
-            if bus:
-                cur, mx = self._ddc_get_brightness(bus)
-                self.is_ddc = True
-                self.ddc_bus = bus
-                self._ddc_cached_brightness = cur
-                self.max_brightness_level = mx if mx > 0 else 100
-                logger.info(
-                    f"Brightness service initialised via ddcutil (i2c-{bus}), "
-                    f"current={cur}, max={self.max_brightness_level}"
+        # --- Path 2: external monitors via DDC/CI (desktop) ----------
+        self._load_ddc_cache()
+        self._start_ddc_detection()
+
+        display = Gdk.Display.get_default()
+        if display is not None:
+            display.connect("monitor-added", self._queue_ddc_detection)
+            display.connect("monitor-removed", self._queue_ddc_detection)
+
+    @Property(bool, "readable", default_value=False)
+    def available(self) -> bool:
+        """Whether a brightness backend has been found and can be used."""
+        return self._available
+
+    # ------------------------------------------------------------------
+    # DDC detection (background) and cache
+    # ------------------------------------------------------------------
+
+    def _load_ddc_cache(self):
+        """Use the DDC/CI displays found on the previous start, if any."""
+        try:
+            with open(cnst.BRIGHTNESS_CACHE_FILE) as f:
+                displays = [
+                    DdcDisplay(
+                        str(d["bus"]), str(d["name"]), int(d["current"]), int(d["max"])
+                    )
+                    for d in json.load(f)["displays"]
+                ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        displays = [d for d in displays if d.bus and d.max > 0]
+        if displays:
+            self._set_ddc_displays(displays)
+            logger.info(
+                f"Brightness service restored {len(displays)} ddcutil display(s) "
+                "from cache"
+            )
+
+    def _write_ddc_cache(self):
+        try:
+            cnst.BRIGHTNESS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cnst.BRIGHTNESS_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "displays": [
+                            {
+                                "bus": d.bus,
+                                "name": d.name,
+                                "current": d.current,
+                                "max": d.max,
+                            }
+                            for d in self.ddc_displays.values()
+                        ]
+                    },
+                    f,
                 )
-                return
-            else:
-                logger.warning(
-                    "ddcutil is installed but no DDC/CI-capable monitors were found."
+            os.replace(tmp_path, cnst.BRIGHTNESS_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"Failed to write brightness cache: {e}")
+
+    def _set_ddc_displays(self, displays: list[DdcDisplay]):
+        self.is_ddc = True
+        self.ddc_displays = {d.bus: d for d in displays}
+        self._drop_targets()
+        self.max_brightness_level = DDC_SCALE
+        if not self._available:
+            self._available = True
+            self.notify("available")
+
+    def _queue_ddc_detection(self, *_):
+        if self._ddc_redetect_id:
+            GLib.source_remove(self._ddc_redetect_id)
+        self._ddc_redetect_id = GLib.timeout_add(
+            DDC_REDETECT_DELAY_MS, self._on_redetect_timeout
+        )
+
+    def _on_redetect_timeout(self) -> bool:
+        self._ddc_redetect_id = 0
+        self._start_ddc_detection()
+        return False
+
+    def _start_ddc_detection(self):
+        if self._ddc_detecting:
+            # Probe again once the running one has finished
+            self._queue_ddc_detection()
+            return
+        self._ddc_detecting = True
+        threading.Thread(
+            target=self._detect_ddc,
+            args=(self._ddc_writes,),
+            daemon=True,
+            name="brightness-detect",
+        ).start()
+
+    def _detect_ddc(self, writes: int):
+        """Probe ddcutil off the main loop (runs in a worker thread)."""
+        if not executable_exists("ddcutil"):
+            GLib.idle_add(self._on_ddc_detected, None, writes)
+            return
+
+        found = self._ddc_detect_displays()
+        displays = []
+        if found:
+            # Every display answers on its own bus, so query them in parallel
+            with ThreadPoolExecutor(max_workers=len(found)) as executor:
+                levels = executor.map(
+                    self._ddc_get_brightness, [bus for bus, _ in found]
                 )
-        else:
-            logger.warning("ddcutil is not installed — DDC/CI brightness unavailable.")
+                displays = [
+                    DdcDisplay(bus, name, cur, mx if mx > 0 else 100)
+                    for (bus, name), (cur, mx) in zip(found, levels, strict=True)
+                ]
+        GLib.idle_add(self._on_ddc_detected, displays, writes)
+
+    def _on_ddc_detected(self, displays: list[DdcDisplay] | None, writes: int):
+        self._ddc_detecting = False
+        if displays:
+            if writes != self._ddc_writes:
+                # The user changed the brightness while the probe was running
+                for display in displays:
+                    if known := self.ddc_displays.get(display.bus):
+                        display.current = known.current
+            self._set_ddc_displays(displays)
+            self._write_ddc_cache()
+            for d in displays:
+                logger.info(
+                    f"Brightness service initialised via ddcutil "
+                    f"(i2c-{d.bus}, {d.name or 'unknown output'}), "
+                    f"current={d.current}, max={d.max}"
+                )
+            return False
 
+        if displays is None:
+            logger.warning("ddcutil is not installed — DDC/CI brightness unavailable.")
+        else:
+            logger.warning(
+                "ddcutil is installed but no DDC/CI-capable monitors were found."
+            )
         logger.warning(
             "No backlight device and no DDC/CI monitor detected. "
             "Brightness control will be unavailable."
         )
 
+        # The cached displays are gone
+        cnst.BRIGHTNESS_CACHE_FILE.unlink(missing_ok=True)
+        if self._available:
+            self.is_ddc = False
+            self.ddc_displays = {}
+            self._drop_targets()
+            self.max_brightness_level = -1
+            self._available = False
+            self.notify("available")
+        return False
+
+    def begin_interaction(self):
+        """Pick the displays that the brightness gesture starting now targets.
+
+        Call this when the user starts changing the brightness (slider drag,
+        scroll, key press). With ``options.brightness_target == "cursor"``
+        the monitor under the pointer is looked up once, which may spawn a
+        process or do an IPC round-trip, and is kept as the target until the
+        brightness has been left alone for `TARGET_HOLD_MS`. Calls during
+        that time only extend it.
+        """
+        if self._targets is None:
+            self._targets = self._resolve_targets()
+        self._targets_expiry.arm()
+
+    def _drop_targets(self):
+        self._targets_expiry.cancel()
+        self._targets = None
+
+    def _resolve_targets(self) -> list[DdcDisplay]:
+        displays = list(self.ddc_displays.values())
+        if cfg.options.brightness_target == "cursor" and len(displays) > 1:
+            try:
+                name = create_monitor_manager().get_cursor_monitor_name()
+            except Exception:
+                name = None
+            matching = [d for d in displays if name and d.name == name]
+            if matching:
+                return matching
+        return displays
+
+    def target_displays(self) -> list[DdcDisplay]:
+        """DDC displays that brightness changes currently apply to.
+
+        These are the displays picked by the last `begin_interaction`, or all
+        displays outside of an interaction; with the ``"cursor"`` target the
+        display under the pointer is used, falling back to all displays when
+        the pointer is on a monitor without DDC/CI. Never blocks.
+        """
+        if self._targets is not None:
+            return self._targets
+        return list(self.ddc_displays.values())
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -160,7 +593,8 @@ class BrightnessService(Service):
         """Property to get or set the screen brightness."""
         if self.is_ddc:
             # Reads from DDC are slow (~100 ms), so return the cached value.
-            return self._ddc_cached_brightness
+            displays = self.target_displays()
+            return displays[0].to_scale() if displays else 0
 
         # Check if we have a backlight device at all
         if not hasattr(self, "screen_backlight_path"):
@@ -179,43 +613,26 @@ class BrightnessService(Service):
         """Setter for screen brightness property."""
         value = max(0, min(value, self.max_brightness_level))
 
-        # --- DDC/CI path (external monitor) --------------------------
-        if self.is_ddc and self.ddc_bus:
-            self._ddc_cached_brightness = value
+        # --- DDC/CI path (external monitors) -------------------------
+        if self.is_ddc and self.ddc_displays:
+            self._ddc_writes += 1
             # Update the UI percentage immediately (don't wait for hardware)
-            if self.max_brightness_level > 0:
-                self.emit(
-                    "screen",
-                    int((value / self.max_brightness_level) * 100),
-                )
-            try:
-                exec_shell_command_async(
-                    f"ddcutil -b {self.ddc_bus} setvcp 10 {value}"
-                )
-            except GLib.Error as e:
-                logger.error(f"Error setting ddcutil brightness: {e.message}")
-            except Exception as e:
-                logger.exception(f"Unexpected error setting ddcutil brightness: {e}")
+            self.emit("screen", value)
+            # Buses are independent, so the displays are written in parallel
+            for display in self.target_displays():
+                display.current = display.from_scale(value)
+                self.ddc_write_queue.submit(display.bus, display.current)
             return
 
-        # --- brightnessctl path (laptop) -----------------------------
+        # --- backlight path (laptop) ---------------------------------
         # Check if we have a backlight device
         if not self.screen_device or not hasattr(self, "screen_backlight_path"):
             logger.debug("No backlight device available, cannot set brightness")
             return
 
         try:
-            if not executable_exists("brightnessctl"):
-                logger.error("Command brightnessctl not found")
-                return
-
-            exec_shell_command_async(
-                f"brightnessctl --device '{self.screen_device}' set {value}"
-            )
-
+            self.backlight.set(value)
             self.emit("screen", int((value / self.max_brightness_level) * 100))
-        except GLib.Error as e:
-            logger.error(f"Error setting screen brightness: {e.message}")
         except Exception as e:
             logger.exception(f"Unexpected error setting screen brightness: {e}")
 
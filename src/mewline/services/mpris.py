@@ -75,10 +75,15 @@ class MprisPlayer(Service):
         self.notify(name)
         self.emit("changed")  # type: ignore
 
-    def on_player_exit(self, player):
+    def close(self):
+        """Stop following the player, e.g. when the widget showing it is gone."""
         for id in self._signal_connectors.values():
             with contextlib.suppress(Exception):
                 self._player.disconnect(id)
+        self._signal_connectors.clear()
+
+    def on_player_exit(self, player):
+        self.close()
         del self._player
         self.emit("exit", True)  # type: ignore
         # TODO check if this is needed
@@ -1,14 +1,130 @@
+"""Value animations driven by the GDK frame clock.
+
+Every playing `Animator` is registered with the shared `animation_scheduler`,
+which connects once to the frame clock of each window that has running
+animations and advances all of them together in the clock's update phase.
+Frames therefore follow the refresh rate of the monitor the window is on,
+and once the last animation of a window finishes the scheduler stops
+requesting frames, so idle windows cause no wakeups at all.
+"""
+
 from typing import cast
 
 from fabric import Property
 from fabric import Service
 from fabric import Signal
+from gi.repository import Gdk
 from gi.repository import GLib
 from gi.repository import Gtk
+from loguru import logger
+
+# Refresh interval assumed until the frame clock reports one (60 Hz)
+DEFAULT_REFRESH_INTERVAL_US = 16667
+# A frame arriving later than this many refresh intervals after the previous
+# one means at least one frame was dropped
+OVERRUN_FACTOR = 1.5
+
+
+class _FrameClockDriver:
+    """Advances the animators of a single frame clock."""
+
+    def __init__(self, scheduler: "AnimationScheduler", clock: Gdk.FrameClock):
+        self.scheduler = scheduler
+        self.clock = clock
+        self.animators: list[Animator] = []
+        self._last_frame_us = 0
+        self._handler_id = clock.connect("update", self._on_update)
+        clock.begin_updating()
+
+    def close(self):
+        self.clock.end_updating()
+        self.clock.disconnect(self._handler_id)
+
+    def _refresh_interval_us(self) -> int:
+        timings = self.clock.get_current_timings()
+        interval = timings.get_refresh_interval() if timings else 0
+        return interval or DEFAULT_REFRESH_INTERVAL_US
+
+    def _on_update(self, clock: Gdk.FrameClock):
+        now = clock.get_frame_time()
+        if self._last_frame_us:
+            gap = now - self._last_frame_us
+            if gap > self._refresh_interval_us() * OVERRUN_FACTOR:
+                self.scheduler.frame_overruns += 1
+        self._last_frame_us = now
+        self.scheduler.frames += 1
+
+        frame_time = now / 1_000_000
+        # Animators that finish remove themselves while we iterate
+        for animator in tuple(self.animators):
+            try:
+                animator.do_update_value(frame_time)
+            except Exception as e:
+                logger.error(f"[AnimationScheduler] Animation update failed: {e}")
+                animator.pause()
+
+
+class AnimationScheduler:
+    """Batches the updates of all playing animators per frame.
+
+    Animators are grouped by the frame clock of their tick widget. A clock
+    is only asked for frames while at least one of its animators is playing.
+    Counters for the frames processed and the frames that arrived late
+    (`frame_overruns`) are summarised by `stats`.
+    """
+
+    def __init__(self):
+        self._drivers: dict[Gdk.FrameClock, _FrameClockDriver] = {}
+        self._clock_of: dict[Animator, Gdk.FrameClock] = {}
+        self.frames = 0
+        self.frame_overruns = 0
+
+    @property
+    def active_animations(self) -> int:
+        return len(self._clock_of)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "active_animations": self.active_animations,
+            "frame_clocks": len(self._drivers),
+            "frames": self.frames,
+            "frame_overruns": self.frame_overruns,
+        }
+
+    def add(self, animator: "Animator", clock: Gdk.FrameClock):
+        """Advance *animator* on every frame of *clock* until it is removed."""
+        if self._clock_of.get(animator) is clock:
+            return
+        self.remove(animator)
+        driver = self._drivers.get(clock)
+        if driver is None:
+            driver = self._drivers[clock] = _FrameClockDriver(self, clock)
+        driver.animators.append(animator)
+        self._clock_of[animator] = clock
+
+    def remove(self, animator: "Animator"):
+        """Stop advancing *animator*, releasing its clock if it was the last."""
+        clock = self._clock_of.pop(animator, None)
+        if clock is None:
+            return
+        driver = self._drivers[clock]
+        driver.animators.remove(animator)
+        if not driver.animators:
+            del self._drivers[clock]
+            driver.close()
+
+
+animation_scheduler = AnimationScheduler()
 
 
 class Animator(Service):
-    """A service to animate transitions between values."""
+    """A service to animate transitions between values.
+
+    The value is advanced by `animation_scheduler` on the frame clock of
+    *tick_widget*. Without a realized tick widget nothing would ever be
+    drawn, so `play` jumps straight to `max_value` instead.
+    """
 
     @Signal
     def finished(self) -> None: ...
@@ -88,9 +204,10 @@ class Animator(Service):
 
         self.playing = False
         self._start_time = None
-        self._tick_handler = None
         self._timeline_pos = 0
         self._tick_widget = tick_widget
+        if tick_widget is not None:
+            tick_widget.connect("unrealize", lambda *_: self.do_skip_to_end())
 
     def do_get_time_now(self):
         return GLib.get_monotonic_time() / 1_000_000
@@ -120,7 +237,7 @@ class Animator(Service):
 
         elapsed_time = delta_time - cast(float, self._start_time)
 
-        self._timeline_pos = min(1, elapsed_time / self.duration)
+        self._timeline_pos = min(1, max(0, elapsed_time / self.duration))
 
         self.value = self.do_ease(self._timeline_pos)
 
@@ -137,43 +254,36 @@ class Animator(Service):
         self._timeline_pos = 0
         return
 
-    def do_handle_tick(self, *_):
-        current_time = self.do_get_time_now()
-        self.do_update_value(current_time)
-        return True
+    def do_get_frame_clock(self) -> Gdk.FrameClock | None:
+        if self._tick_widget is None:
+            return None
+        return self._tick_widget.get_frame_clock()
 
-    def do_remove_tick_handlers(self):
-        if self._tick_handler:
-            if self._tick_widget:
-                self._tick_widget.remove_tick_callback(self._tick_handler)
-            else:
-                GLib.source_remove(self._tick_handler)
-        self._tick_handler = None
+    def do_skip_to_end(self):
+        if not self.playing:
+            return
+        self.value = self.max_value
+        self.pause()
 
     def play(self):
         if self.playing:
             return
 
-        self._start_time = self.do_get_time_now()
-
-        if not self._tick_handler:
-            if self._tick_widget:
-                self._tick_handler = self._tick_widget.add_tick_callback(
-                    self.do_handle_tick,
-                )
-            else:
-                self._tick_handler = GLib.timeout_add(16, self.do_handle_tick)
+        clock = self.do_get_frame_clock()
+        if clock is None:
+            self.value = self.max_value
+            self.finished()
+            return
 
+        self._start_time = self.do_get_time_now()
+        animation_scheduler.add(self, clock)
         self.playing = True
         return
 
     def pause(self):
         self.playing = False
-        return self.do_remove_tick_handlers()
+        animation_scheduler.remove(self)
 
     def stop(self):
-        if not self._tick_handler:
-            self._timeline_pos = 0
-            self.playing = False
-            return None
-        return self.do_remove_tick_handlers()
+        self._timeline_pos = 0
+        self.pause()
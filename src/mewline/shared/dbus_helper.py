@@ -1,9 +1,69 @@
+"""Asynchronous D-Bus helpers built on Gio.
+
+Nothing here blocks the main loop: one connection per bus type is opened
+asynchronously and shared by every caller, proxies are created
+asynchronously, and method calls run with a timeout and deliver their
+result through a callback.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
 from gi.repository import Gio
 from gi.repository import GLib
+from loguru import logger
+
+DEFAULT_TIMEOUT_MS = 5000
+
+_connections: dict[Gio.BusType, Gio.DBusConnection] = {}
+_bus_waiters: dict[Gio.BusType, list[Callable]] = {}
+
+
+def get_bus(
+    bus_type: Gio.BusType, callback: Callable[[Gio.DBusConnection | None], None]
+):
+    """Pass the shared connection to *bus_type* to *callback*.
+
+    The first request opens the connection asynchronously; later requests
+    get the cached connection immediately. *callback* receives ``None`` if
+    the bus cannot be reached.
+    """
+    if bus_type in _connections:
+        callback(_connections[bus_type])
+        return
+    if bus_type in _bus_waiters:
+        _bus_waiters[bus_type].append(callback)
+        return
+    _bus_waiters[bus_type] = [callback]
+    Gio.bus_get(bus_type, None, _on_bus_ready, bus_type)
+
+
+def _on_bus_ready(_source, result, bus_type: Gio.BusType):
+    connection = None
+    try:
+        connection = _connections[bus_type] = Gio.bus_get_finish(result)
+    except GLib.Error as e:
+        logger.error(f"[DBus] Failed to connect to the {bus_type} bus: {e.message}")
+    for callback in _bus_waiters.pop(bus_type):
+        callback(connection)
 
 
 class GioDBusHelper:
-    """A helper class for interacting with D-Bus using the Gio library."""
+    """A helper class for interacting with a D-Bus object using Gio.
+
+    The proxy is created asynchronously; it loads all properties of the
+    interface with a single ``GetAll`` and keeps them up to date from
+    ``PropertiesChanged``. *on_ready* is called with the helper once `proxy`
+    is available. Signal subscriptions made before the bus is connected are
+    applied as soon as it is, and `close` drops all of them.
+
+    Args:
+        bus_name: Well-known name of the peer.
+        object_path: Path of the object to proxy.
+        interface_name: Interface of the object to proxy.
+        bus_type: Bus the peer lives on.
+        on_ready: Called with the helper once the proxy has been created.
+    """
 
     def __init__(
         self,
@@ -11,18 +71,53 @@ class GioDBusHelper:
         object_path,
         interface_name,
         bus_type=Gio.BusType.SYSTEM,
+        on_ready: Callable[["GioDBusHelper"], None] | None = None,
     ):
-        self.bus = Gio.bus_get_sync(bus_type, None)
-        self.proxy = Gio.DBusProxy.new_sync(
-            self.bus,
+        self.bus_name = bus_name
+        self.object_path = object_path
+        self.interface_name = interface_name
+        self.bus: Gio.DBusConnection | None = None
+        self.proxy: Gio.DBusProxy | None = None
+
+        self._on_ready = on_ready
+        self._cancellable = Gio.Cancellable()
+        self._subscriptions: list[int] = []
+        self._pending_subscriptions: list[tuple] = []
+
+        get_bus(bus_type, self._on_bus)
+
+    def _on_bus(self, bus: Gio.DBusConnection | None):
+        if bus is None or self._cancellable.is_cancelled():
+            return
+        self.bus = bus
+        for args in self._pending_subscriptions:
+            self._subscribe(*args)
+        self._pending_subscriptions.clear()
+
+        Gio.DBusProxy.new(
+            bus,
             Gio.DBusProxyFlags.NONE,
             None,
-            bus_name,
-            object_path,
-            interface_name,
+            self.bus_name,
+            self.object_path,
+            self.interface_name,
+            self._cancellable,
+            self._on_proxy,
             None,
         )
 
+    def _on_proxy(self, _source, result, _data):
+        try:
+            self.proxy = Gio.DBusProxy.new_finish(result)
+        except GLib.Error as e:
+            if not self._cancellable.is_cancelled():
+                logger.error(
+                    f"[DBus] Failed to create a proxy for {self.bus_name}: {e.message}"
+                )
+            return
+        if self._on_ready:
+            self._on_ready(self)
+
     def call_method(
         self,
         bus_name,
@@ -30,11 +125,24 @@ class GioDBusHelper:
         interface_name,
         method_name,
         parameters=None,
-        timeout=-1,
+        timeout=DEFAULT_TIMEOUT_MS,
+        callback: Callable[[Any, GLib.Error | None], None] | None = None,
     ):
+        """Call a method asynchronously.
+
+        *callback* receives the unpacked result and ``None``, or ``None`` and
+        the error. Errors without a callback are logged.
+        """
+        if self.bus is None:
+            error = GLib.Error(f"Not connected to the bus for {bus_name}")
+            if callback:
+                callback(None, error)
+            else:
+                logger.warning(f"[DBus] {method_name} dropped: {error.message}")
+            return
         if parameters is None:
             parameters = GLib.Variant("()", ())
-        result = self.bus.call_sync(
+        self.bus.call(
             bus_name,
             object_path,
             interface_name,
@@ -43,27 +151,56 @@ class GioDBusHelper:
             None,
             Gio.DBusCallFlags.NONE,
             timeout,
-            None,
+            self._cancellable,
+            self._on_call_finished,
+            (method_name, callback),
         )
-        return result.unpack()
+
+    def _on_call_finished(self, bus: Gio.DBusConnection, result, data):
+        method_name, callback = data
+        try:
+            value = bus.call_finish(result).unpack()
+        except GLib.Error as e:
+            if callback:
+                callback(None, e)
+            elif not self._cancellable.is_cancelled():
+                logger.error(f"[DBus] {method_name} failed: {e.message}")
+            return
+        if callback:
+            callback(value, None)
 
     def listen_signal(self, sender, interface_name, member, object_path, callback):
         """Register signal listener (conn, sender, path, iface, signal, parameters)."""
-        self.bus.signal_subscribe(
-            sender,
-            interface_name,
-            member,
-            object_path,
-            arg0=None,
-            flags=Gio.DBusSignalFlags.NONE,
-            callback=callback,
+        args = (sender, interface_name, member, object_path, callback)
+        if self.bus is None:
+            self._pending_subscriptions.append(args)
+        else:
+            self._subscribe(*args)
+
+    def _subscribe(self, sender, interface_name, member, object_path, callback):
+        self._subscriptions.append(
+            self.bus.signal_subscribe(
+                sender,
+                interface_name,
+                member,
+                object_path,
+                None,
+                Gio.DBusSignalFlags.NONE,
+                callback,
+            )
         )
 
     def set_property(
-        self, bus_name, object_path, interface_name, property_name, value_variant
+        self,
+        bus_name,
+        object_path,
+        interface_name,
+        property_name,
+        value_variant,
+        callback: Callable[[Any, GLib.Error | None], None] | None = None,
     ):
         """Sets a D-Bus property using the standard D-Bus Properties interface."""
-        return self.call_method(
+        self.call_method(
             bus_name=bus_name,
             object_path=object_path,
             interface_name="org.freedesktop.DBus.Properties",
@@ -71,4 +208,14 @@ class GioDBusHelper:
             parameters=GLib.Variant(
                 "(ssv)", (interface_name, property_name, value_variant)
             ),
+            callback=callback,
         )
+
+    def close(self):
+        """Cancel pending operations and drop all signal subscriptions."""
+        self._cancellable.cancel()
+        if self.bus is not None:
+            for subscription_id in self._subscriptions:
+                self.bus.signal_unsubscribe(subscription_id)
+        self._subscriptions.clear()
+        self._pending_subscriptions.clear()
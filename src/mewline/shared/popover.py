@@ -278,6 +278,19 @@ class WaylandPopover(Widget):
     def get_visible(self) -> bool:
         return bool(self._visible)
 
+    def destroy(self):
+        """Release the popover window and destroy the content."""
+        self.hide_popover()
+        if self._manager.active_popover is self:
+            self._manager.active_popover = None
+        if self._content_window is not None:
+            self._manager.return_popover_window(self._content_window)
+            self._content_window = None
+        if self._content is not None:
+            self._content.destroy()
+            self._content = None
+        super().destroy()
+
 
 @GObject.type_register
 class X11Popover(Widget):
@@ -412,6 +425,19 @@ class X11Popover(Widget):
     def get_visible(self) -> bool:
         return bool(self._visible)
 
+    def destroy(self):
+        """Release the popover window and destroy the content."""
+        self.hide_popover()
+        if self._manager.active_popover is self:
+            self._manager.active_popover = None
+        if self._content_window is not None:
+            self._manager.return_popover_window(self._content_window)
+            self._content_window = None
+        if self._content is not None:
+            self._content.destroy()
+            self._content = None
+        super().destroy()
+
 
 # Factory function for creating popovers with lazy WM detection
 def Popover(content=None, point_to=None, gap: int = 2):
@@ -17,9 +17,19 @@ class Theme(BaseModel):
 
 
 class Options(BaseModel):
+    """General options.
+
+    brightness_target:
+      Monitors that brightness changes apply to when several external
+      monitors are controlled over DDC/CI:
+      - "all"    – every monitor (default)
+      - "cursor" – only the monitor that currently holds the pointer
+    """
+
     screen_corners: bool
     intercept_notifications: bool
     osd_enabled: bool
+    brightness_target: Literal["all", "cursor"] = "all"
 
 
 class MonitorsConfig(BaseModel):
@@ -0,0 +1,66 @@
+"""One-shot, re-armable timers for hiding and expiring UI elements."""
+
+from collections.abc import Callable
+
+from gi.repository import GLib
+from loguru import logger
+
+
+class DeadlineTimer:
+    """Calls *callback* once, *delay_ms* after the last call to `arm`.
+
+    Only a single GLib timeout exists while the timer is armed, and none
+    at all otherwise. Re-arming only moves the deadline: when the pending
+    timeout fires early it sleeps again for the remaining time, so a burst
+    of activity (e.g. scrolling the volume) does not churn GLib sources.
+
+    Args:
+        delay_ms: Default delay between `arm` and the callback.
+        callback: Called without arguments when the deadline passes. Its
+            return value is ignored.
+    """
+
+    def __init__(self, delay_ms: int, callback: Callable[[], object]):
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._deadline_us = 0
+        self._source_id = 0
+        self._source_deadline_us = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether the callback is still due."""
+        return bool(self._source_id)
+
+    def arm(self, delay_ms: int | None = None):
+        """(Re)start the countdown, replacing any earlier deadline."""
+        if delay_ms is None:
+            delay_ms = self.delay_ms
+        self._deadline_us = GLib.get_monotonic_time() + delay_ms * 1000
+        # A later deadline is picked up when the pending timeout fires
+        if self._source_id and self._source_deadline_us <= self._deadline_us:
+            return
+        self._schedule(delay_ms)
+
+    def cancel(self):
+        """Drop the pending deadline without calling the callback."""
+        if self._source_id:
+            GLib.source_remove(self._source_id)
+        self._source_id = 0
+
+    def _schedule(self, delay_ms: int):
+        self.cancel()
+        self._source_deadline_us = self._deadline_us
+        self._source_id = GLib.timeout_add(max(0, delay_ms), self._on_timeout)
+
+    def _on_timeout(self) -> bool:
+        self._source_id = 0
+        remaining_us = self._deadline_us - GLib.get_monotonic_time()
+        if remaining_us > 0:
+            self._schedule(-(-remaining_us // 1000))
+            return False
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"[DeadlineTimer] Callback failed: {e}")
+        return False
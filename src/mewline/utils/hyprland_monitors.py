@@ -1,9 +1,11 @@
 import json
 import warnings
+from typing import NamedTuple
 
 import gi
 from fabric.hyprland import Hyprland
 from gi.repository import Gdk
+from loguru import logger
 
 gi.require_version("Gdk", "3.0")
 
@@ -26,25 +28,110 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 #       which both can be used to uniquely identify a monitor
 
 
+class MonitorGeometry(NamedTuple):
+    """A Hyprland monitor with its GDK index and layout rectangle."""
+
+    name: str
+    gdk_id: int | None
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+
+# Events after which the monitor topology has to be re-read
+TOPOLOGY_EVENTS = (
+    "monitoradded",
+    "monitoraddedv2",
+    "monitorremoved",
+    "monitorremovedv2",
+    "configreloaded",
+)
+
+
 class HyprlandMonitors(Hyprland):
-    """A Hyprland class with additional monitor functions."""
+    """A Hyprland class with additional monitor functions.
+
+    The monitor topology (name <-> GDK id <-> geometry) is cached and only
+    invalidated on Hyprland and GDK monitor hot-plug events, and when GDK
+    reports a new geometry or scale for a monitor (e.g. after
+    ``hyprctl keyword monitor ...``). An empty or unreadable topology is
+    never cached.
+    """
 
     def __init__(self, commands_only: bool = False, **kwargs):
         self.display: Gdk.Display = Gdk.Display.get_default()
+        self._topology: tuple[MonitorGeometry, ...] | None = None
         super().__init__(commands_only, **kwargs)
 
+        for event in TOPOLOGY_EVENTS:
+            self.connect(f"event::{event}", self.invalidate_topology)
+        self.display.connect("monitor-added", self._on_monitor_added)
+        self.display.connect("monitor-removed", self.invalidate_topology)
+        for i in range(self.display.get_n_monitors()):
+            self._watch_monitor(self.display.get_monitor(i))
+
+    # ------------------------------------------------------------------
+    # Topology cache
+    # ------------------------------------------------------------------
+
+    def invalidate_topology(self, *_):
+        """Drop the cached topology; it is rebuilt on next use."""
+        self._topology = None
+
+    def _watch_monitor(self, monitor: Gdk.Monitor):
+        # Runtime reconfiguration (mode, scale, position) sends no hot-plug
+        # event; the handlers go away with the monitor when it is removed
+        monitor.connect("notify::geometry", self.invalidate_topology)
+        monitor.connect("notify::scale-factor", self.invalidate_topology)
+
+    def _on_monitor_added(self, _display: Gdk.Display, monitor: Gdk.Monitor):
+        self._watch_monitor(monitor)
+        self.invalidate_topology()
+
+    def get_topology(self) -> tuple[MonitorGeometry, ...]:
+        """Return the cached monitor topology, building it if needed."""
+        if self._topology is not None:
+            return self._topology
+
+        try:
+            screen = self.display.get_default_screen()
+            gdk_ids = {
+                screen.get_monitor_plug_name(i): i
+                for i in range(self.display.get_n_monitors())
+            }
+            topology = tuple(
+                MonitorGeometry(
+                    name=mon["name"],
+                    gdk_id=gdk_ids.get(mon["name"]),
+                    x=mon["x"],
+                    y=mon["y"],
+                    width=mon["width"],
+                    height=mon["height"],
+                )
+                for mon in self.get_all_monitors()
+            )
+        except Exception as e:
+            logger.warning(f"[HyprlandMonitors] Failed to read monitors: {e}")
+            return ()
+
+        # Transient while outputs are reconfigured; re-read on next use
+        if topology:
+            self._topology = topology
+        return topology
+
     # ------------------------------------------------------------------
     # Low-level helpers
     # ------------------------------------------------------------------
 
     def get_gdk_monitor_id_from_name(self, plug_name: str) -> int | None:
         """Return the GDK monitor index that matches *plug_name*."""
-        for i in range(self.display.get_n_monitors()):
-            if (
-                self.display.get_default_screen().get_monitor_plug_name(i)
-                == plug_name
-            ):
-                return i
+        for mon in self.get_topology():
+            if mon.name == plug_name:
+                return mon.gdk_id
         return None
 
     # ------------------------------------------------------------------
@@ -57,12 +144,7 @@ class HyprlandMonitors(Hyprland):
 
     def get_all_gdk_monitor_ids(self) -> list[int]:
         """Return GDK IDs for **all** connected monitors."""
-        ids: list[int] = []
-        for mon in self.get_all_monitors():
-            gdk_id = self.get_gdk_monitor_id_from_name(mon["name"])
-            if gdk_id is not None:
-                ids.append(gdk_id)
-        return ids
+        return [mon.gdk_id for mon in self.get_topology() if mon.gdk_id is not None]
 
     # ------------------------------------------------------------------
     # Active-workspace monitor (legacy + new name)
@@ -85,26 +167,27 @@ class HyprlandMonitors(Hyprland):
     # Cursor monitor
     # ------------------------------------------------------------------
 
-    def get_cursor_monitor_name(self) -> str | None:
-        """Return the Hyprland name of the monitor that currently holds the pointer."""
+    def get_cursor_monitor(self) -> MonitorGeometry | None:
+        """Return the cached monitor that currently holds the pointer."""
         try:
             data = json.loads(self.send_command("j/cursorpos").reply)
             x, y = data["x"], data["y"]
-            for mon in self.get_all_monitors():
-                mx, my = mon["x"], mon["y"]
-                mw, mh = mon["width"], mon["height"]
-                if mx <= x < mx + mw and my <= y < my + mh:
-                    return mon["name"]
+            for mon in self.get_topology():
+                if mon.contains(x, y):
+                    return mon
         except Exception:  # noqa: S110
             pass
         return None
 
+    def get_cursor_monitor_name(self) -> str | None:
+        """Return the Hyprland name of the monitor that currently holds the pointer."""
+        mon = self.get_cursor_monitor()
+        return mon.name if mon else None
+
     def get_cursor_gdk_monitor_id(self) -> int | None:
         """Return the GDK ID of the monitor under the pointer."""
-        name = self.get_cursor_monitor_name()
-        if name is None:
-            return None
-        return self.get_gdk_monitor_id_from_name(name)
+        mon = self.get_cursor_monitor()
+        return mon.gdk_id if mon else None
 
     # ------------------------------------------------------------------
     # Config-driven selector
@@ -0,0 +1,45 @@
+"""Bookkeeping for signal handlers that widgets connect on shared objects."""
+
+from collections.abc import Callable
+
+from gi.repository import GObject
+from gi.repository import Gtk
+
+
+class SignalHandlers:
+    """A group of signal connections that are disconnected together.
+
+    Services are shared singletons that outlive the widgets showing them, so
+    a handler a widget connects on a service keeps the widget alive and
+    keeps firing after the widget is destroyed. Connecting through a group
+    records the handler IDs so the owner can drop them all at once, e.g. in
+    its ``destroy`` or when the object they were connected on is replaced.
+
+    Args:
+        owner: Widget whose ``destroy`` signal disconnects the whole group.
+    """
+
+    def __init__(self, owner: Gtk.Widget | None = None):
+        self._handlers: list[tuple[GObject.Object, int]] = []
+        if owner is not None:
+            owner.connect("destroy", lambda *_: self.disconnect_all())
+
+    def connect(
+        self, obj: GObject.Object, signal: str, callback: Callable, *args
+    ) -> int:
+        """Connect *callback* to *signal* of *obj* and remember the handler."""
+        handler_id = obj.connect(signal, callback, *args)
+        self._handlers.append((obj, handler_id))
+        return handler_id
+
+    def disconnect_all(self):
+        """Disconnect every handler of this group."""
+        handlers, self._handlers = self._handlers, []
+        for obj, handler_id in handlers:
+            self._disconnect(obj, handler_id)
+
+    @staticmethod
+    def _disconnect(obj: GObject.Object, handler_id: int):
+        # The object may have dropped the handler itself (e.g. when disposed)
+        if obj.handler_is_connected(handler_id):
+            obj.disconnect(handler_id)
@@ -0,0 +1,188 @@
+"""Startup time profiler behind `python -m mewline --profile-startup`.
+
+Records a tree of timed spans: every module import that actually executes
+(like ``-X importtime``) plus the phases wrapped in :meth:`span`. When the
+main loop first becomes idle, i.e. after the first frame was drawn, it
+prints the slowest spans and writes a Chrome trace (``chrome://tracing`` or
+https://ui.perfetto.dev) to ``$XDG_CACHE_HOME/mewline/profiles``.
+
+Only the standard library is imported here, because profiling is enabled
+from ``mewline/__init__.py`` before anything else is loaded.
+"""
+
+import builtins
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Spans shorter than this are left out of the trace to keep it readable
+MIN_TRACE_SPAN_NS = 100_000
+SUMMARY_SIZE = 25
+
+
+class _Span:
+    __slots__ = ("cat", "children_ns", "depth", "end", "name", "start")
+
+    def __init__(self, name: str, cat: str, depth: int):
+        self.name = name
+        self.cat = cat
+        self.depth = depth
+        self.start = time.perf_counter_ns()
+        self.end = 0
+        self.children_ns = 0
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    @property
+    def self_time(self) -> int:
+        return self.duration - self.children_ns
+
+
+class StartupProfiler:
+    """Collects timed spans until the first idle of the main loop."""
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter_ns()
+        self.spans: list[_Span] = []
+        self._stack: list[_Span] = []
+        self._original_import = None
+        self._cprofile = None
+
+    def enable(self, cprofile: bool = False):
+        """Start recording spans and module imports (and cProfile data)."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.origin = time.perf_counter_ns()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        if cprofile:
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "phase"):
+        """Time the enclosed block as a child of the current span."""
+        if (
+            not self.enabled
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            yield
+            return
+
+        record = _Span(name, cat, len(self._stack))
+        self._stack.append(record)
+        try:
+            yield
+        finally:
+            record.end = time.perf_counter_ns()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1].children_ns += record.duration
+            self.spans.append(record)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        with self.span(name, "import"):
+            return self._original_import(name, globals, locals, fromlist, level)
+
+    def finish_when_idle(self):
+        """Finish profiling once the main loop has drawn the first frame."""
+        if not self.enabled:
+            return
+        from gi.repository import GLib
+
+        def _on_idle():
+            self.finish()
+            return False
+
+        GLib.idle_add(_on_idle)
+
+    def finish(self) -> Path | None:
+        """Stop recording, print the summary and write the trace files."""
+        if not self.enabled:
+            return None
+        self.enabled = False
+        builtins.__import__ = self._original_import
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+        total_ns = time.perf_counter_ns() - self.origin
+        self._print_summary(total_ns)
+        try:
+            return self._write_trace(total_ns)
+        except OSError as e:
+            print(f"[StartupProfiler] Failed to write trace: {e}", file=sys.stderr)
+            return None
+
+    def _print_summary(self, total_ns: int):
+        print(f"\n=== Startup profile: {total_ns / 1e6:.1f} ms to first idle ===")
+        print(f"{'total ms':>10} {'self ms':>10}  span")
+        ranked = sorted(self.spans, key=lambda s: s.duration, reverse=True)
+        for record in ranked[:SUMMARY_SIZE]:
+            label = f"import {record.name}" if record.cat == "import" else record.name
+            print(
+                f"{record.duration / 1e6:10.1f} {record.self_time / 1e6:10.1f}  "
+                f"{'  ' * record.depth}{label}"
+            )
+
+        if self._cprofile is not None:
+            import pstats
+
+            print("\n=== cProfile (top 15 by cumulative time) ===")
+            pstats.Stats(self._cprofile).sort_stats("cumulative").print_stats(15)
+
+    def _write_trace(self, total_ns: int) -> Path:
+        from mewline.constants import APP_CACHE_DIRECTORY
+
+        folder = APP_CACHE_DIRECTORY / "profiles"
+        folder.mkdir(parents=True, exist_ok=True)
+        path = folder / time.strftime("startup-%Y%m%d-%H%M%S.json")
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": "startup",
+                "cat": "phase",
+                "ph": "X",
+                "ts": 0,
+                "dur": total_ns / 1000,
+                "pid": pid,
+                "tid": 0,
+            }
+        ]
+        events.extend(
+            {
+                "name": record.name,
+                "cat": record.cat,
+                "ph": "X",
+                "ts": (record.start - self.origin) / 1000,
+                "dur": record.duration / 1000,
+                "pid": pid,
+                "tid": 0,
+                "args": {"self_ms": round(record.self_time / 1e6, 3)},
+            }
+            for record in self.spans
+            if record.duration >= MIN_TRACE_SPAN_NS
+        )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(path.with_suffix(".prof"))
+
+        print(f"[StartupProfiler] Chrome trace written to {path}")
+        return path
+
+
+profiler = StartupProfiler()
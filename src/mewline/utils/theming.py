@@ -1,16 +1,32 @@
+import hashlib
+import os
 import re
+import subprocess
 from pathlib import Path
 
 from fabric import Application
-from fabric.utils import exec_shell_command
+from gi.repository import Gdk
+from gi.repository import Gio
+from gi.repository import GLib
+from gi.repository import Gtk
 from loguru import logger
 
 import mewline.constants as cnst
 from mewline.errors.settings import ExecutableNotFoundError
 from mewline.utils.misc import executable_exists
+from mewline.utils.startup_profiler import profiler
 
 # Matches top-level SCSS variable declarations: $name: value;
 _SCSS_VAR_RE = re.compile(r"^\$([a-zA-Z0-9_-]+)\s*:\s*(.+?)\s*;", re.MULTILINE)
+_SCSS_REF_RE = re.compile(r"\$([a-zA-Z0-9_-]+)")
+_HEX_ALPHA_RE = re.compile(r"#([0-9a-fA-F]{4}|[0-9a-fA-F]{8})")
+
+
+# Prefix of the GTK named colours the theme variables are exposed as
+THEME_COLOR_PREFIX = "mewline-"
+
+# Provider holding only the @define-color lines of the active theme
+_theme_provider: Gtk.CssProvider | None = None
 
 
 def _parse_scss_vars(content: str) -> dict[str, str]:
@@ -18,25 +34,235 @@ def _parse_scss_vars(content: str) -> dict[str, str]:
     return {m.group(1): m.group(2) for m in _SCSS_VAR_RE.finditer(content)}
 
 
-def process_and_apply_css(app: Application):
+def _theme_references(names) -> str:
+    """Return theme.scss content mapping every variable to its GTK named colour.
+
+    The stylesheet is compiled against these references, so it only depends
+    on the set of variable names and not on the colours of a theme.
+    """
+    return "".join(
+        f'${name}: unquote("@{THEME_COLOR_PREFIX}{name}");\n' for name in names
+    )
+
+
+def _gtk_color_value(value: str) -> str:
+    """Translate an SCSS colour value into GTK 3 CSS colour syntax."""
+    # References to other theme variables become named colour references
+    value = _SCSS_REF_RE.sub(rf"@{THEME_COLOR_PREFIX}\1", value)
+
+    # GTK 3 does not understand #rgba / #rrggbbaa
+    match = _HEX_ALPHA_RE.fullmatch(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 4:
+            digits = "".join(c * 2 for c in digits)
+        r, g, b, a = (int(digits[i : i + 2], 16) for i in range(0, 8, 2))
+        value = f"rgba({r}, {g}, {b}, {round(a / 255, 3)})"
+    return value
+
+
+def _theme_definitions(variables: dict[str, str]) -> str:
+    return "".join(
+        f"@define-color {THEME_COLOR_PREFIX}{name} {_gtk_color_value(value)};\n"
+        for name, value in variables.items()
+    )
+
+
+def apply_theme_colors(variables: dict[str, str]):
+    """Swap the active theme colours without touching the compiled stylesheet."""
+    global _theme_provider
+    if _theme_provider is None:
+        _theme_provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_screen(
+            Gdk.Screen.get_default(),
+            _theme_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        )
+    try:
+        _theme_provider.load_from_data(_theme_definitions(variables).encode())
+    except GLib.Error as e:
+        logger.error(f"[THEME] Failed to load theme colours: {e}")
+
+
+def styles_digest() -> str:
+    """Return a SHA-256 over every SCSS source, including the merged theme.scss.
+
+    main.scss only imports files from the styles folder, so hashing the whole
+    folder covers all of its imports without resolving them.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(cnst.STYLES_FOLDER.rglob("*.scss")):
+        digest.update(path.relative_to(cnst.STYLES_FOLDER).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _is_compiled_style_current(digest: str) -> bool:
+    try:
+        return (
+            cnst.COMPILED_STYLE.exists()
+            and cnst.COMPILED_STYLE_HASH.read_text().strip() == digest
+        )
+    except OSError:
+        return False
+
+
+def compile_css() -> bool:
+    """Compile main.scss unless the cached CSS was built from identical sources.
+
+    Returns:
+        bool: False if sass failed, True if the compiled CSS is up to date.
+    """
+    digest = styles_digest()
+    if _is_compiled_style_current(digest):
+        logger.info("[Main] CSS is up to date, skipping compilation")
+        return True
+
     # Raise an error if sass is not found and exit the application
     if not executable_exists("sass"):
         raise ExecutableNotFoundError("sass")
 
     logger.info("[Main] Compiling CSS")
-    exec_shell_command(f"sass {cnst.MAIN_STYLE} {cnst.COMPILED_STYLE} --no-source-map")
-    logger.info("[Main] CSS applied")
-    app.set_stylesheet_from_file(cnst.COMPILED_STYLE)
+    with profiler.span("sass"):
+        result = subprocess.run(
+            ["sass", str(cnst.MAIN_STYLE), str(cnst.COMPILED_STYLE), "--no-source-map"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if result.returncode != 0:
+        logger.error(f"[Main] Failed to compile CSS: {result.stderr.strip()}")
+        cnst.COMPILED_STYLE_HASH.unlink(missing_ok=True)
+        return False
+
+    cnst.COMPILED_STYLE_HASH.write_text(digest)
+    return True
+
+
+def process_and_apply_css(app: Application):
+    compile_css()
+    if cnst.COMPILED_STYLE.exists():
+        app.set_stylesheet_from_file(cnst.COMPILED_STYLE)
+        logger.info("[Main] CSS applied")
+
+
+class CssBuilder:
+    """Debounced, non-blocking stylesheet rebuilds for hot-reload.
+
+    File events are collapsed into one build after *delay_ms* of quiet.
+    sass runs as a Gio subprocess writing to a temporary file, so the main
+    loop keeps running; a newer build cancels the one in flight. Only the
+    newest successful build replaces main.css and is applied to *app*.
+    """
+
+    def __init__(self, app: Application, delay_ms: int = 150):
+        self.app = app
+        self.delay_ms = delay_ms
+        self._timeout_id = 0
+        self._generation = 0
+        self._process: Gio.Subprocess | None = None
+        self._cancellable: Gio.Cancellable | None = None
+        self._applied_digest: str | None = None
+
+    def queue_rebuild(self, *_):
+        """Schedule a rebuild, restarting the debounce delay."""
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+        self._timeout_id = GLib.timeout_add(self.delay_ms, self._on_timeout)
+
+    def _on_timeout(self) -> bool:
+        self._timeout_id = 0
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.error(f"[CssBuilder] Failed to start CSS build: {e}")
+        return False
+
+    def rebuild(self):
+        """Start a build now, superseding any build still running."""
+        self._cancel_running()
+        self._generation += 1
+
+        digest = styles_digest()
+        if _is_compiled_style_current(digest):
+            if digest != self._applied_digest:
+                self._apply(digest)
+            return
+
+        if not executable_exists("sass"):
+            raise ExecutableNotFoundError("sass")
+
+        generation = self._generation
+        output = cnst.DIST_FOLDER / f".main.{generation}.css.tmp"
+        self._cancellable = Gio.Cancellable()
+        self._process = Gio.Subprocess.new(
+            ["sass", str(cnst.MAIN_STYLE), str(output), "--no-source-map"],
+            Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_PIPE,
+        )
+        logger.info("[CssBuilder] Compiling CSS")
+        self._process.communicate_utf8_async(
+            None,
+            self._cancellable,
+            self._on_build_finished,
+            (generation, digest, output),
+        )
+
+    def _cancel_running(self):
+        if self._cancellable is not None:
+            self._cancellable.cancel()
+        if self._process is not None:
+            self._process.force_exit()
+        self._process = None
+        self._cancellable = None
+
+    def _on_build_finished(self, process: Gio.Subprocess, result, data):
+        generation, digest, output = data
+        try:
+            _, _, stderr = process.communicate_utf8_finish(result)
+        except GLib.Error:
+            # Cancelled by a newer build
+            output.unlink(missing_ok=True)
+            return
+
+        if generation != self._generation:
+            output.unlink(missing_ok=True)
+            return
+        self._process = None
+        self._cancellable = None
+
+        if not process.get_successful():
+            logger.error(
+                f"[CssBuilder] Failed to compile CSS: {(stderr or '').strip()}"
+            )
+            output.unlink(missing_ok=True)
+            return
+
+        # Atomic swap: readers never see a partially written main.css
+        os.replace(output, cnst.COMPILED_STYLE)
+        cnst.COMPILED_STYLE_HASH.write_text(digest)
+        self._apply(digest)
+
+    def _apply(self, digest: str):
+        self._applied_digest = digest
+        self.app.set_stylesheet_from_file(cnst.COMPILED_STYLE)
+        logger.info("[CssBuilder] CSS applied")
 
 
 def copy_theme(path: Path):
-    """Merge default theme variables with user overrides and write to theme.scss.
+    """Merge default theme variables with user overrides and apply them.
 
     Variables present in the user theme file override the defaults; any
     variable not defined by the user falls back to the value from
     default_theme.scss.  This guarantees that newly-introduced variables
     (e.g. $privacy-dot-*) work correctly for existing themes that were
     created before those variables existed.
+
+    The colours are applied as GTK named colours through a small dedicated
+    provider, while theme.scss only maps each variable to its named colour.
+    Switching between themes defining the same variables therefore never
+    changes the SCSS sources and never runs sass.
     """
     if path.stem == "default":
         path = cnst.DEFAULT_THEME_STYLE
@@ -59,10 +285,13 @@ def copy_theme(path: Path):
         # User values take priority; missing keys fall back to defaults
         merged = {**default_vars, **user_vars}
 
-        with open(cnst.THEME_STYLE, "w") as f:
-            for name, value in merged.items():
-                f.write(f"${name}: {value};\n")
+        content = _theme_references(merged)
+
+        # Rewriting identical content would still wake the styles monitor
+        if not cnst.THEME_STYLE.exists() or cnst.THEME_STYLE.read_text() != content:
+            cnst.THEME_STYLE.write_text(content)
 
+        apply_theme_colors(merged)
         logger.info(f"[THEME] '{path}' applied successfully.")
 
     except FileNotFoundError:
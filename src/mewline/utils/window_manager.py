@@ -232,8 +232,14 @@ def create_adaptive_window(
     )
 
 
+_monitor_manager: Any = None
+
+
 def create_monitor_manager() -> Any:
-    """Factory function to create appropriate monitor manager.
+    """Factory function to get the appropriate monitor manager.
+
+    The manager is created once and shared, so its monitor topology cache
+    and event subscription are shared by all callers.
 
     Returns:
         HyprlandMonitors or BspwmMonitors instance based on current WM.
@@ -242,13 +248,18 @@ def create_monitor_manager() -> Any:
         monitors = create_monitor_manager()
         monitor_ids = monitors.get_configured_gdk_monitor_ids(cfg)
     """
+    global _monitor_manager
+    if _monitor_manager is not None:
+        return _monitor_manager
+
     if WindowManagerContext.is_wayland():
         from mewline.utils.hyprland_monitors import HyprlandMonitors
 
         logger.debug("Creating HyprlandMonitors for Wayland")
-        return HyprlandMonitors()
+        _monitor_manager = HyprlandMonitors()
     else:
         from mewline.utils.bspwm_monitors import BspwmMonitors
 
         logger.debug("Creating BspwmMonitors for X11")
-        return BspwmMonitors()
+        _monitor_manager = BspwmMonitors()
+    return _monitor_manager
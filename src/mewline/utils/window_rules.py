@@ -0,0 +1,110 @@
+"""Window title/icon rules shared by the compact view and the overview.
+
+The user ``title_map`` and the built-in ``WINDOW_TITLE_MAP`` are compiled
+once into a single regular expression whose alternatives keep the priority
+of the rule list, and lookups are memoised per window class. The rules are
+rebuilt with :func:`reload_window_rules` when the config changes.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from loguru import logger
+
+from mewline.config import cfg
+from mewline.constants import WINDOW_TITLE_MAP
+
+
+class WindowRule(NamedTuple):
+    """A ``[pattern, icon, title]`` entry of a title map."""
+
+    pattern: str
+    icon: str
+    title: str
+
+
+class WindowRules:
+    """Ordered set of window rules; the first rule whose pattern matches wins.
+
+    Args:
+        rules: ``[pattern, icon, title]`` entries in priority order.
+        cache_size: Number of window classes whose result is memoised.
+    """
+
+    def __init__(self, rules, cache_size: int = 256):
+        self.cache_size = cache_size
+        self.reload(rules)
+
+    def reload(self, rules):
+        """Compile a new rule list and drop all memoised results."""
+        self.rules: list[WindowRule] = []
+        patterns: list[re.Pattern] = []
+        for entry in rules:
+            rule = WindowRule(*[*entry, "", ""][:3])
+            try:
+                patterns.append(re.compile(rule.pattern))
+            except re.error as e:
+                logger.warning(
+                    f"[WindowRules] Skipping invalid pattern {rule.pattern!r}: {e}"
+                )
+                continue
+            self.rules.append(rule)
+
+        # Every alternative is a lookahead tried at the start of the string,
+        # so the first matching rule wins no matter where its pattern matches.
+        # The empty named group after it tells which rule that was.
+        try:
+            self._combined: re.Pattern | None = re.compile(
+                "|".join(
+                    f"(?=[\\s\\S]*?(?:{rule.pattern}))(?P<_r{i}>)"
+                    for i, rule in enumerate(self.rules)
+                )
+            )
+        except re.error:
+            # e.g. numbered backreferences or inline flags inside a pattern
+            self._combined = None
+        self._patterns = patterns
+
+        self.match = lru_cache(maxsize=self.cache_size)(self._match)
+
+    def _match(self, value: str) -> WindowRule | None:
+        if self._combined is not None:
+            m = self._combined.match(value)
+            return self.rules[int(m.lastgroup[2:])] if m else None
+
+        for rule, pattern in zip(self.rules, self._patterns, strict=True):
+            if pattern.search(value):
+                return rule
+        return None
+
+    def icon_for(self, value: str, default: str | None = None) -> str | None:
+        """Return the icon of the rule matching *value*, if it has one."""
+        rule = self.match(value)
+        return rule.icon if rule and rule.icon else default
+
+
+window_rules: WindowRules | None = None
+
+
+def _configured_rules() -> list:
+    return list(cfg.modules.dynamic_island.compact.window_titles.title_map) + list(
+        WINDOW_TITLE_MAP
+    )
+
+
+def get_window_rules() -> WindowRules:
+    """Get or create the global window rules built from the config."""
+    global window_rules
+    if not window_rules:
+        window_rules = WindowRules(_configured_rules())
+    return window_rules
+
+
+def reload_window_rules(title_map=None):
+    """Rebuild the global rules, e.g. with the ``title_map`` of a reloaded config."""
+    if title_map is None:
+        rules = _configured_rules()
+    else:
+        rules = list(title_map) + list(WINDOW_TITLE_MAP)
+    get_window_rules().reload(rules)
@@ -3,14 +3,15 @@ from fabric.widgets.image import Image
 from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
 from gi.repository import Gdk
-from gi.repository import GLib
 from gi.repository import Gtk
 
 from mewline.config import cfg
-from mewline.services import battery_service
+from mewline.services import get_service
 from mewline.services.battery import PowerProfiles
 from mewline.shared.widget_container import ButtonWidget
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.misc import format_time
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import text_icon
 
 
@@ -21,15 +22,19 @@ class Battery(ButtonWidget):
         # Initialize the Box with specific name and style
         super().__init__(name="battery")
 
-        self.client = battery_service
+        self.client = get_service("battery")
         self.power_profiles_client = PowerProfiles()
-        self.client.connect("changed", lambda *_: self.update_ui())
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self.client, "changed", lambda *_: self.update_ui())
         self.config = cfg.modules.battery
         self.full_battery_level = 100
 
         # for revealer
-        self.hide_timer = None
+        self.hide_timer = DeadlineTimer(
+            500, lambda: self.revealer.set_reveal_child(False)
+        )
         self.hover_counter = 0
+        self.connect("destroy", lambda *_: self.hide_timer.cancel())
 
         is_present = self.client.get_property("IsPresent")
 
@@ -70,20 +75,14 @@ class Battery(ButtonWidget):
 
     def on_mouse_enter(self, *_):
         self.hover_counter += 1
-        if self.hide_timer:
-            GLib.source_remove(self.hide_timer)
-            self.hide_timer = None
+        self.hide_timer.cancel()
         self.revealer.set_reveal_child(True)
         return False
 
     def on_mouse_leave(self, *_):
         self.hover_counter = max(0, self.hover_counter - 1)
         if self.hover_counter == 0:
-            if self.hide_timer:
-                GLib.source_remove(self.hide_timer)
-            self.hide_timer = GLib.timeout_add(
-                500, lambda: self.revealer.set_reveal_child(False)
-            )
+            self.hide_timer.arm()
         return False
 
     def update_ui(self):
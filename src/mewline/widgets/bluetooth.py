@@ -2,8 +2,9 @@ from fabric.utils import exec_shell_command_async
 
 import mewline.constants as cnst
 from mewline.config import cfg
-from mewline.services import bluetooth_client
+from mewline.services import get_service
 from mewline.shared.widget_container import ButtonWidget
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import text_icon
 
 
@@ -23,13 +24,15 @@ class Bluetooth(ButtonWidget):
                 cnst.kb_di_open.format(module="bluetooth")
             ),
         )
-        bluetooth_client.connect(
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(
+            get_service("bluetooth"),
             "notify::enabled",
             lambda *_: self.update_icon(),
         )
 
     def update_icon(self):
-        if bluetooth_client.enabled:
+        if get_service("bluetooth").enabled:
             icon = cnst.icons["bluetooth"]["bluetooth_connected"]
         else:
             icon = cnst.icons["bluetooth"]["bluetooth_disconnected"]
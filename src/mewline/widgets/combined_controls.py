@@ -10,12 +10,11 @@ from gi.repository import Gtk
 
 from mewline import constants as cnst
 from mewline.config import cfg
-from mewline.services import audio_service
-from mewline.services import brightness_service
-from mewline.services import privacy_service
+from mewline.services import get_service
 from mewline.shared.popover import Popover
 from mewline.shared.widget_container import ButtonWidget
 from mewline.utils.misc import convert_to_percent
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import create_scale
 from mewline.utils.widget_utils import get_audio_icon
 from mewline.utils.widget_utils import get_brightness_icon
@@ -32,13 +31,16 @@ class CombinedControlsMenu:
 
     def __init__(self, anchor_widget: GObject.GObject, osd_widget=None, **kwargs):
         self.anchor_widget = anchor_widget
-        self.audio = audio_service
-        self.brightness = brightness_service
+        self.audio = get_service("audio")
+        self.brightness = get_service("brightness")
         self.config = cfg.modules
         self.osd_widget = osd_widget
 
         self._updating_brightness_from_service = False
         self._updating_brightness = False
+        self._handlers = SignalHandlers()
+        self._speaker_handlers = SignalHandlers()
+        self._mic_handlers = SignalHandlers()
 
         self.brightness_available = self._is_brightness_available()
 
@@ -147,6 +149,10 @@ class CombinedControlsMenu:
         self.mic_scale.connect("value-changed", self._on_mic_changed)
         if self.brightness_available:
             self.brightness_scale.connect("value-changed", self._on_brightness_changed)
+            # Only emitted for user input, unlike value-changed
+            self.brightness_scale.connect(
+                "change-value", lambda *_: self.brightness.begin_interaction()
+            )
 
         self.speaker_scale.connect(
             "button-release-event", self._on_scale_release, "speaker"
@@ -157,10 +163,14 @@ class CombinedControlsMenu:
                 "button-release-event", self._on_scale_release, "brightness"
             )
 
-        self.audio.connect("notify::speaker", self._bind_speaker)
-        self.audio.connect("notify::microphone", self._bind_microphone)
+        self._handlers.connect(self.audio, "notify::speaker", self._bind_speaker)
+        self._handlers.connect(
+            self.audio, "notify::microphone", self._bind_microphone
+        )
         if self.brightness_available:
-            self.brightness.connect("screen", self._on_brightness_service)
+            self._handlers.connect(
+                self.brightness, "screen", self._on_brightness_service
+            )
 
         # Bind when available
         self._bind_speaker()
@@ -177,6 +187,23 @@ class CombinedControlsMenu:
     def get_visible(self) -> bool:
         return self._popover.get_visible()
 
+    def destroy(self):
+        """Disconnect from the services and destroy the popover."""
+        self._handlers.disconnect_all()
+        self._speaker_handlers.disconnect_all()
+        self._mic_handlers.disconnect_all()
+        for source_id in (
+            self._speaker_apply_src,
+            self._mic_apply_src,
+            self._brightness_apply_src,
+        ):
+            if source_id:
+                GLib.source_remove(source_id)
+        self._speaker_apply_src = None
+        self._mic_apply_src = None
+        self._brightness_apply_src = None
+        self._popover.destroy()
+
     def _get_speaker_volume(self) -> int:
         return round(self.audio.speaker.volume) if self.audio.speaker else 0
 
@@ -241,22 +268,25 @@ class CombinedControlsMenu:
         self._brightness_apply_src = GLib.timeout_add(80, self._apply_brightness)
 
     def _bind_speaker(self, *_):
+        # Drop the handlers on the previous (or same) speaker stream
+        self._speaker_handlers.disconnect_all()
         if self.audio.speaker:
-            self.audio.speaker.connect(
-                "notify::volume", self._update_speaker_from_service
+            self._speaker_handlers.connect(
+                self.audio.speaker, "notify::volume", self._update_speaker_from_service
             )
-            self.audio.speaker.connect(
-                "notify::muted", self._update_speaker_from_service
+            self._speaker_handlers.connect(
+                self.audio.speaker, "notify::muted", self._update_speaker_from_service
             )
             self._update_speaker_from_service()
 
     def _bind_microphone(self, *_):
+        self._mic_handlers.disconnect_all()
         if self.audio.microphone:
-            self.audio.microphone.connect(
-                "notify::volume", self._update_mic_from_service
+            self._mic_handlers.connect(
+                self.audio.microphone, "notify::volume", self._update_mic_from_service
             )
-            self.audio.microphone.connect(
-                "notify::muted", self._update_mic_from_service
+            self._mic_handlers.connect(
+                self.audio.microphone, "notify::muted", self._update_mic_from_service
             )
             self._update_mic_from_service()
 
@@ -361,9 +391,9 @@ class CombinedControlsButton(Overlay):
 
     def __init__(self, **kwargs):
         super().__init__(name="combined-controls", **kwargs)
-        self.audio = audio_service
-        self.brightness = brightness_service
-        self.privacy = privacy_service
+        self.audio = get_service("audio")
+        self.brightness = get_service("brightness")
+        self.privacy = get_service("privacy")
         self.menu: CombinedControlsMenu | None = None
         self.osd_widget = None
 
@@ -371,6 +401,11 @@ class CombinedControlsButton(Overlay):
         self._pending_scroll_updates = {}
         self._updating_brightness = False
 
+        self._handlers = SignalHandlers(self)
+        self._speaker_handlers = SignalHandlers(self)
+        self._mic_handlers = SignalHandlers(self)
+        self.connect("destroy", self._on_destroy)
+
         # ── Main icons ──────────────────────────────────────────────────
         self.icon_speaker = text_icon(get_audio_icon(0, False))
         self.icon_mic = text_icon(cnst.icons["microphone"]["active"])
@@ -382,9 +417,16 @@ class CombinedControlsButton(Overlay):
 
         self._sync_icons()
 
-        self.audio.connect("notify::speaker", self._bind_speaker)
-        self.audio.connect("notify::microphone", self._bind_microphone)
-        self.brightness.connect("screen", self._on_brightness_changed)
+        self._handlers.connect(self.audio, "notify::speaker", self._bind_speaker)
+        self._handlers.connect(
+            self.audio, "notify::microphone", self._bind_microphone
+        )
+        self._handlers.connect(
+            self.brightness, "screen", self._on_brightness_changed
+        )
+        self._handlers.connect(
+            self.brightness, "notify::available", self._on_brightness_available
+        )
 
         # ── Privacy dots (2x2 grid = one icon slot) ────────────────────
         # Colours are defined by $privacy-dot-{mic,cam,screen,loc} in the
@@ -445,7 +487,7 @@ class CombinedControlsButton(Overlay):
             "notify::screen-active",
             "notify::loc-active",
         ):
-            self.privacy.connect(sig, self._update_privacy_dots)
+            self._handlers.connect(self.privacy, sig, self._update_privacy_dots)
 
         self._update_privacy_dots()
 
@@ -518,7 +560,23 @@ class CombinedControlsButton(Overlay):
     def set_osd_widget(self, osd_widget):
         self.osd_widget = osd_widget
 
+    def _on_destroy(self, *_):
+        if self._scroll_debounce_src:
+            GLib.source_remove(self._scroll_debounce_src)
+            self._scroll_debounce_src = None
+        if self.menu:
+            self.menu.destroy()
+            self.menu = None
+
     def _on_clicked(self, *_):
+        if (
+            self.menu
+            and not self.menu.get_visible()
+            and self.menu.brightness_available != self._is_brightness_available()
+        ):
+            # The brightness backend appeared or vanished since the menu was built
+            self.menu.destroy()
+            self.menu = None
         if not self.menu:
             self.menu = CombinedControlsMenu(
                 anchor_widget=self, osd_widget=self.osd_widget
@@ -557,6 +615,7 @@ class CombinedControlsButton(Overlay):
     def _on_scroll_brightness(self, widget, event):
         if not self._is_brightness_available():
             return False
+        self.brightness.begin_interaction()
         step = 5
         current = self._get_brightness()
         new_val = (
@@ -625,21 +684,34 @@ class CombinedControlsButton(Overlay):
             self.icon_brightness.set_text(get_brightness_icon(self._get_brightness()))
 
     def _bind_speaker(self, *_):
+        self._speaker_handlers.disconnect_all()
         if self.audio.speaker:
-            self.audio.speaker.connect("notify::volume", self._update_speaker_icon)
-            self.audio.speaker.connect("notify::muted", self._update_speaker_icon)
+            self._speaker_handlers.connect(
+                self.audio.speaker, "notify::volume", self._update_speaker_icon
+            )
+            self._speaker_handlers.connect(
+                self.audio.speaker, "notify::muted", self._update_speaker_icon
+            )
             self._update_speaker_icon()
 
     def _bind_microphone(self, *_):
+        self._mic_handlers.disconnect_all()
         if self.audio.microphone:
-            self.audio.microphone.connect("notify::volume", self._update_mic_icon)
-            self.audio.microphone.connect("notify::muted", self._update_mic_icon)
+            self._mic_handlers.connect(
+                self.audio.microphone, "notify::volume", self._update_mic_icon
+            )
+            self._mic_handlers.connect(
+                self.audio.microphone, "notify::muted", self._update_mic_icon
+            )
             self._update_mic_icon()
 
     def _on_brightness_changed(self, *_):
         if self._is_brightness_available() and not self._updating_brightness:
             self.icon_brightness.set_text(get_brightness_icon(self._get_brightness()))
 
+    def _on_brightness_available(self, *_):
+        self._on_brightness_changed()
+
     def _update_speaker_icon(self, *_):
         if self.audio.speaker:
             self.icon_speaker.set_text(
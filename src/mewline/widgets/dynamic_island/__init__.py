@@ -17,6 +17,7 @@ from gi.repository import GLib
 from gi.repository import Gtk
 from loguru import logger
 
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.window_manager import WindowManagerContext
 from mewline.utils.window_manager import create_adaptive_window
 from mewline.widgets.dynamic_island.app_launcher import AppLauncher
@@ -73,6 +74,10 @@ class DynamicIsland:
         # different desktop or a different window among several.
         self._focused_node_before_open: str | None = None
 
+        # GLib sources owned by the island, removed again in `destroy`
+        self._pointer_poll_id = 0
+        self._resume_timer = DeadlineTimer(150, self._delayed_resume_all_timers)
+
         ##==> Defining the widgets
         #########################################
         self.compact = Compact(self)
@@ -390,6 +395,7 @@ class DynamicIsland:
         ##==> Show the dynamic island
         ######################################
         self.window.show()
+        self._deliver_module_visibility("compact")
 
     def _update_x11_constraints(self, widget_name: str):
         """Update window geometry hints for BSPWM/X11 to prevent unwanted expansion."""
@@ -1054,7 +1060,7 @@ class DynamicIsland:
         self._island_hovered = False
         # Small delay before resuming to avoid flicker
         # when moving between island elements
-        GLib.timeout_add(150, self._delayed_resume_all_timers)
+        self._resume_timer.arm()
         return False
 
     def _on_island_mouse_motion(self, widget, event):
@@ -1068,15 +1074,16 @@ class DynamicIsland:
         """Resume all notification timers after delay if not hovered."""
         if not self._island_hovered:
             self._resume_all_notification_timers()
-        return False
 
     def _start_island_pointer_polling(self):
-        try:
-            if getattr(self, "_pointer_poll_id", None):
-                return
-            self._pointer_poll_id = GLib.timeout_add(200, self._poll_pointer_inside)
-        except Exception:
-            ...
+        if self._pointer_poll_id:
+            return
+        self._pointer_poll_id = GLib.timeout_add(200, self._poll_pointer_inside)
+
+    def _stop_island_pointer_polling(self):
+        if self._pointer_poll_id:
+            GLib.source_remove(self._pointer_poll_id)
+            self._pointer_poll_id = 0
 
     def _poll_pointer_inside(self):
         try:
@@ -1149,6 +1156,28 @@ class DynamicIsland:
 
         return False
 
+    def _deliver_module_visibility(self, visible: str):
+        """Tell every module whether it is the one shown in the stack."""
+        for name, module in self.widgets.items():
+            if name == visible:
+                continue
+            with contextlib.suppress(Exception):
+                module.set_di_visible(False)
+        try:
+            self.widgets[visible].set_di_visible(True)
+        except Exception as e:
+            logger.warning(f"Failed to show Dynamic Island module {visible}: {e}")
+
+    def destroy(self):
+        """Tear down the island window, e.g. when its output was unplugged.
+
+        The module widgets are destroyed along with the window and drop their
+        service handlers and timers from their ``destroy`` handlers.
+        """
+        self._stop_island_pointer_polling()
+        self._resume_timer.cancel()
+        self.window.destroy()
+
     def close(self):
         self.set_keyboard_mode("none")
         # Move inline notifications to dedicated view (ordinary) before hiding capsule
@@ -1237,12 +1266,7 @@ class DynamicIsland:
         # Hide and clear inline notifications when closing DI
         self.hide_inline_notifications()
         # Stop pointer polling
-        try:
-            if getattr(self, "_pointer_poll_id", None):
-                GLib.source_remove(self._pointer_poll_id)
-                self._pointer_poll_id = None
-        except Exception:
-            ...
+        self._stop_island_pointer_polling()
 
         if self.current_widget is not None:
             self.call_module_method_if_exists(
@@ -1262,6 +1286,7 @@ class DynamicIsland:
         self.current_widget = None
         self.stack.set_visible_child(self.compact)
         self._update_x11_constraints("compact")
+        self._deliver_module_visibility("compact")
 
     def open(self, widget: str = "date-notification") -> None:
         if widget == "compact":
@@ -1324,6 +1349,7 @@ class DynamicIsland:
 
         self.inline_notification_container.add_style_class(widget)
 
+        self._deliver_module_visibility(widget)
         self.call_module_method_if_exists(
             self.widgets[self.current_widget], "open_widget_from_di"
         )
@@ -1,3 +1,40 @@
 class BaseDiWidget:
+    """Base class of the Dynamic Island modules.
+
+    DynamicIsland delivers the shown/hidden lifecycle through
+    `set_di_visible`. Modules reacting to external events call
+    `should_update_now()` first: while the module is hidden it is only marked
+    dirty, and the deferred work runs once in `update_on_show()` when the
+    module becomes visible again.
+    """
+
+    di_visible = False
+    di_dirty = False
+
     def __init__(self):
         self.focuse_kb = False
+
+    def set_di_visible(self, visible: bool) -> None:
+        if visible == self.di_visible:
+            return
+        self.di_visible = visible
+        if not visible:
+            self.on_di_hidden()
+            return
+        self.on_di_shown()
+        if self.di_dirty:
+            self.di_dirty = False
+            self.update_on_show()
+
+    def should_update_now(self) -> bool:
+        """Return whether to update now; hidden modules are marked dirty."""
+        if self.di_visible:
+            return True
+        self.di_dirty = True
+        return False
+
+    def on_di_shown(self) -> None: ...
+
+    def on_di_hidden(self) -> None: ...
+
+    def update_on_show(self) -> None: ...
@@ -12,7 +12,8 @@ from fabric.widgets.scrolledwindow import ScrolledWindow
 from loguru import logger
 
 from mewline import constants as cnst
-from mewline.services import bluetooth_client
+from mewline.services import get_service
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import setup_cursor_hover
 from mewline.utils.widget_utils import text_icon
 from mewline.widgets.dynamic_island.base import BaseDiWidget
@@ -32,9 +33,12 @@ class BluetoothDeviceSlot(CenterBox):
             # Just return early without destroying - let parent handle cleanup
             return
 
-        self.device.connect("changed", self.on_changed)
-        self.device.connect(
-            "notify::closed", lambda *_: self.device.closed and self.destroy()
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self.device, "changed", self.on_changed)
+        self._handlers.connect(
+            self.device,
+            "notify::closed",
+            lambda *_: self.device.closed and self.destroy(),
         )
 
         # Create connection button with improved styling
@@ -216,20 +220,22 @@ class BluetoothConnections(BaseDiWidget, Box):
             v_align="start",
         )
 
-        bluetooth_client.connect("device-added", self.on_device_added)
-        bluetooth_client.connect("notify::enabled", self.on_enabled)
-        bluetooth_client.connect("notify::scanning", self.on_scanning)
+        client = get_service("bluetooth")
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(client, "device-added", self.on_device_added)
+        self._handlers.connect(client, "notify::enabled", self.on_enabled)
+        self._handlers.connect(client, "notify::scanning", self.on_scanning)
 
         self.scan_button = Button(
             name="bluetooth-scan",
             label="Scan",
-            on_clicked=lambda *_: bluetooth_client.toggle_scan(),
+            on_clicked=lambda *_: get_service("bluetooth").toggle_scan(),
         )
         setup_cursor_hover(self.scan_button)
         self.toggle_button = Button(
             name="bluetooth-toggle",
             label="OFF",
-            on_clicked=lambda *_: bluetooth_client.toggle_power(),
+            on_clicked=lambda *_: get_service("bluetooth").toggle_power(),
         )
         setup_cursor_hover(self.toggle_button)
 
@@ -255,7 +261,7 @@ class BluetoothConnections(BaseDiWidget, Box):
         ]
 
     def on_enabled(self, *_):
-        if bluetooth_client.enabled:
+        if get_service("bluetooth").enabled:
             self.toggle_button.set_label("Enabled")
             self.toggle_button.add_style_class("enabled")
             self.toggle_button.remove_style_class("disabled")
@@ -265,7 +271,7 @@ class BluetoothConnections(BaseDiWidget, Box):
             self.toggle_button.remove_style_class("enabled")
 
     def on_scanning(self, *_):
-        if bluetooth_client.scanning:
+        if get_service("bluetooth").scanning:
             self.scan_button.set_label("Stop scanning")
         else:
             self.scan_button.set_label("Scan")
@@ -86,15 +86,19 @@ class Clipboard(BaseDiWidget, Box):
         self.load_history()
         self.setup_file_monitor()  # Настраиваем мониторинг изменений
         self.arrange_viewport()
+        self.connect("destroy", lambda *_: self.cancel_file_monitor())
 
         self.add(self.main_box)
         self.show_all()
 
     def close(self) -> None:
+        self.cancel_file_monitor()
+        self.di.close()
+
+    def cancel_file_monitor(self) -> None:
         if self.monitor:
             self.monitor.cancel()
             self.monitor = None
-        self.di.close()
 
     def load_history(self) -> None:
         self.history.clear()
@@ -1,7 +1,6 @@
 import contextlib
 import json
 import os
-import re
 import subprocess
 from typing import TYPE_CHECKING
 
@@ -15,12 +14,12 @@ from gi.repository import GLib
 from loguru import logger
 
 from mewline.config import cfg
-from mewline.constants import WINDOW_TITLE_MAP
-from mewline.services import audio_visualizer_service
+from mewline.services import get_service
 from mewline.services.mpris import MprisPlayer
-from mewline.services.mpris import MprisPlayerManager
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import setup_cursor_hover
 from mewline.utils.widget_utils import text_icon
+from mewline.utils.window_rules import get_window_rules
 from mewline.widgets.audio_visualizer import AudioVisualizerWidget
 from mewline.widgets.dynamic_island.base import BaseDiWidget
 
@@ -34,7 +33,7 @@ class Compact(BaseDiWidget, CenterBox):
     def __init__(self, di: "DynamicIsland"):
         super().__init__()
         self.config = cfg.modules.dynamic_island.compact
-        self.mpris_manager = MprisPlayerManager()
+        self.mpris_manager = get_service("mpris")
         self.current_mpris_player = None
         self._music_update_seq = 0
         self._music_last_title = None
@@ -64,6 +63,8 @@ class Compact(BaseDiWidget, CenterBox):
         if self.visualizer is not None:
             self.visualizer.set_margin_start(4)
             self.visualizer.hide()
+            # Levels are only produced while the visualizer is mapped
+            get_service("audio_visualizer").attach(self.visualizer)
         music_children: list = [self.cover, self.music_label]
         if self.visualizer is not None:
             music_children.append(self.visualizer)
@@ -97,9 +98,17 @@ class Compact(BaseDiWidget, CenterBox):
             h_expand=True,
         )
 
+        # The player manager is shared, drop our handlers when we are gone
+        self._handlers = SignalHandlers(self)
+        self.connect("destroy", lambda *_: self._set_mpris_player(None))
+
         if self.config.music.enabled:
-            self.mpris_manager.connect("player-appeared", self._on_player_changed)
-            self.mpris_manager.connect("player-vanished", self._on_player_changed)
+            self._handlers.connect(
+                self.mpris_manager, "player-appeared", self._on_player_changed
+            )
+            self._handlers.connect(
+                self.mpris_manager, "player-vanished", self._on_player_changed
+            )
             self._init_players()
 
         # Update app icon when title changes (only if enabled)
@@ -180,13 +189,24 @@ class Compact(BaseDiWidget, CenterBox):
         if not self.config.music.enabled or not self.mpris_manager.players:
             return
 
-        self.current_mpris_player = MprisPlayer(self.mpris_manager.players[0])
-        self.current_mpris_player.connect(
-            "notify::playback-status", self._update_display
-        )
-        self.current_mpris_player.connect("notify::metadata", self._update_display)
+        self._set_mpris_player(self.mpris_manager.players[0])
         self._update_display()
 
+    def _set_mpris_player(self, player):
+        """Follow *player* (a Playerctl player), or no player for ``None``."""
+        if self.current_mpris_player:
+            self.current_mpris_player.disconnect_by_func(self._update_display)
+            self.current_mpris_player.close()
+        self.current_mpris_player = None
+        if player is not None:
+            self.current_mpris_player = MprisPlayer(player)
+            self.current_mpris_player.connect(
+                "notify::playback-status", self._update_display
+            )
+            self.current_mpris_player.connect(
+                "notify::metadata", self._update_display
+            )
+
     def _format_window_title(self, win_title, win_class):
         """Format window title according to config and title map."""
         # Store window class for icon matching
@@ -198,37 +218,23 @@ class Compact(BaseDiWidget, CenterBox):
             else win_title
         )
 
-        merged_titles = self.config.window_titles.title_map + WINDOW_TITLE_MAP
-        matched = next(
-            (wt for wt in merged_titles if re.search(wt[0], win_class.lower())), None
-        )
+        matched = get_window_rules().match(win_class.lower())
 
         if not matched:
             return win_class.lower()
 
-        if matched[0] == "^$" or win_class == "undefined":
+        if matched.pattern == "^$" or win_class == "undefined":
             base = f"{os.getlogin()}@{os.uname().nodename}"
             return base
 
         # Only text here; visual icon is handled via self.window_icon
-        return matched[2]
+        return matched.title
 
     def _on_player_changed(self, manager, player):
         if not self.config.music.enabled:
             return
 
-        if self.current_mpris_player:
-            self.current_mpris_player.disconnect_by_func(self._update_display)
-
-        if manager.players:
-            self.current_mpris_player = MprisPlayer(manager.players[0])
-            self.current_mpris_player.connect(
-                "notify::playback-status", self._update_display
-            )
-            self.current_mpris_player.connect("notify::metadata", self._update_display)
-        else:
-            self.current_mpris_player = None
-
+        self._set_mpris_player(manager.players[0] if manager.players else None)
         self._update_display()
 
     def _update_display(self, *args):
@@ -297,8 +303,6 @@ class Compact(BaseDiWidget, CenterBox):
             self._music_last_art_url = art_url
 
         if self.visualizer is not None:
-            audio_visualizer_service.set_callback(self.visualizer.set_levels)
-            audio_visualizer_service.start()
             self.visualizer.show()
 
         self.main_container.children = [self.music_box]
@@ -360,70 +364,30 @@ class Compact(BaseDiWidget, CenterBox):
             Window class (checks both instance and class from WM_CLASS)
         """
         try:
-            from mewline.custom_fabric.bspwm.widgets import get_bspwm_connection
-
-            conn = get_bspwm_connection()
-            if not conn:
-                return ""
+            from mewline.custom_fabric.bspwm.x11 import get_active_window_watcher
 
-            # Get focused node ID
-            reply = conn.send_command("query -N -n focused", silent=True)
-            if not reply.is_ok or not reply.output:
+            watcher = get_active_window_watcher()
+            if not watcher.window_id:
                 return ""
 
-            node_id = reply.output.strip()
-            if not node_id:
-                return ""
+            instance = watcher.instance.lower()
+            wm_class = watcher.wm_class.lower()
 
-            # Get window class using xprop
-            try:
-                result = subprocess.run(
-                    ["xprop", "-id", node_id, "WM_CLASS"],
-                    capture_output=True,
-                    text=True,
-                    timeout=1,
-                )
-                if result.returncode == 0 and result.stdout:
-                    # WM_CLASS(STRING) = "instance", "Class"
-                    # Extract both values and try to match
-                    match = re.search(r'"([^"]+)",\s*"([^"]+)"', result.stdout)
-                    if match:
-                        instance = match.group(1).lower()
-                        wm_class = match.group(2).lower()
-
-                        # Log for debugging
-                        logger.debug(
-                            f"[Compact] WM_CLASS: instance='{instance}', "
-                            f"class='{wm_class}'"
-                        )
-
-                        # Try to find match with both instance and class
-                        merged_titles = (
-                            self.config.window_titles.title_map + WINDOW_TITLE_MAP
-                        )
-
-                        # First try instance
-                        for entry in merged_titles:
-                            if re.search(entry[0], instance):
-                                return instance
-
-                        # Then try class
-                        for entry in merged_titles:
-                            if re.search(entry[0], wm_class):
-                                return wm_class
-
-                        # Return instance as default
-                        return instance
-            except Exception as e:
-                logger.debug(f"[Compact] xprop failed: {e}")
+            # Prefer whichever of instance and class has a matching rule
+            rules = get_window_rules()
+            if rules.match(instance):
+                return instance
+            if rules.match(wm_class):
+                return wm_class
 
-            return ""
+            # Return instance as default
+            return instance
         except Exception as e:
             logger.debug(f"[Compact] Error getting bspwm window class: {e}")
             return ""
 
     def _get_nerd_icon_for_app(self, app_class: str) -> str:
-        """Get nerd font icon for app from WINDOW_TITLE_MAP.
+        """Get nerd font icon for app from the window title rules.
 
         Args:
             app_class: Application class/id (lowercase)
@@ -434,25 +398,7 @@ class Compact(BaseDiWidget, CenterBox):
         if not app_class:
             return "󰣆"
 
-        app_class_lower = app_class.lower()
-        merged_titles = self.config.window_titles.title_map + WINDOW_TITLE_MAP
-
-        # Search for matching pattern in title map
-        for entry in merged_titles:
-            try:
-                if re.search(entry[0], app_class_lower):  # noqa: SIM102
-                    if len(entry) >= 2 and entry[1]:
-                        logger.debug(
-                            f"[Compact] Matched '{app_class_lower}' -> "
-                            f"pattern '{entry[0]}' -> icon '{entry[1]}'"
-                        )
-                        return entry[1]
-            except Exception as e:
-                logger.debug(f"[Compact] Error matching pattern '{entry[0]}': {e}")
-
-        # Fallback icon
-        logger.debug(f"[Compact] No match for '{app_class_lower}', using fallback")
-        return "󰣆"
+        return get_window_rules().icon_for(app_class.lower(), "󰣆")
 
     def _update_window_icon(self):
         """Update window icon based on current WM and active window."""
@@ -516,8 +462,6 @@ class Compact(BaseDiWidget, CenterBox):
         )
 
         if self.visualizer is not None:
-            audio_visualizer_service.set_callback(self.visualizer.set_levels)
-            audio_visualizer_service.start()
             self.visualizer.show()
 
         # Обновление контейнера
@@ -528,10 +472,6 @@ class Compact(BaseDiWidget, CenterBox):
     def _show_window_title(self):
         """Show window title with icon."""
         if self.visualizer is not None:
-            audio_visualizer_service.remove_callback(self.visualizer.set_levels)
-            # Only stop if no callbacks remain
-            if not audio_visualizer_service._callbacks:
-                audio_visualizer_service.stop()
             self.visualizer.hide()
         # Ensure icon enablement applied before showing row
         self._apply_icon_enablement()
@@ -16,12 +16,12 @@ from gi.repository import Gtk
 from loguru import logger
 
 import mewline.constants as cnst
-from mewline.services import cache_notification_service
-from mewline.services import notification_service
+from mewline.services import get_service
 from mewline.shared.rounded_image import CustomImage
 from mewline.utils.misc import check_icon_exists
 from mewline.utils.misc import parse_markup
 from mewline.utils.misc import uptime
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import get_icon
 from mewline.utils.widget_utils import setup_cursor_hover
 from mewline.widgets.dynamic_island.base import BaseDiWidget
@@ -131,7 +131,9 @@ class NotificationHistoryEl(Box):
                             ...
                         # Persist that an action was clicked for this history item
                         with contextlib.suppress(Exception):
-                            cache_notification_service.mark_action_clicked(self._id)
+                            get_service("cache_notification").mark_action_clicked(
+                                self._id
+                            )
                     try:
                         parent = getattr(act, "parent", None)
                         action_id = None
@@ -188,7 +190,7 @@ class NotificationHistoryEl(Box):
             self.children = [self.main_container]
 
     def clear_notification(self, id):
-        cache_notification_service.remove_notification(id)
+        get_service("cache_notification").remove_notification(id)
         if callable(self._on_removed):
             with contextlib.suppress(Exception):
                 self._on_removed(id)
@@ -543,11 +545,11 @@ class DateNotificationMenu(BaseDiWidget, Box):
         )
 
         self.notifications: list[Notification] = (
-            cache_notification_service.get_deserialized()
+            get_service("cache_notification").get_deserialized()
         )
 
         # Get the raw data for IDs
-        raw_notifications = cache_notification_service.do_read_notifications()
+        raw_notifications = get_service("cache_notification").do_read_notifications()
 
         # Build groups by app_name
         items: list[tuple[Notification, dict]] = list(zip(self.notifications, raw_notifications, strict=False))
@@ -707,7 +709,8 @@ class DateNotificationMenu(BaseDiWidget, Box):
         )
 
         clear_button.connect(
-            "clicked", lambda _: cache_notification_service.clear_all_notifications()
+            "clicked",
+            lambda _: get_service("cache_notification").clear_all_notifications(),
         )
 
         setup_cursor_hover(clear_button)
@@ -771,9 +774,26 @@ class DateNotificationMenu(BaseDiWidget, Box):
         notification_column.set_visible(True)
         date_column.set_visible(True)
 
-        invoke_repeater(1000, self.update_labels, initial_call=True)
-        notification_service.connect("notification-added", self.on_new_notification)
-        cache_notification_service.connect("clear_all", self.on_clear_all_notifications)
+        self._labels_source_id = invoke_repeater(
+            1000, self.update_labels, initial_call=True
+        )
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(
+            get_service("notifications"),
+            "notification-added",
+            self.on_new_notification,
+        )
+        self._handlers.connect(
+            get_service("cache_notification"),
+            "clear_all",
+            self.on_clear_all_notifications,
+        )
+        self.connect("destroy", self._on_destroy)
+
+    def _on_destroy(self, *_):
+        if self._labels_source_id:
+            GLib.source_remove(self._labels_source_id)
+            self._labels_source_id = 0
 
     def on_clear_all_notifications(self, *_):
         self.notification_list_box.children = []
@@ -787,13 +807,13 @@ class DateNotificationMenu(BaseDiWidget, Box):
         self.placeholder.set_visible(True)
 
     def on_new_notification(self, fabric_notif, id):
-        if cache_notification_service.dont_disturb:
+        if get_service("cache_notification").dont_disturb:
             return
 
         notification: Notification = fabric_notif.get_notification_from_id(id)
 
         try:
-            raw_cache = cache_notification_service.do_read_notifications()
+            raw_cache = get_service("cache_notification").do_read_notifications()
             new_cache_id = raw_cache[-1]["id"] if raw_cache else 1
         except Exception:
             new_cache_id = 1
@@ -896,7 +916,7 @@ class DateNotificationMenu(BaseDiWidget, Box):
 
     def on_dnd_switch(self, switch, _):
         if switch.get_active():
-            cache_notification_service.dont_disturb = True
+            get_service("cache_notification").dont_disturb = True
 
         else:
-            cache_notification_service.dont_disturb = False
+            get_service("cache_notification").dont_disturb = False
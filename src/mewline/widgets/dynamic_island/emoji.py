@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING
 
-from emoji.unicode_codes import EMOJI_DATA
 from fabric.utils import remove_handler
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -35,7 +34,7 @@ class EmojiPicker(BaseDiWidget, Box):
         self.total_pages = 0
 
         self._arranger_handler: int = 0
-        self._all_emojis = self._load_emoji_data()
+        self._emoji_data: dict | None = None
 
         self.stack = Stack(
             name="viewport",
@@ -80,8 +79,14 @@ class EmojiPicker(BaseDiWidget, Box):
         self.add(self.picker_box)
         self.show_all()
 
-    def _load_emoji_data(self):
-        return EMOJI_DATA
+    @property
+    def _all_emojis(self) -> dict:
+        # The emoji database is large, load it when the picker is first used
+        if self._emoji_data is None:
+            from emoji.unicode_codes import EMOJI_DATA
+
+            self._emoji_data = EMOJI_DATA
+        return self._emoji_data
 
     def close_picker(self):
         self.stack.children = []
@@ -12,6 +12,7 @@ from fabric.widgets.scrolledwindow import ScrolledWindow
 from gi.repository import GLib
 from loguru import logger
 
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.widget_utils import setup_cursor_hover
 from mewline.utils.widget_utils import text_icon
 from mewline.widgets.dynamic_island.base import BaseDiWidget
@@ -416,6 +417,7 @@ class NetworkConnections(BaseDiWidget, Box):
         self._pending_refresh = False
         self._current_view: Literal["wifi", "ethernet"] = "wifi"
         self._slots_lock = Lock()
+        self._status_timer = DeadlineTimer(2000, self._hide_status)
         # Инициализируем кэши с пустыми контейнерами
         self._cached_wifi_slots = Box(orientation="vertical", spacing=4)
         self._cached_ethernet_slots = Box(orientation="vertical", spacing=4)
@@ -473,14 +475,12 @@ class NetworkConnections(BaseDiWidget, Box):
     def _show_persistent_status(self, message: str):
         """Показывает статус, который не исчезнет автоматически."""
         self.title_label.set_label(message)
-        if hasattr(self, "_status_timeout"):
-            GLib.source_remove(self._status_timeout)
-            del self._status_timeout
+        self._status_timer.cancel()
 
     def _show_temporary_status(self, message: str, timeout: int = 2000):
         """Показывает временный статус с таймаутом."""
         self._show_persistent_status(message)
-        self._status_timeout = GLib.timeout_add(timeout, self._hide_status)
+        self._status_timer.arm(timeout)
 
     def _hide_status(self):
         """Скрывает статус, восстанавливая заголовок по умолчанию."""
@@ -21,10 +21,11 @@ from loguru import logger
 
 from mewline import constants as cnst
 from mewline.config import cfg
-from mewline.services import cache_notification_service
-from mewline.services import notification_service
+from mewline.services import get_service
 from mewline.shared.rounded_image import CustomImage
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.misc import check_icon_exists
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.window_manager import create_monitor_manager
 from mewline.widgets.dynamic_island.base import BaseDiWidget
 
@@ -176,7 +177,7 @@ class NotificationBox(Box):
         else:
             self.timeout_ms = actual_timeout
 
-        self._timeout_id = None
+        self._timeout = DeadlineTimer(self.timeout_ms, self.close_notification)
         # Island-level hover detection will handle pausing, keep simple setup
         self.start_timeout()
 
@@ -308,12 +309,10 @@ class NotificationBox(Box):
         self.stop_timeout()
         if not self.timeout_ms or self.timeout_ms == 0:
             return
-        self._timeout_id = GLib.timeout_add(self.timeout_ms, self.close_notification)
+        self._timeout.arm(self.timeout_ms)
 
     def stop_timeout(self):
-        if self._timeout_id is not None:
-            GLib.source_remove(self._timeout_id)
-            self._timeout_id = None
+        self._timeout.cancel()
 
     def close_notification(self):
         # If this notification has actions and no action has been invoked yet,
@@ -384,7 +383,12 @@ class NotificationContainer(BaseDiWidget, Box):
         self.dynamic_island = di
         self.monitors = create_monitor_manager()
         self._boxes_by_id: dict[int, NotificationBox] = {}
-        notification_service.connect("notification-added", self.on_new_notification)
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(
+            get_service("notifications"),
+            "notification-added",
+            self.on_new_notification,
+        )
 
         # Dedicated view carousel (stack + dots + prev/next)
         self.view_stack = FabricStack(
@@ -814,9 +818,9 @@ class NotificationContainer(BaseDiWidget, Box):
         if current_monitor is not None and current_monitor not in allowed_ids:
             return
 
-        cache_notification_service.cache_notification(notification)
+        get_service("cache_notification").cache_notification(notification)
 
-        if cache_notification_service.dont_disturb:
+        if get_service("cache_notification").dont_disturb:
             return
 
         new_box = NotificationBox(notification)
@@ -20,9 +20,6 @@ from gi.repository import GdkPixbuf
 from gi.repository import GLib
 from gi.repository import Gtk
 from loguru import logger
-from PIL import Image
-from PIL import ImageChops
-from PIL import ImageDraw
 
 from mewline import constants as cnst
 from mewline.widgets.dynamic_island.base import BaseDiWidget
@@ -762,6 +759,10 @@ class PawletteThemesV2(BaseDiWidget, Box):
 
     @staticmethod
     def _apply_rounded_corners(pixbuf, radius):
+        from PIL import Image
+        from PIL import ImageChops
+        from PIL import ImageDraw
+
         width = pixbuf.get_width()
         height = pixbuf.get_height()
         data = pixbuf.get_pixels()
@@ -13,9 +13,6 @@ from gi.repository import GdkPixbuf
 from gi.repository import GLib
 from gi.repository import Gtk
 from loguru import logger
-from PIL import Image
-from PIL import ImageChops
-from PIL import ImageDraw
 
 from mewline.widgets.dynamic_island.base import BaseDiWidget
 
@@ -276,6 +273,10 @@ class PawletteThemes(BaseDiWidget, Box):
 
     @staticmethod
     def _apply_rounded_corners(pixbuf, radius):
+        from PIL import Image
+        from PIL import ImageChops
+        from PIL import ImageDraw
+
         # Конвертируем GdkPixbuf в PIL Image
         width = pixbuf.get_width()
         height = pixbuf.get_height()
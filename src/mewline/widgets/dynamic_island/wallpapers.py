@@ -7,6 +7,7 @@ import subprocess
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from fabric.widgets.box import Box
 from fabric.widgets.centerbox import CenterBox
@@ -18,8 +19,6 @@ from gi.repository import Gio
 from gi.repository import GLib
 from gi.repository import Gtk
 from loguru import logger
-from PIL import Image
-from PIL import ImageDraw
 
 from mewline import constants as cnst
 from mewline.config import cfg
@@ -27,6 +26,9 @@ from mewline.utils.window_manager import WindowManagerContext
 from mewline.widgets.dynamic_island.base import BaseDiWidget
 from mewline.widgets.dynamic_island.pawlette_themes import is_pawlette_v2
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 # Dynamic theme helpers (shared with pawlette_themes.py)
 # Only available for pawlette v2+
 _DYNAMIC_STATE_FILE = cnst.XDG_STATE_HOME / "meowrch" / "dynamic_theme"
@@ -210,6 +212,7 @@ class WallpaperSelector(BaseDiWidget, Box):
         self.add(self.scrolled_window)
         self._start_thumbnail_thread()
         self.setup_file_monitor()
+        self.connect("destroy", self._on_destroy)
         self.show_all()
         self.search_entry.grab_focus()
 
@@ -263,6 +266,13 @@ class WallpaperSelector(BaseDiWidget, Box):
             symlink_monitor.connect("changed", self.on_symlink_changed)
             self.symlink_monitors.append(symlink_monitor)
 
+    def _on_destroy(self, *_):
+        for monitor in self.file_monitors + self.symlink_monitors:
+            monitor.cancel()
+        self.file_monitors.clear()
+        self.symlink_monitors.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
     def on_symlink_changed(self, _monitor, _file, _other_file, event_type):
         if event_type in (
             Gio.FileMonitorEvent.CHANGES_DONE_HINT,
@@ -497,6 +507,8 @@ class WallpaperSelector(BaseDiWidget, Box):
         ) > os.path.getmtime(full_path):
             self.thumbnail_queue.append((cache_path, file_name))
         else:
+            from PIL import Image
+
             try:
                 with Image.open(full_path) as img:
                     size = min(img.size)
@@ -577,7 +589,10 @@ class WallpaperSelector(BaseDiWidget, Box):
             return None
 
     @staticmethod
-    def _add_rounded_corners(im: Image.Image, radius: int) -> Image.Image:
+    def _add_rounded_corners(im: "Image.Image", radius: int) -> "Image.Image":
+        from PIL import Image
+        from PIL import ImageDraw
+
         mask = Image.new("L", im.size, 0)
         draw = ImageDraw.Draw(mask)
         draw.rounded_rectangle([(0, 0), im.size], radius=radius, fill=255)
@@ -1,9 +1,8 @@
 import contextlib
 import json
-import re
 
 import gi
-from fabric.hyprland import Hyprland
+from fabric.hyprland.widgets import get_hyprland_connection
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.image import Image
@@ -13,12 +12,13 @@ from gi.repository import GLib
 from gi.repository import Gtk
 
 from mewline.config import cfg
-from mewline.constants import WINDOW_TITLE_MAP
 from mewline.custom_fabric.bspwm import get_bspwm_connection
 from mewline.utils.icon_resolver import get_icon_pixbuf_for_app
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import text_icon
 from mewline.utils.window_manager import WindowManager
 from mewline.utils.window_manager import detect_window_manager
+from mewline.utils.window_rules import get_window_rules
 from mewline.widgets.dynamic_island.base import BaseDiWidget
 
 BASE_SCALE = 0.10  # target scale per monitor (approx like competitor)
@@ -42,7 +42,10 @@ class WorkspacesOverview(BaseDiWidget, Box):
 
         # Detect WM and init connections
         self._wm = detect_window_manager()
-        self._hypr = Hyprland() if self._wm == WindowManager.HYPRLAND else None
+        # Shared connection: a socket of its own per island would outlive it
+        self._hypr = (
+            get_hyprland_connection() if self._wm == WindowManager.HYPRLAND else None
+        )
         try:
             self._bspwm = (
                 get_bspwm_connection() if self._wm == WindowManager.BSPWM else None
@@ -57,6 +60,14 @@ class WorkspacesOverview(BaseDiWidget, Box):
         # Containers per workspace
         self._ws_fixed: dict[int, Gtk.Fixed] = {}
         self._ws_eventbox: dict[int, Gtk.EventBox] = {}
+        self._tile_size: tuple[int, int] = (0, 0)
+
+        # Overview model: miniatures keyed by window address, placeholders
+        # keyed by workspace. Both survive refreshes and are diffed in place.
+        self._windows: dict[str, dict] = {}
+        self._placeholders: dict[int, Button] = {}
+        self._refresh_tick_id = 0
+        self._wm_handlers = SignalHandlers(self)
 
         # Grid rows
         self.row_top = Box(orientation="h", spacing=8)
@@ -77,43 +88,60 @@ class WorkspacesOverview(BaseDiWidget, Box):
         except Exception:
             ...
 
-        # Build tiles and initial content
+        # Build tiles; content is filled in when the overview is first shown
         self._build_grid()
-        self.refresh()
+        self.di_dirty = True
         self._hook_wm_events()
 
-    def open_widget_from_di(self):
-        # Refresh when opened to ensure fresh layout
+    def on_di_hidden(self):
+        # Window resizes are not evented, so re-read the layout on next show
+        self.di_dirty = True
+
+    def update_on_show(self):
         self.refresh()
+
+    def open_widget_from_di(self):
         # Ensure widget grabs focus so arrow keys work
         GLib.idle_add(lambda: (self.grab_focus(), False)[1])
 
     def _hook_wm_events(self):
         try:
             if self._wm == WindowManager.HYPRLAND and self._hypr:
-                self._hypr.connect(
-                    "event::openwindow", lambda *_: self._queue_refresh()
-                )
-                self._hypr.connect(
-                    "event::closewindow", lambda *_: self._queue_refresh()
-                )
-                self._hypr.connect(
-                    "event::movewindow", lambda *_: self._queue_refresh()
-                )
-                self._hypr.connect("event::workspace", lambda *_: self._queue_refresh())
+                for event in ("openwindow", "closewindow", "movewindow", "workspace"):
+                    self._wm_handlers.connect(
+                        self._hypr, f"event::{event}", lambda *_: self._queue_refresh()
+                    )
             elif self._wm == WindowManager.BSPWM and self._bspwm:
-                self._bspwm.connect("event::report", lambda *_: self._queue_refresh())
+                self._wm_handlers.connect(
+                    self._bspwm, "event::report", lambda *_: self._queue_refresh()
+                )
         except Exception:
             ...
 
     def _queue_refresh(self):
-        GLib.timeout_add(100, lambda: (self.refresh(), False)[1])
+        # Hidden overviews only remember that they are stale
+        if not self.should_update_now():
+            return False
+        # Coalesce event bursts into a single refresh on the next frame
+        if self._refresh_tick_id:
+            return False
+        try:
+            self._refresh_tick_id = self.add_tick_callback(self._on_refresh_tick)
+        except Exception:
+            self.refresh()
         return False
 
-    def _monitor_dims(self) -> tuple[int, int, dict[int, dict]]:
+    def _on_refresh_tick(self, *_):
+        self._refresh_tick_id = 0
+        self.refresh()
+        return GLib.SOURCE_REMOVE
+
+    def _monitor_dims(
+        self, state: dict | None = None
+    ) -> tuple[int, int, dict[int, dict]]:
         """Return (width,height) of focused monitor and monitors map."""
         if self._wm == WindowManager.BSPWM and self._bspwm:
-            state = self._bspwm.get_state() or {}
+            state = state or {}
             mons = state.get("monitors", [])
             focused_id = state.get("focusedMonitorId")
             focused = next(
@@ -194,8 +222,18 @@ class WorkspacesOverview(BaseDiWidget, Box):
         return tile
 
     def refresh(self):
+        self.di_dirty = False
+        # A direct refresh satisfies any frame-coalesced one still pending
+        if self._refresh_tick_id:
+            with contextlib.suppress(Exception):
+                self.remove_tick_callback(self._refresh_tick_id)
+            self._refresh_tick_id = 0
+
+        # bspwm serves monitors and clients from one dump
+        state = self._bspwm.get_state() if self._bspwm else None
+
         # Compute target tile size from monitor dims
-        mon_w, mon_h, monmap = self._monitor_dims()
+        mon_w, mon_h, monmap = self._monitor_dims(state)
         tile_w = max(120, int(mon_w * BASE_SCALE))
         tile_h = max(80, int(mon_h * BASE_SCALE))
         eff_scale = tile_w / max(1, mon_w)
@@ -206,37 +244,36 @@ class WorkspacesOverview(BaseDiWidget, Box):
         prev_addr = None
         prev_ws = None
         if self._focus_idx is not None and 0 <= self._focus_idx < len(self._mini):
-            prev_addr = self._mini[self._focus_idx].get("addr")
-            prev_ws = self._mini[self._focus_idx].get("ws")
+            prev = self._mini[self._focus_idx]
+            prev_addr = prev.get("addr")
+            prev_ws = prev.get("ws")
+            # Miniatures survive refreshes, so drop the highlight explicitly
+            with contextlib.suppress(Exception):
+                prev["btn"].remove_style_class("focused")
         sel_addr = self._pending_focus_addr or prev_addr
         sel_ws = self._pending_focus_ws or prev_ws
 
-        # Reset miniatures
+        # Reset navigation state; it is rebuilt from the model below
         self._mini.clear()
         self._focus_idx = None
 
         # Resize tiles
-        for _ws_id, ev in self._ws_eventbox.items():
-            with contextlib.suppress(Exception):
-                ev.set_size_request(tile_w, tile_h)
-
-        # Clear existing clients
-        for fixed in self._ws_fixed.values():
-            try:
-                for child in list(fixed.get_children()):
-                    fixed.remove(child)
-            except Exception:
-                ...
+        if (tile_w, tile_h) != self._tile_size:
+            self._tile_size = (tile_w, tile_h)
+            for _ws_id, ev in self._ws_eventbox.items():
+                with contextlib.suppress(Exception):
+                    ev.set_size_request(tile_w, tile_h)
 
         # Fetch clients in WM-agnostic form
-        clients = self._get_clients()
+        clients = self._get_clients(state)
 
-        used_ws: set[int] = set()
-        # Place clients into their workspace containers
+        # Target geometry of every window, keyed by address
+        targets: dict[str, dict] = {}
         for c in clients:
             try:
                 ws = int(c.get("ws", -1))
-                if ws < self._ws_start or ws > self._ws_end:
+                addr_val = c.get("addr")
+                if ws < self._ws_start or ws > self._ws_end or addr_val is None:
                     continue
 
                 mon_id = c.get("monitor")
@@ -249,90 +286,54 @@ class WorkspacesOverview(BaseDiWidget, Box):
                 ch = int(c.get("h", 60))
 
                 # Relative position within monitor, then scale
-                rel_x = max(0, int((cx - mon_x) * eff_scale))
-                rel_y = max(0, int((cy - mon_y) * eff_scale))
                 bw = max(8, int(cw * eff_scale))
                 bh = max(8, int(ch * eff_scale))
+                targets[addr_val] = {
+                    "ws": ws,
+                    "x": max(0, int((cx - mon_x) * eff_scale)),
+                    "y": max(0, int((cy - mon_y) * eff_scale)),
+                    "w": bw,
+                    "h": bh,
+                    "class": (c.get("class") or "").lower(),
+                    "icon_size": max(12, min(22, int(min(bw, bh) * 0.6))),
+                    "title": (c.get("title") or c.get("class") or "")[:128],
+                }
+            except Exception:
+                ...
+
+        # Destroy miniatures of windows that vanished
+        for addr in [a for a in self._windows if a not in targets]:
+            self._destroy_miniature(self._windows.pop(addr))
+
+        used_ws: set[int] = set()
+        # Create new miniatures, update the existing ones in place
+        for addr_val, target in targets.items():
+            try:
+                item = self._windows.get(addr_val)
+                if item is None:
+                    item = self._create_miniature(addr_val, target)
+                    self._windows[addr_val] = item
+                else:
+                    self._update_miniature(item, target)
+
+                ws = item["ws"]
+                used_ws.add(ws)
 
                 # Compute grid origin for this workspace tile
                 col = (ws - self._ws_start) % 5
                 row = 0 if ws <= (self._ws_start + 4) else 1
                 origin_x = col * (tile_w + H_GAP)
                 origin_y = row * (tile_h + V_GAP)
-                gx = origin_x + rel_x
-                gy = origin_y + rel_y
-
-                # Create window miniature as a button
-                app_id = (c.get("class") or "").lower()
-                icon_size = max(12, min(22, int(min(bw, bh) * 0.6)))
-                pixbuf, _source, _iname = get_icon_pixbuf_for_app(app_id, icon_size)
-                if pixbuf is not None:
-                    icon_child = Image(pixbuf=pixbuf)
-                else:
-                    # Fallback to mapping glyph icon
-                    glyph = self._resolve_icon_for_class(app_id) or "󰣆"
-                    icon_child = text_icon(
-                        glyph, size=f"{max(12, min(20, icon_size))}px"
-                    )
-
-                # Badge holder to apply glow; size ~ icon size to reduce square look
-                icon_badge = Box(
-                    name="app-icon-badge",
-                    h_align="center",
-                    v_align="center",
-                    children=[icon_child],
-                )
-                with contextlib.suppress(Exception):
-                    icon_badge.set_size_request(icon_size, icon_size)
-
-                addr_val = c.get("addr")
-                tooltip_title = (c.get("title") or c.get("class") or "")[:128]
-                btn = Button(
-                    name="overview-client-box",
-                    tooltip_text=tooltip_title,
-                    child=icon_badge,
-                    on_clicked=lambda *_a, addr=addr_val: self._focus(addr),
-                    on_button_press_event=(
-                        lambda _w, event, addr=addr_val: self._maybe_close(event, addr)
-                    ),
-                )
-                # Hover highlight
-                try:
-                    btn.add_events(
-                        Gdk.EventMask.ENTER_NOTIFY_MASK
-                        | Gdk.EventMask.LEAVE_NOTIFY_MASK
-                    )
-                    btn.connect(
-                        "enter-notify-event",
-                        lambda _w, _e, b=btn: (b.add_style_class("hover"), False)[1],
-                    )
-                    btn.connect(
-                        "leave-notify-event",
-                        lambda _w, _e, b=btn: (b.remove_style_class("hover"), False)[1],
-                    )
-                except Exception:
-                    ...
-
-                # Ensure button has the desired miniature size
-                with contextlib.suppress(Exception):
-                    btn.set_size_request(bw, bh)
-
-                # Put into the workspace fixed container
-                fixed = self._ws_fixed.get(ws)
-                if fixed is not None:
-                    fixed.put(btn, rel_x, rel_y)
-
-                used_ws.add(ws)
 
                 # Track miniature for navigation
                 self._mini.append(
                     {
-                        "btn": btn,
+                        "btn": item["btn"],
                         "ws": ws,
-                        "gx": gx,
-                        "gy": gy,
-                        "w": bw,
-                        "h": bh,
+                        "gx": origin_x + item["x"],
+                        "gy": origin_y + item["y"],
+                        "w": item["w"],
+                        "h": item["h"],
                         "addr": addr_val,
                     }
                 )
@@ -341,78 +342,41 @@ class WorkspacesOverview(BaseDiWidget, Box):
 
         # Add empty workspace placeholders if enabled
         try:
-            if getattr(cfg.modules.workspaces, "navigate_empty", False):
-                ids = list(range(self._ws_start, self._ws_end + 1))
-                for ws in ids:
-                    if ws in used_ws:
-                        continue
-                    # compute tile origin
-                    col = (ws - self._ws_start) % 5
-                    row = 0 if ws <= (self._ws_start + 4) else 1
-                    origin_x = col * (tile_w + H_GAP)
-                    origin_y = row * (tile_h + V_GAP)
-
-                    # button filling the tile
-                    ws_num_label = Label(
-                        name="ws-number",
-                        label=str(ws),
-                        h_align="center",
-                        v_align="center",
-                    )
-                    placeholder = Button(
-                        name="overview-client-box",
-                        tooltip_text=f"Switch to workspace {ws}",
-                        child=ws_num_label,
-                        on_clicked=lambda *_a, wid=ws: self._on_placeholder_clicked(
-                            wid
-                        ),
-                    )
-                    try:
-                        placeholder.set_size_request(tile_w, tile_h)
-                        placeholder.add_events(
-                            Gdk.EventMask.ENTER_NOTIFY_MASK
-                            | Gdk.EventMask.LEAVE_NOTIFY_MASK
-                        )
-                        placeholder.connect(
-                            "enter-notify-event",
-                            lambda _w, _e, b=placeholder: (
-                                b.add_style_class("hover"),
-                                False,
-                            )[1],
-                        )
-                        placeholder.connect(
-                            "leave-notify-event",
-                            lambda _w, _e, b=placeholder: (
-                                b.remove_style_class("hover"),
-                                False,
-                            )[1],
-                        )
-                    except Exception:
-                        ...
-
-                    fixed = self._ws_fixed.get(ws)
-                    if fixed is not None:
-                        fixed.put(placeholder, 0, 0)
-
-                    # Track as navigable item
-                    self._mini.append(
-                        {
-                            "btn": placeholder,
-                            "ws": ws,
-                            "gx": origin_x,
-                            "gy": origin_y,
-                            "w": tile_w,
-                            "h": tile_h,
-                            "addr": None,
-                        }
-                    )
+            navigate_empty = getattr(cfg.modules.workspaces, "navigate_empty", False)
+            ids = list(range(self._ws_start, self._ws_end + 1))
+            for ws in ids:
+                placeholder = self._placeholders.get(ws)
+                if not navigate_empty or ws in used_ws:
+                    if placeholder is not None:
+                        self._destroy_widget(self._placeholders.pop(ws), ws)
+                    continue
+                # compute tile origin
+                col = (ws - self._ws_start) % 5
+                row = 0 if ws <= (self._ws_start + 4) else 1
+                origin_x = col * (tile_w + H_GAP)
+                origin_y = row * (tile_h + V_GAP)
+
+                if placeholder is None:
+                    placeholder = self._create_placeholder(ws)
+                    self._placeholders[ws] = placeholder
+                with contextlib.suppress(Exception):
+                    placeholder.set_size_request(tile_w, tile_h)
+
+                # Track as navigable item
+                self._mini.append(
+                    {
+                        "btn": placeholder,
+                        "ws": ws,
+                        "gx": origin_x,
+                        "gy": origin_y,
+                        "w": tile_w,
+                        "h": tile_h,
+                        "addr": None,
+                    }
+                )
         except Exception:
             ...
 
-        # Show all new children
-        with contextlib.suppress(Exception):
-            self.show_all()
-
         # Restore focus preference:
         # by address, then workspace (placeholder first), else first
         if self._mini:
@@ -453,9 +417,148 @@ class WorkspacesOverview(BaseDiWidget, Box):
         self._pending_focus_ws = None
         self._pending_focus_addr = None
 
-    def _get_clients(self) -> list[dict]:
+    # ------------------------------------------------------------------
+    # Miniature widgets
+    # ------------------------------------------------------------------
+
+    def _build_icon(self, app_id: str, icon_size: int) -> Box:
+        pixbuf, _source, _iname = get_icon_pixbuf_for_app(app_id, icon_size)
+        if pixbuf is not None:
+            icon_child = Image(pixbuf=pixbuf)
+        else:
+            # Fallback to mapping glyph icon
+            glyph = self._resolve_icon_for_class(app_id) or "󰣆"
+            icon_child = text_icon(glyph, size=f"{max(12, min(20, icon_size))}px")
+
+        # Badge holder to apply glow; size ~ icon size to reduce square look
+        icon_badge = Box(
+            name="app-icon-badge",
+            h_align="center",
+            v_align="center",
+            children=[icon_child],
+        )
+        with contextlib.suppress(Exception):
+            icon_badge.set_size_request(icon_size, icon_size)
+        return icon_badge
+
+    @staticmethod
+    def _add_hover_highlight(btn: Button):
+        try:
+            btn.add_events(
+                Gdk.EventMask.ENTER_NOTIFY_MASK | Gdk.EventMask.LEAVE_NOTIFY_MASK
+            )
+            btn.connect(
+                "enter-notify-event",
+                lambda _w, _e, b=btn: (b.add_style_class("hover"), False)[1],
+            )
+            btn.connect(
+                "leave-notify-event",
+                lambda _w, _e, b=btn: (b.remove_style_class("hover"), False)[1],
+            )
+        except Exception:
+            ...
+
+    def _create_miniature(self, addr: str, target: dict) -> dict:
+        # Create window miniature as a button
+        btn = Button(
+            name="overview-client-box",
+            tooltip_text=target["title"],
+            child=self._build_icon(target["class"], target["icon_size"]),
+            on_clicked=lambda *_a, addr=addr: self._focus(addr),
+            on_button_press_event=(
+                lambda _w, event, addr=addr: self._maybe_close(event, addr)
+            ),
+        )
+        self._add_hover_highlight(btn)
+
+        # Ensure button has the desired miniature size
+        with contextlib.suppress(Exception):
+            btn.set_size_request(target["w"], target["h"])
+
+        # Put into the workspace fixed container
+        fixed = self._ws_fixed.get(target["ws"])
+        if fixed is not None:
+            fixed.put(btn, target["x"], target["y"])
+        with contextlib.suppress(Exception):
+            btn.show_all()
+
+        return {"btn": btn, **target}
+
+    def _update_miniature(self, item: dict, target: dict):
+        btn = item["btn"]
+        if item["ws"] != target["ws"]:
+            # Moved to another workspace: re-parent into its tile
+            old_fixed = self._ws_fixed.get(item["ws"])
+            if old_fixed is not None:
+                with contextlib.suppress(Exception):
+                    old_fixed.remove(btn)
+            fixed = self._ws_fixed.get(target["ws"])
+            if fixed is not None:
+                fixed.put(btn, target["x"], target["y"])
+        elif (item["x"], item["y"]) != (target["x"], target["y"]):
+            fixed = self._ws_fixed.get(target["ws"])
+            if fixed is not None:
+                fixed.move(btn, target["x"], target["y"])
+
+        if (item["w"], item["h"]) != (target["w"], target["h"]):
+            with contextlib.suppress(Exception):
+                btn.set_size_request(target["w"], target["h"])
+
+        # Icon lookups are the expensive part, redo them only when needed
+        if (item["class"], item["icon_size"]) != (
+            target["class"],
+            target["icon_size"],
+        ):
+            with contextlib.suppress(Exception):
+                old_child = btn.get_child()
+                if old_child is not None:
+                    btn.remove(old_child)
+                    old_child.destroy()
+                btn.add(self._build_icon(target["class"], target["icon_size"]))
+                btn.show_all()
+
+        if item["title"] != target["title"]:
+            with contextlib.suppress(Exception):
+                btn.set_tooltip_text(target["title"])
+
+        item.update(target)
+
+    def _create_placeholder(self, ws: int) -> Button:
+        # button filling the tile
+        ws_num_label = Label(
+            name="ws-number",
+            label=str(ws),
+            h_align="center",
+            v_align="center",
+        )
+        placeholder = Button(
+            name="overview-client-box",
+            tooltip_text=f"Switch to workspace {ws}",
+            child=ws_num_label,
+            on_clicked=lambda *_a, wid=ws: self._on_placeholder_clicked(wid),
+        )
+        self._add_hover_highlight(placeholder)
+
+        fixed = self._ws_fixed.get(ws)
+        if fixed is not None:
+            fixed.put(placeholder, 0, 0)
+        with contextlib.suppress(Exception):
+            placeholder.show_all()
+        return placeholder
+
+    def _destroy_miniature(self, item: dict):
+        self._destroy_widget(item["btn"], item["ws"])
+
+    def _destroy_widget(self, widget: Gtk.Widget, ws: int):
+        fixed = self._ws_fixed.get(ws)
+        with contextlib.suppress(Exception):
+            if fixed is not None:
+                fixed.remove(widget)
+            widget.destroy()
+
+    def _get_clients(self, state: dict | None = None) -> list[dict]:
         if self._wm == WindowManager.BSPWM and self._bspwm:
-            return self._get_clients_bspwm()
+            return self._get_clients_bspwm(state)
         return self._get_clients_hypr()
 
     def _get_clients_hypr(self) -> list[dict]:
@@ -491,8 +594,7 @@ class WorkspacesOverview(BaseDiWidget, Box):
                 ...
         return clients
 
-    def _get_clients_bspwm(self) -> list[dict]:
-        state = self._bspwm.get_state() if self._bspwm else None
+    def _get_clients_bspwm(self, state: dict | None) -> list[dict]:
         if not state:
             return []
 
@@ -581,20 +683,8 @@ class WorkspacesOverview(BaseDiWidget, Box):
                 self._hypr.send_command(f"/dispatch workspace {int(ws_id)}")
 
     def _resolve_icon_for_class(self, win_class: str) -> str | None:
-        # Try user-defined title_map first (same map as compact view)
-        try:
-            user_map = getattr(
-                cfg.modules.dynamic_island.compact.window_titles, "title_map", []
-            )
-        except Exception:
-            user_map = []
-        for pattern, icon, _title in [*user_map, *WINDOW_TITLE_MAP]:
-            try:
-                if re.search(pattern, win_class):
-                    return icon
-            except re.error:
-                continue
-        return None
+        # Same rules (user title_map first) as the compact view
+        return get_window_rules().icon_for(win_class)
 
     def _on_key_press(self, _widget, event):
         key = getattr(event, "keyval", None)
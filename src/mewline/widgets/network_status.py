@@ -34,7 +34,11 @@ class NetworkStatus(ButtonWidget):
         )
 
         # Автообновление
-        GLib.timeout_add_seconds(3, self._async_update_icon)
+        self._update_source_id = GLib.timeout_add_seconds(3, self._async_update_icon)
+        self.connect("destroy", self._on_destroy)
+
+    def _on_destroy(self, *_):
+        GLib.source_remove(self._update_source_id)
 
     def _set_loading_icon(self):
         """Устанавливает временную иконку загрузки."""
@@ -47,7 +51,8 @@ class NetworkStatus(ButtonWidget):
     def _async_update_icon(self):
         """Запускает асинхронное обновление иконки."""
         if self._update_lock.locked():
-            return False
+            # Skip this tick but keep polling
+            return True
 
         with self._update_lock:
             GLib.Thread.new(None, self._update_icon_thread)
@@ -1,7 +1,6 @@
 import subprocess
 import traceback
 
-import pytesseract
 from gi.repository import Gdk
 from gi.repository import Gtk
 from loguru import logger
@@ -153,6 +152,8 @@ class OCRWidget(ButtonWidget):
 
     def _extract_text_from_image(self):
         """Extract text from an image."""
+        import pytesseract
+
         path_to_img = cnst.APP_CACHE_DIRECTORY / "ocr.png"
 
         try:
@@ -231,6 +232,8 @@ class OCRWidget(ButtonWidget):
 
     @ttl_lru_cache(600, 10)
     def get_available_languages(self):
+        import pytesseract
+
         return pytesseract.get_languages()
 
     def get_combined_languages(self, available_langs):
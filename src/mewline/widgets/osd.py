@@ -1,8 +1,6 @@
-import time
 from typing import ClassVar
 from typing import Literal
 
-from fabric.utils import invoke_repeater
 from fabric.widgets.box import Box
 from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
@@ -11,8 +9,8 @@ from loguru import logger
 
 from mewline import constants as cnst
 from mewline.config import cfg
-from mewline.services import audio_service
-from mewline.services import brightness_service
+from mewline.services import get_service
+from mewline.utils.deadline_timer import DeadlineTimer
 from mewline.utils.misc import convert_to_percent
 from mewline.utils.widget_utils import create_scale
 from mewline.utils.widget_utils import get_audio_icon
@@ -49,11 +47,14 @@ class BrightnessOSDContainer(GenericOSDContainer):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.brightness_service = brightness_service
+        self.brightness_service = get_service("brightness")
         self.update_brightness()
 
         self.scale.connect("value-changed", lambda *_: self.update_brightness())
         self.brightness_service.connect("screen", self.on_brightness_changed)
+        self.brightness_service.connect(
+            "notify::available", lambda *_: self.update_brightness()
+        )
 
     def update_brightness(self):
         normalized_brightness = convert_to_percent(
@@ -84,7 +85,7 @@ class AudioOSDContainer(GenericOSDContainer):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.audio = audio_service
+        self.audio = get_service("audio")
         self.current_device = "speaker"  # Track which device we're showing
 
         self.sync_with_audio()
@@ -217,7 +218,7 @@ class OSDContainer:
             logger.error(f"Failed to create OSD window: {e}")
             raise
 
-        self.last_activity_time = time.time()
+        self.hide_timer = DeadlineTimer(self.timeout, self.start_hide_timer)
 
         self.audio_container.audio.connect("notify::speaker", self.show_audio)
         self.brightness_container.brightness_service.connect(
@@ -226,8 +227,6 @@ class OSDContainer:
         )
         self.audio_container.connect("volume-changed", self.show_audio)
 
-        invoke_repeater(100, self.check_inactivity, initial_call=True)
-
     def show_audio(self, *_):
         """Show audio OSD (defaults to speaker)."""
         self.show_box(box_to_show="audio")
@@ -262,9 +261,4 @@ class OSDContainer:
         self.window.set_visible(False)
 
     def reset_inactivity_timer(self):
-        self.last_activity_time = time.time()
-
-    def check_inactivity(self):
-        if time.time() - self.last_activity_time >= (self.timeout / 1000):
-            self.start_hide_timer()
-        return True
+        self.hide_timer.arm()
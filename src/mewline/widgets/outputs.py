@@ -0,0 +1,133 @@
+"""Per-output status bars and dynamic islands with monitor hot-plug support."""
+
+from fabric import Application
+from gi.repository import Gdk
+from gi.repository import GLib
+from loguru import logger
+
+from mewline.config import cfg
+from mewline.utils.hyprland_monitors import TOPOLOGY_EVENTS
+from mewline.utils.startup_profiler import profiler
+from mewline.utils.window_manager import WindowManagerContext
+from mewline.widgets import StatusBar
+from mewline.widgets.dynamic_island import DynamicIsland
+
+
+class OutputsManager:
+    """Keeps one StatusBar + DynamicIsland per configured output.
+
+    Outputs are identified by their GDK monitor index together with their
+    plug name, because GDK renumbers monitors when one is removed. On every
+    GDK (Wayland and X11/RandR) or Hyprland hot-plug event the configured
+    outputs are re-resolved and only the bars/islands of outputs that
+    appeared or vanished are created or destroyed. Services are shared
+    singletons, so new bars reuse them instead of starting new ones.
+
+    Args:
+        monitors: Monitor manager returned by `create_monitor_manager()`.
+        osd_widget: OSD container passed to each bar, if the OSD is enabled.
+    """
+
+    SYNC_DELAY_MS = 500
+
+    def __init__(self, monitors, osd_widget=None):
+        self.monitors = monitors
+        self.osd_widget = osd_widget
+        self.app: Application | None = None
+
+        self.bars: dict[int | None, StatusBar] = {}
+        self.islands: dict[int | None, DynamicIsland] = {}
+        self._plug_names: dict[int | None, str | None] = {}
+        self._sync_id = 0
+
+        self.sync()
+
+        display = Gdk.Display.get_default()
+        if display is not None:
+            display.connect("monitor-added", self.queue_sync)
+            display.connect("monitor-removed", self.queue_sync)
+        if WindowManagerContext.is_wayland():
+            for event in TOPOLOGY_EVENTS:
+                self.monitors.connect(f"event::{event}", self.queue_sync)
+
+    @property
+    def windows(self) -> list:
+        """All windows currently managed, bars first."""
+        return [*self.bars.values()] + [i.window for i in self.islands.values()]
+
+    def attach(self, app: Application):
+        """Register windows created by later hot-plug syncs with *app*."""
+        self.app = app
+
+    def queue_sync(self, *_):
+        """Schedule a sync, collapsing the burst of events of one hot-plug."""
+        if self._sync_id:
+            GLib.source_remove(self._sync_id)
+        self._sync_id = GLib.timeout_add(self.SYNC_DELAY_MS, self._on_sync_timeout)
+
+    def _on_sync_timeout(self) -> bool:
+        self._sync_id = 0
+        try:
+            self.sync()
+        except Exception as e:
+            logger.error(f"[OutputsManager] Failed to sync outputs: {e}")
+        return False
+
+    def _resolve_outputs(self) -> dict[int | None, str | None]:
+        monitor_ids = self.monitors.get_configured_gdk_monitor_ids(cfg)
+        screen = Gdk.Screen.get_default()
+        return {
+            mid: screen.get_monitor_plug_name(mid) if screen else None
+            for mid in monitor_ids
+        }
+
+    def sync(self):
+        """Create and destroy bars/islands to match the configured outputs."""
+        outputs = self._resolve_outputs()
+        if not outputs:
+            if self.islands:
+                # Transient state while outputs are being reconfigured
+                logger.debug("[OutputsManager] No outputs resolved, keeping bars")
+                return
+            # Fallback: let the compositor/WM decide (show on all outputs)
+            logger.warning(
+                "[monitors] Could not resolve any monitor IDs - "
+                "falling back to monitor=None (compositor/WM default)."
+            )
+            outputs = {None: None}
+
+        logger.info(f"[monitors] mode={cfg.monitors.mode!r}  outputs={outputs}")
+
+        for mid in list(self.islands):
+            if mid not in outputs or outputs[mid] != self._plug_names[mid]:
+                self._remove_output(mid)
+
+        for mid, plug_name in outputs.items():
+            if mid not in self.islands:
+                self._add_output(mid, plug_name)
+
+    def _add_output(self, mid: int | None, plug_name: str | None):
+        logger.info(f"[OutputsManager] Adding output {plug_name} (monitor {mid})")
+        with profiler.span(f"output {plug_name}"):
+            with profiler.span("StatusBar"):
+                bar = StatusBar(monitor=mid)
+            if self.osd_widget:
+                bar.set_osd_widget(self.osd_widget)
+            with profiler.span("DynamicIsland"):
+                island = DynamicIsland(monitor=mid)
+
+        self.bars[mid] = bar
+        self.islands[mid] = island
+        self._plug_names[mid] = plug_name
+
+        if self.app is not None:
+            self.app.add_window(bar)
+            self.app.add_window(island.window)
+
+    def _remove_output(self, mid: int | None):
+        logger.info(
+            f"[OutputsManager] Removing output {self._plug_names[mid]} (monitor {mid})"
+        )
+        del self._plug_names[mid]
+        self.islands.pop(mid).destroy()
+        self.bars.pop(mid).destroy()
@@ -23,7 +23,10 @@ class PowerButton(ButtonWidget):
 
         if self.config.tooltip:
             self._update_tooltip()
-            GLib.timeout_add_seconds(60, self._update_tooltip)
+            tooltip_source_id = GLib.timeout_add_seconds(60, self._update_tooltip)
+            self.connect(
+                "destroy", lambda *_: GLib.source_remove(tooltip_source_id)
+            )
 
         self.connect(
             "clicked",
@@ -13,6 +13,7 @@ from gi.repository import Gtk
 from mewline.config import cfg
 from mewline.shared.popover import Popover
 from mewline.shared.widget_container import ButtonWidget
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.widget_utils import text_icon
 
 gi.require_version("Gray", "0.1")
@@ -120,8 +121,9 @@ class SystemTray(ButtonWidget):
         # identifier -> (button, is_pinned)
         self._item_buttons: dict[str, tuple[Button, bool]] = {}
 
-        self.watcher.connect("item-added", self._on_item_added)
-        self.watcher.connect("item-removed", self._on_item_removed)
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self.watcher, "item-added", self._on_item_added)
+        self._handlers.connect(self.watcher, "item-removed", self._on_item_removed)
         self.connect("clicked", self._on_clicked)
 
         self.hide()
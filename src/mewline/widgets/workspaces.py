@@ -1,6 +1,4 @@
-import contextlib
 import subprocess
-import threading
 
 from fabric.hyprland.widgets import HyprlandWorkspaces
 from fabric.hyprland.widgets import WorkspaceButton
@@ -10,9 +8,11 @@ from gi.repository import Gdk
 from gi.repository import GLib
 
 from mewline.config import cfg
+from mewline.custom_fabric.bspwm import get_bspwm_state
 from mewline.shared.widget_container import BoxWidget
 from mewline.shared.widget_container import ButtonWidget
 from mewline.utils.misc import unique_list
+from mewline.utils.signal_handlers import SignalHandlers
 from mewline.utils.window_manager import WindowManager
 from mewline.utils.window_manager import detect_window_manager
 
@@ -113,6 +113,7 @@ class BspwmWorkspaceButton(ButtonWidget):
         self.workspace_id = workspace_id
         self._active = False
         self._occupied = False
+        self._urgent = False
 
         label = cfg.modules.workspaces.icon_map.get(
             str(workspace_id), str(workspace_id)
@@ -128,9 +129,10 @@ class BspwmWorkspaceButton(ButtonWidget):
     def _on_clicked(self, _):
         subprocess.run(["bspc", "desktop", "-f", str(self.workspace_id)])
 
-    def update_state(self, active: bool, occupied: bool):
+    def update_state(self, active: bool, occupied: bool, urgent: bool = False):
         self._active = active
         self._occupied = occupied
+        self._urgent = urgent
         self._sync_classes()
 
         ignored = unique_list(cfg.modules.workspaces.ignored)
@@ -147,6 +149,8 @@ class BspwmWorkspaceButton(ButtonWidget):
         ctx = self.get_style_context()
         for cls in ("active", "occupied", "urgent", "empty"):
             ctx.remove_class(cls)
+        if self._urgent and not self._active:
+            ctx.add_class("urgent")
         if self._active:
             ctx.add_class("active")
         elif self._occupied:
@@ -170,9 +174,10 @@ class BspwmWorkSpacesWidget(BoxWidget):
 
         self._buttons: dict[int, BspwmWorkspaceButton] = {}
 
-        GLib.idle_add(self._full_refresh)
-        thread = threading.Thread(target=self._subscribe_events, daemon=True)
-        thread.start()
+        self._state = get_bspwm_state()
+        self._handlers = SignalHandlers(self)
+        self._handlers.connect(self._state, "changed", lambda *_: self._refresh())
+        GLib.idle_add(self._refresh)
 
     def _on_scroll(self, _, event: Gdk.EventScroll):
         # Логика направления (UP -> next, DOWN -> prev, если не инвертировано)
@@ -189,75 +194,30 @@ class BspwmWorkSpacesWidget(BoxWidget):
 
         subprocess.run(["bspc", "desktop", "-f", selector])
 
-    def _subscribe_events(self):
-        try:
-            proc = subprocess.Popen(
-                [
-                    "bspc",
-                    "subscribe",
-                    "desktop_focus",
-                    "node_add",
-                    "node_remove",
-                    "node_transfer",
-                    "desktop_add",
-                    "desktop_remove",
-                ],
-                stdout=subprocess.PIPE,
-                text=True,
-            )
-            for _ in proc.stdout:
-                GLib.idle_add(self._full_refresh)
-        except Exception:
-            GLib.timeout_add(500, self._full_refresh)
-
-    def _full_refresh(self):
-        with contextlib.suppress(Exception):
-            desktop_ids = self._query_desktops()
-            focused_id = self._query_focused()
-            occupied_ids = self._query_occupied(desktop_ids)
-
-            for wid in desktop_ids:
-                if wid not in self._buttons:
-                    btn = BspwmWorkspaceButton(workspace_id=wid)
-                    self._buttons[wid] = btn
-                    self.workspace_container.add(btn)
-
-            for wid in list(self._buttons):
-                if wid not in desktop_ids:
-                    self.workspace_container.remove(self._buttons.pop(wid))
-
-            for wid, btn in self._buttons.items():
-                btn.update_state(
-                    active=(wid == focused_id), occupied=(wid in occupied_ids)
-                )
-
-    def _query_desktops(self) -> list[int]:
-        r = subprocess.run(
-            ["bspc", "query", "-D", "--names"], capture_output=True, text=True
-        )
-        return [int(n) for n in r.stdout.strip().split("\n") if n.strip().isdigit()]
-
-    def _query_focused(self) -> int | None:
-        r = subprocess.run(
-            ["bspc", "query", "-D", "-d", "focused", "--names"],
-            capture_output=True,
-            text=True,
-        )
-        with contextlib.suppress(ValueError):
-            return int(r.stdout.strip())
-        return None
-
-    def _query_occupied(self, desktop_ids: list[int]) -> set[int]:
-        occupied = set()
-        for wid in desktop_ids:
-            r = subprocess.run(
-                ["bspc", "query", "-N", "-d", str(wid), "-n", ".window"],
-                capture_output=True,
-                text=True,
+    def _refresh(self):
+        desktops = {}
+        for desktop in self._state.iter_desktops():
+            if desktop.name.isdigit():
+                desktops[int(desktop.name)] = desktop
+        focused = self._state.focused_desktop
+
+        for wid in desktops:
+            if wid not in self._buttons:
+                btn = BspwmWorkspaceButton(workspace_id=wid)
+                self._buttons[wid] = btn
+                self.workspace_container.add(btn)
+
+        for wid in list(self._buttons):
+            if wid not in desktops:
+                self.workspace_container.remove(self._buttons.pop(wid))
+
+        for wid, btn in self._buttons.items():
+            desktop = desktops[wid]
+            btn.update_state(
+                active=desktop is focused,
+                occupied=desktop.occupied,
+                urgent=desktop.urgent,
             )
-            if r.stdout.strip():
-                occupied.add(wid)
-        return occupied
 
 
 def create_workspaces_widget(**kwargs):
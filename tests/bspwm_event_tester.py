@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Тестовый скрипт для проверки событий bspwm.
 Запускает сервис, подписывается на события и генерирует их через bspc команды.
+С `--record PATH` сырые report-строки сохраняются для bspwm_report_benchmark.py.
 """  # noqa: D205
 
+import argparse
 import sys
 import time
+from pathlib import Path
 
 from gi.repository import GLib
 from loguru import logger
@@ -16,31 +19,31 @@ from mewline.custom_fabric.bspwm.service import BspwmEvent
 class BspwmEventTester:
     """Класс для тестирования событий bspwm."""
 
-    def __init__(self):
+    def __init__(self, record_path: Path | None = None):
         self.received_events = []
         self.connection = None
         self.test_desktop_name = "test_fabric_999"
+        self.record_path = record_path
 
     def on_report_event(self, service, event: BspwmEvent):
         """Обработчик события report."""
         logger.info(f"Event received: {event.name}")
         logger.info(f"   Raw data: {event.raw_data}")
-        logger.info(f"   Parsed monitors: {len(event.data.get('monitors', []))}")
+        logger.info(f"   Parsed monitors: {len(event.data.get('monitors', ()))}")
+        logger.info(f"   Changed desktops: {len(event.data.get('changed', ()))}")
 
-        for monitor in event.data.get("monitors", []):
-            logger.info(
-                f"   Monitor: {monitor['name']} (focused: {monitor['focused']})"
-            )
-            for desktop in monitor["desktops"]:
+        for monitor in event.data.get("monitors", ()):
+            logger.info(f"   Monitor: {monitor.name} (focused: {monitor.focused})")
+            for desktop in monitor.desktops:
                 status = []
-                if desktop["focused"]:
+                if desktop.focused:
                     status.append("FOCUSED")
-                if desktop["occupied"]:
+                if desktop.occupied:
                     status.append("OCCUPIED")
-                if desktop["urgent"]:
+                if desktop.urgent:
                     status.append("URGENT")
                 status_str = ", ".join(status) if status else "EMPTY"
-                logger.info(f"      Desktop: {desktop['name']} [{status_str}]")
+                logger.info(f"      Desktop: {desktop.name} [{status_str}]")
 
         self.received_events.append(event)
         logger.success(
@@ -237,6 +240,11 @@ class BspwmEventTester:
             for i, event in enumerate(self.received_events, 1):
                 logger.info(f"   {i}. {event.raw_data}")
 
+            if self.record_path:
+                with open(self.record_path, "a") as f:
+                    f.writelines(f"{e.raw_data}\n" for e in self.received_events)
+                logger.info(f"Raw reports recorded to {self.record_path}")
+
             logger.success("\nAll tests completed!")
             logger.info("\nPress Ctrl+C to exit...")
 
@@ -256,6 +264,14 @@ class BspwmEventTester:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="bspwm event tester")
+    parser.add_argument(
+        "--record",
+        type=Path,
+        help="Append the received raw report lines to this file",
+    )
+    args = parser.parse_args()
+
     logger.remove()
     logger.add(
         sys.stderr,
@@ -263,6 +279,6 @@ if __name__ == "__main__":
         level="DEBUG",
     )
 
-    tester = BspwmEventTester()
+    tester = BspwmEventTester(record_path=args.record)
     success = tester.run_all_tests()
     sys.exit(0 if success else 1)
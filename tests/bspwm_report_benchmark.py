@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the bspwm report parser.
+
+Replays report streams recorded with `bspwm_event_tester.py --record PATH`
+(one raw report per line). Without arguments a synthetic three-monitor
+stream is used.
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+from mewline.custom_fabric.bspwm.report import diff_reports
+from mewline.custom_fabric.bspwm.report import parse_report
+
+
+def synthetic_stream(count: int = 1000) -> list[str]:
+    """Build reports for three monitors with ten desktops in total."""
+    rng = random.Random(0)  # noqa: S311
+    layout = {"DP-1": range(1, 5), "DP-2": range(5, 9), "HDMI-1": range(9, 11)}
+    stream = []
+    for _ in range(count):
+        focused_monitor = rng.choice(list(layout))
+        items = []
+        for monitor, desktops in layout.items():
+            is_focused = monitor == focused_monitor
+            items.append(("M" if is_focused else "m") + monitor)
+            active = rng.choice(list(desktops))
+            for desktop in desktops:
+                occupied = rng.random() < 0.6
+                prefix = "o" if occupied else "f"
+                if rng.random() < 0.02:
+                    prefix = "u"
+                items.append(
+                    (prefix.upper() if desktop == active else prefix) + str(desktop)
+                )
+            items += [rng.choice(["LT", "LM"]), "TT", "G"]
+        stream.append("W" + ":".join(items))
+    return stream
+
+
+def load_streams(paths: list[Path]) -> list[str]:
+    lines = []
+    for path in paths:
+        with open(path) as f:
+            lines.extend(line.strip() for line in f if line.startswith("W"))
+    return lines
+
+
+def replay(stream: list[str]):
+    previous = ()
+    for raw in stream:
+        current = parse_report(raw)
+        diff_reports(previous, current)
+        previous = current
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("recordings", nargs="*", type=Path)
+    parser.add_argument("-n", "--number", type=int, default=20)
+    args = parser.parse_args()
+
+    stream = load_streams(args.recordings) if args.recordings else synthetic_stream()
+    if not stream:
+        print("No report lines found", file=sys.stderr)
+        return 1
+
+    for label, func in (
+        ("parse", lambda: [parse_report(raw) for raw in stream]),
+        ("parse+diff", lambda: replay(stream)),
+    ):
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        per_report = best / (args.number * len(stream)) * 1e6
+        print(f"{label:<12} {per_report:8.2f} µs/report ({len(stream)} reports)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("fabric")
+
+import numpy as np
+
+from mewline.services.audio_visualizer import CAPTURE_RATE
+from mewline.services.audio_visualizer import FFT_SIZE
+from mewline.services.audio_visualizer import band_edges
+from mewline.services.audio_visualizer import band_levels
+
+BAR_COUNT = 6
+
+
+def _levels(samples):
+    window = np.hanning(FFT_SIZE).astype(np.float32)
+    return band_levels(samples, window, band_edges(BAR_COUNT))
+
+
+def test_band_edges_are_increasing():
+    edges = band_edges(BAR_COUNT)
+    assert len(edges) == BAR_COUNT + 1
+    assert all(np.diff(edges) >= 1)
+
+
+def test_silence_produces_zeros():
+    levels = _levels(np.zeros(FFT_SIZE, dtype=np.float32))
+    assert levels.tolist() == [0.0] * BAR_COUNT
+
+
+@pytest.mark.parametrize("frequency", [100.0, 1000.0, 8000.0])
+def test_sine_lights_its_band(frequency):
+    t = np.arange(FFT_SIZE) / CAPTURE_RATE
+    levels = _levels(0.5 * np.sin(2 * np.pi * frequency * t))
+
+    edges = band_edges(BAR_COUNT)
+    frequency_bin = round(frequency * FFT_SIZE / CAPTURE_RATE)
+    expected = int(np.searchsorted(edges, frequency_bin, side="right")) - 1
+
+    assert int(np.argmax(levels)) == expected
+    assert levels[expected] > 0.5
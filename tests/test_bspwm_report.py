@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("fabric")
+
+from mewline.custom_fabric.bspwm.report import DesktopReport
+from mewline.custom_fabric.bspwm.report import diff_reports
+from mewline.custom_fabric.bspwm.report import parse_report
+
+REPORT = "WMDP-1:oI:OII:fIII:LT:TT:G:mHDMI-1:Fweb:uchat:LM:TF:GS"
+
+
+def test_parse_report_multi_monitor():
+    monitors = parse_report(REPORT)
+
+    assert [m.name for m in monitors] == ["DP-1", "HDMI-1"]
+    assert monitors[0].focused is True
+    assert monitors[1].focused is False
+    assert monitors[0].layout == "tiled"
+    assert monitors[1].layout == "monocle"
+    assert monitors[1].state == "F"
+    assert monitors[1].flags == "S"
+
+    assert monitors[0].desktops[1] == DesktopReport(
+        name="II",
+        monitor="DP-1",
+        focused=True,
+        occupied=True,
+        urgent=False,
+        monitor_focused=True,
+    )
+    chat = monitors[1].desktops[1]
+    assert chat.urgent and chat.occupied and not chat.focused
+    assert not chat.monitor_focused
+
+
+def test_parse_report_unfocused_first_monitor():
+    monitors = parse_report("WmDP-1:fI:MHDMI-1:Oweb")
+    assert monitors[0].focused is False
+    assert monitors[1].focused is True
+
+
+def test_parse_report_rejects_other_lines():
+    assert parse_report("node_focus 0x1 0x2 0x3") == ()
+
+
+def test_diff_reports():
+    previous = parse_report(REPORT)
+    current = parse_report(
+        "WMDP-1:OI:oII:fIII:LT:TT:G:mHDMI-1:Fweb:LM:TF:GS:mDP-2:fnew"
+    )
+
+    diff = diff_reports(previous, current)
+
+    assert [d.name for d in diff.changed] == ["I", "II", "new"]
+    assert [d.name for d in diff.removed] == ["chat"]
+    assert diff_reports(current, current) == ((), ())
@@ -0,0 +1,42 @@
+import re
+
+import pytest
+
+pytest.importorskip("fabric")
+
+from mewline.constants import WINDOW_TITLE_MAP
+from mewline.utils.window_rules import WindowRules
+
+SAMPLES = ["firefox", "", "code-oss", "org.telegram.desktop", "kitty", "zzz"]
+
+
+def _first_match(rules, value):
+    return next((r for r in rules if re.search(r[0], value)), None)
+
+
+def test_matches_like_a_linear_scan():
+    rules = WindowRules(WINDOW_TITLE_MAP)
+    for value in SAMPLES:
+        expected = _first_match(WINDOW_TITLE_MAP, value)
+        matched = rules.match(value)
+        assert (tuple(matched) if matched else None) == (
+            tuple(expected) if expected else None
+        )
+
+
+def test_rule_order_wins_over_match_position():
+    rules = WindowRules([["fox$", "A", "Fox"], ["^fire", "B", "Fire"]])
+    assert rules.match("firefox").title == "Fox"
+
+
+def test_invalid_patterns_are_skipped():
+    rules = WindowRules([["(", "X", "Broken"], ["kitty", "K", "Kitty"]])
+    assert rules.icon_for("kitty") == "K"
+    assert rules.icon_for("zzz", "?") == "?"
+
+
+def test_reload_drops_cached_results():
+    rules = WindowRules([["kitty", "K", "Kitty"]])
+    assert rules.match("kitty").icon == "K"
+    rules.reload([["kitty", "N", "New"]])
+    assert rules.match("kitty").icon == "N"